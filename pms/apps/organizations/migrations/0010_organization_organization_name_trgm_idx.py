@@ -0,0 +1,39 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:25
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['organization_name'], name='organization_name_trgm_idx', opclasses=['gin_trgm_ops'])
+
+
+def add_trigram_index(apps, schema_editor):
+    # Trigram indexes only exist on PostgreSQL. Other databases (e.g. SQLite in
+    # tests) search without them.
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.add_index(apps.get_model('organizations', 'Organization'), INDEX)
+
+
+def remove_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.remove_index(apps.get_model('organizations', 'Organization'), INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0009_organizationmember_role'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(add_trigram_index, remove_trigram_index),
+            ],
+            state_operations=[
+                migrations.AddIndex(model_name='organization', index=INDEX),
+            ],
+        ),
+    ]
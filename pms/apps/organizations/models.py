@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth.hashers import make_password, check_password
 from apps.users.models import User
@@ -22,6 +23,13 @@ class Organization(models.Model):
     organization_password = models.CharField(
         max_length=255, verbose_name='Organization password')
 
+    class Meta:
+        indexes = [
+            # Trigram index used to search organizations by name.
+            GinIndex(fields=['organization_name'], opclasses=['gin_trgm_ops'],
+                     name='organization_name_trgm_idx'),
+        ]
+
     def set_organization_password(self, password: str) -> None:
         """
         Validates a plain text password. If the password passes validation, it's hashed 
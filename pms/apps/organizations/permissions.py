@@ -0,0 +1,19 @@
+from rest_framework import permissions
+
+from apps.organizations.models import Organization, OrganizationMember
+from apps.organizations.utils import get_organization_role
+
+
+class IsOrgAdmin(permissions.BasePermission):
+    """
+    Allows access only to administrators of the organization the object belongs to.
+
+    The object may be an `Organization` or any model with an `organization` foreign key.
+    """
+    message = 'You dont have the necessary permissions to perform this action'
+
+    def has_object_permission(self, request, view, obj) -> bool:
+        organization_id = obj.pk if isinstance(
+            obj, Organization) else obj.organization_id
+
+        return get_organization_role(request, organization_id) == OrganizationMember.ADMIN
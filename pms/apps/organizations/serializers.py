@@ -1,6 +1,7 @@
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
+from pms.slugs import save_with_unique_slug
 from .models import Organization, OrganizationMember
 from .utils import slugify_organization_name
 
@@ -45,11 +46,12 @@ class OrganizationCreationSerializer(serializers.ModelSerializer):
 
         validated_data = {
             **self.validated_data,
-            'organization_name_slug': slugify_organization_name(self.validated_data['organization_name']),
             'organization_password': make_password(self.validated_data['organization_password'])
         }
 
-        organization = Organization.objects.create(**validated_data)
+        organization = save_with_unique_slug(
+            lambda: slugify_organization_name(validated_data['organization_name']),
+            lambda slug: Organization.objects.create(**validated_data, organization_name_slug=slug))
 
         OrganizationMember.objects.create(
             organization=organization,
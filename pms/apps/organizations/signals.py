@@ -0,0 +1,19 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.organizations.models import Organization, OrganizationMember
+from apps.organizations.utils import (
+    bump_organization_version, organization_cache, invalidate_organization_roles)
+
+
+@receiver(post_save, sender=OrganizationMember)
+@receiver(post_delete, sender=OrganizationMember)
+def invalidate_organization_role(sender, instance: OrganizationMember, **kwargs):
+    invalidate_organization_roles(instance.organization_id, [instance.user_id])
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+def invalidate_cached_organization(sender, instance: Organization, **kwargs):
+    organization_cache.delete(instance.organization_name_slug)
+    bump_organization_version(instance.pk)
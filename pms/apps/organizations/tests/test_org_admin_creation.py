@@ -1,8 +1,10 @@
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 
 from apps.organizations.models import OrganizationMember
+from apps.organizations.utils import organization_role_cache_key
 from apps.users.models import User
 
 
@@ -60,3 +62,41 @@ class TestOrgAdminCreation(APITestCase):
         response = self.client.post(self.url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_members_are_promoted_and_demoted_in_one_call(self):
+        response = self.client.post(
+            self.url, {'promote': [self.user2.username], 'demote': [self.user.username]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['promoted'], [self.user2.username])
+        self.assertEqual(response.data['demoted'], [self.user.username])
+
+        roles = dict(OrganizationMember.objects.values_list('user__username', 'role'))
+        self.assertEqual(roles, {self.user.username: OrganizationMember.MEMBER,
+                                 self.user2.username: OrganizationMember.ADMIN})
+
+        # the cached role of the demoted admin is invalidated.
+        response = self.client.post(
+            self.url, {'promote': [self.user.username]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_last_admin_cant_be_demoted(self):
+        response = self.client.post(
+            self.url, {'demote': [self.user.username]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(OrganizationMember.objects.get(
+            user=self.user).role, OrganizationMember.ADMIN)
+
+    def test_role_cached_before_commit_is_removed_on_commit(self):
+        key = organization_role_cache_key(self.org_res.data['organization_id'], self.user.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url, {'promote': [self.user2.username], 'demote': [self.user.username]}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            # another request reads the old role before the demotion commits.
+            cache.set(key, OrganizationMember.ADMIN)
+
+        self.assertIsNone(cache.get(key))
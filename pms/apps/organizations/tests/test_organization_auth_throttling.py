@@ -0,0 +1,104 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.organizations.models import Organization
+from apps.organizations.views import org_auth
+from apps.users.models import User
+from pms import throttling
+
+rates = {
+    'organization_auth_user': '2/min',
+    'organization_auth_ip': '10/min',
+    'organization_auth_organization': '3/min',
+}
+
+
+@override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK,
+                                   'DEFAULT_THROTTLE_RATES': rates})
+class OrganizationAuthThrottlingTests(APITestCase):
+    """
+    Tests for throttling the attempts to join an organization with its password.
+    """
+
+    def setUp(self):
+        # start with full buckets and no counts.
+        cache.clear()
+        throttling.reset_throttle_counters()
+
+        ####################################
+        # create a user and an organization.
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        Organization.objects.create(
+            organization_name='Test org', organization_name_slug='test-org',
+            organization_password='securepassword123')
+
+        self.url = reverse('organization_auth')
+        self.wrong_password = {'password': 'wrongpassword123',
+                               'organizationName': 'Test org'}
+
+    def test_user_attempts_are_throttled(self):
+        for _ in range(2):
+            response = self.client.post(self.url, self.wrong_password, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        with mock.patch.object(org_auth, 'check_password') as check_password:
+            response = self.client.post(self.url, self.wrong_password, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+        # the password isn't checked once throttled.
+        check_password.assert_not_called()
+
+    def test_organization_attempts_are_throttled_across_users(self):
+        for i in range(4):
+            user = User.objects.create_user(
+                username=f'user{i}', email=f'user{i}@test.com', password='securepassword123'
+            )
+            client = APIClient()
+            client.force_authenticate(user=user)
+
+            response = client.post(self.url, self.wrong_password, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        # other organizations can still be joined.
+        response = self.client.post(self.url, {'password': 'wrongpassword123',
+                                               'organizationName': 'Other org'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(CACHES={'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_buckets_are_refilled(self):
+        # Redis buckets use the server's clock, so use the local buckets.
+        now = 1000.0
+
+        with mock.patch.object(throttling.time, 'time', return_value=now):
+            for _ in range(3):
+                response = self.client.post(self.url, self.wrong_password, format='json')
+            self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        # the user's bucket gets a token back every 30 seconds.
+        with mock.patch.object(throttling.time, 'time', return_value=now + 30):
+            response = self.client.post(self.url, self.wrong_password, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_attempts_are_counted(self):
+        for _ in range(3):
+            self.client.post(self.url, self.wrong_password, format='json')
+
+        counters = throttling.get_throttle_counters()
+
+        self.assertEqual(counters['organization_auth_user:allowed'], 2)
+        self.assertEqual(counters['organization_auth_user:rejected'], 1)
+        self.assertEqual(counters['organization_auth_organization:allowed'], 3)
@@ -0,0 +1,54 @@
+import time
+
+from django.test import TestCase, override_settings
+
+from pms import tiered_cache
+from pms.pubsub import get_redis_client
+from apps.organizations.utils import organization_cache
+
+# The cache of `pms.settings`, which the tests run against in CI.
+REDIS_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://cache:6379',
+    }
+}
+
+
+def is_redis_available() -> bool:
+    try:
+        return get_redis_client().ping()
+    except Exception:
+        return False
+
+
+@override_settings(CACHES=REDIS_CACHES)
+class OrganizationCacheRedisTests(TestCase):
+    """
+    Tests for broadcasting the invalidation of cached organizations to
+    every process through Redis.
+    """
+
+    def test_redis_client_is_returned_for_redis_cache(self):
+        # creating the client doesn't connect to Redis.
+        self.assertIsNotNone(get_redis_client())
+
+    def test_invalidations_are_broadcast(self):
+        if not is_redis_available():
+            self.skipTest('Redis is not available.')
+
+        key = organization_cache.make_key('broadcast-test')
+        tiered_cache._start_listener()
+
+        # stands for an entry of this process invalidated by another one,
+        # which is retried until the listener has subscribed.
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            organization_cache.local.set(key, b'')
+            tiered_cache._publish(organization_cache.name, [key])
+            time.sleep(0.1)
+
+            if organization_cache.local.get(key) is tiered_cache._MISSING:
+                break
+
+        self.assertIs(organization_cache.local.get(key), tiered_cache._MISSING)
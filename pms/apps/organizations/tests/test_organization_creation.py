@@ -75,3 +75,18 @@ class TestOrganizationCreation(APITestCase):
         response = self.client.post(self.url, self.organization, format='json')
         self.assertEqual(response.status_code, 400)
         self.assertIn('organization_name', response.data)
+
+    def test_organizations_with_same_slug_get_a_suffix(self):
+        """
+        Test that organizations whose names slugify to the same slug get
+        the next free suffix, and that similar slugs are not mistaken for collisions.
+        """
+        slugs = []
+        for name in ['Test org', 'Test-org', 'Test org!', 'Test organization']:
+            response = self.client.post(
+                self.url, {**self.organization, 'organization_name': name}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            slugs.append(response.data['organization_name_slug'])
+
+        self.assertEqual(
+            slugs, ['test-org', 'test-org-1', 'test-org-2', 'test-organization'])
@@ -1,8 +1,13 @@
+import pickle
+import datetime
+
 from django.urls import reverse
 from django.utils.text import slugify
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from apps.users.models import User
+from apps.organizations.models import Organization
+from apps.organizations.utils import organization_cache
 
 
 class TestOrganizationDetailRetreival(APITestCase):
@@ -62,3 +67,84 @@ class TestOrganizationDetailRetreival(APITestCase):
 
         response = client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_repeated_retrieval_uses_cached_organization(self):
+        """
+        Tests that the organization and the user's role are not queried
+        again once cached; only the projects are.
+        """
+        self.client.get(self.url)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_organization_password_is_not_cached(self):
+        """
+        Tests that the password hash of a cached organization is not stored
+        in the cache.
+        """
+        self.client.get(self.url)
+
+        slug = self.organization.data['organization_name_slug']
+        password = Organization.objects.get(organization_name_slug=slug).organization_password
+        cached = organization_cache.get_or_set(slug, lambda: None)
+
+        self.assertNotIn(password.encode(), pickle.dumps(cached))
+
+        # it is loaded from the database when used.
+        self.assertEqual(cached.organization_password, password)
+
+    def test_organization_changes_invalidate_cached_organization(self):
+        """
+        Tests that changes to an organization are visible right away.
+        """
+        self.client.get(self.url)
+
+        organization = Organization.objects.get(
+            organization_name_slug=self.organization.data['organization_name_slug'])
+        organization.organization_name = 'Renamed org'
+        organization.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data['organization_name'], 'Renamed org')
+
+    def test_unchanged_organization_detail_is_not_sent_again(self):
+        """
+        Tests that a member holding the current detail gets a 304 response
+        without the projects being queried, until a project is added.
+        """
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        project_data = {
+            'organization': self.organization.data['organization_id'],
+            'project_name': 'test project',
+            'description': 'project description',
+            'deadline': f'{datetime.date.today() + datetime.timedelta(days=1)}'
+        }
+        self.client.post(reverse('create_project'), project_data, format='json')
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['projects']), 1)
+
+    def test_non_members_dont_get_not_modified_responses(self):
+        """
+        Tests that the ETag check is only made once membership is checked.
+        """
+        etag = self.client.get(self.url)['ETag']
+
+        user = User.objects.create_user(
+            username='nonmember', email='nonmembermail@test.com', password='securepassword123'
+        )
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
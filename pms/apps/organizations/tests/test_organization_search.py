@@ -2,6 +2,8 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from apps.users.models import User
+from apps.organizations.models import Organization
+from pms.search import SEARCH_LIMIT
 from rest_framework.utils.serializer_helpers import ReturnList
 
 
@@ -48,3 +50,31 @@ class OrganizationSearchTest(APITestCase):
         self.assertIsInstance(response.data, ReturnList)
         self.assertEqual(
             response.data[0]['organization_id'], self.organization['organization_id'])
+
+    def test_organizations_starting_with_the_search_term_come_first(self):
+        """
+        Tests that prefix matches are ranked before other matches.
+        """
+        Organization.objects.create(organization_name='Acme builders',
+                                    organization_name_slug='acme-builders')
+        Organization.objects.create(organization_name='Builders united',
+                                    organization_name_slug='builders-united')
+
+        response = self.client.get(self.url, {'name': 'builders'})
+
+        self.assertEqual([org['organization_name'] for org in response.data],
+                         ['Builders united', 'Acme builders'])
+
+    def test_search_results_are_limited(self):
+        """
+        Tests that a search returns at most `SEARCH_LIMIT` organizations.
+        """
+        Organization.objects.bulk_create([
+            Organization(organization_name=f'Test org {i}',
+                         organization_name_slug=f'test-org-{i}')
+            for i in range(SEARCH_LIMIT + 5)
+        ])
+
+        response = self.client.get(self.url, {'name': 'Test'})
+
+        self.assertEqual(len(response.data), SEARCH_LIMIT)
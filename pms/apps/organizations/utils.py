@@ -1,16 +1,88 @@
-from django.utils.text import slugify
-from .models import Organization
+from typing import Iterable, Optional
+
+from rest_framework.request import Request
+
+from pms.roles import get_cached_role, invalidate_cached_roles
+from pms.slugs import allocate_slug
+from pms.tiered_cache import TieredCache
+from pms.versions import bump_version, get_version
+from .models import Organization, OrganizationMember
 
 
 def slugify_organization_name(organization_name: str) -> str:
     """
     Slugify the organization name and ensure it is unique.
     """
-    organization_name_slug = slugify(organization_name)
+    return allocate_slug(Organization.objects.all(), 'organization_name_slug', organization_name)
+
+
+# Organizations are looked up by slug on every page of an organization, but
+# rarely change, so they are cached in each process as well as in Redis.
+organization_cache = TieredCache('organization-by-slug')
+
 
-    counter = 1
-    while Organization.objects.filter(organization_name_slug=organization_name_slug).exists():
-        organization_name_slug = f"{organization_name_slug}-{counter}"
-        counter += 1
+def get_organization_by_slug(organization_name_slug: str) -> Organization:
+    """
+    Get an organization by its slug.
+
+    The password hash of the organization is not cached: it is deferred and
+    loaded from the database if it is used.
+
+    Raises `Organization.DoesNotExist` if there is no such organization.
+    """
+    return organization_cache.get_or_set(
+        organization_name_slug,
+        lambda: Organization.objects.defer('organization_password').get(
+            organization_name_slug=organization_name_slug))
 
-    return organization_name_slug
+
+def organization_version_key(organization_id) -> str:
+    return f'organization-version:{organization_id}'
+
+
+def get_organization_version(organization_id) -> int:
+    """
+    Get the current version of an organization's detail (the organization and its projects).
+    """
+    return get_version(organization_version_key(organization_id))
+
+
+def bump_organization_version(organization_id) -> None:
+    """
+    Mark the detail of an organization as outdated.
+    """
+    bump_version(organization_version_key(organization_id))
+
+
+def organization_role_cache_key(organization_id, user_id) -> str:
+    return f'organization-role:{organization_id}:{user_id}'
+
+
+def get_organization_role(request: Request, organization_id) -> Optional[str]:
+    """
+    Retrieves the role of the requesting user in an organization.
+
+    The role is memoized for the duration of the request and cached
+    across requests. It returns None if the user is not a member of the organization.
+    """
+    user = request.user
+
+    if not user.is_authenticated:
+        return None
+
+    def load_role():
+        return OrganizationMember.objects.filter(
+            organization_id=organization_id, user=user).values_list('role', flat=True).first()
+
+    return get_cached_role(request, organization_role_cache_key(organization_id, user.pk), load_role)
+
+
+def invalidate_organization_roles(organization_id, user_ids: Iterable) -> None:
+    """
+    Remove the cached roles of users in an organization.
+
+    Membership changes made without `save()`/`delete()` (e.g. `bulk_create`
+    or `update()`) don't send signals and must call this explicitly.
+    """
+    invalidate_cached_roles(organization_role_cache_key(organization_id, user_id)
+                            for user_id in user_ids)
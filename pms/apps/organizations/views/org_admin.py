@@ -1,11 +1,15 @@
+from django.db import transaction
 from rest_framework.request import Request
 from rest_framework import status, generics
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError
 
 from apps.users.serializers import UserRetrievalSerializer
 from apps.users.models import User
 from apps.organizations.models import Organization, OrganizationMember
+from apps.organizations.permissions import IsOrgAdmin
+from apps.organizations.utils import get_organization_role, invalidate_organization_roles
 
 
 class OrganizationAdminsListView(generics.ListAPIView):
@@ -52,43 +56,67 @@ class NonOrganizationAdminsListView(generics.ListAPIView):
 class OrganizationAdminCreateView(generics.ListCreateAPIView):
     """
     Assigns members administration privilleges for an organization.
+
+    The request may promote (`promote`, or `members`) and demote (`demote`)
+    members in one call. Both lists hold usernames. Each list is applied
+    with a single update, and the changes are rejected if they would leave
+    the organization without an administrator.
     """
+    permission_classes = [IsAuthenticated, IsOrgAdmin]
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         organization_id = kwargs.get('organization_id')
-        members: list[str] = request.data.get('members')
+        promote: list[str] = request.data.get(
+            'promote') or request.data.get('members') or []
+        demote: list[str] = request.data.get('demote') or []
 
-        if not members:
+        if not promote and not demote:
             return Response({'detail': 'No organization members to be added were provided'},
                             status=status.HTTP_400_BAD_REQUEST)
 
+        if set(promote) & set(demote):
+            return Response({'detail': 'A member cannot be both promoted and demoted.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
         try:
             organization = Organization.objects.get(pk=organization_id)
         except Organization.DoesNotExist:
             return Response({'detail': 'No organization matches the given query'},
                             status=status.HTTP_404_NOT_FOUND)
 
-        try:
-            membership = OrganizationMember.objects.get(
-                organization=organization, user=self.request.user)
-        except OrganizationMember.DoesNotExist:
-            return Response({'detail': 'You dont have the necessary permissions to perform this action'},
-                            status=status.HTTP_403_FORBIDDEN)
+        self.check_object_permissions(request, organization)
+
+        members = OrganizationMember.objects.filter(organization=organization)
+
+        with transaction.atomic():
+            # lock the administrators so that concurrent demotions can't
+            # leave the organization without one.
+            admins = dict(members.select_for_update(of=('self',)).filter(
+                role=OrganizationMember.ADMIN).values_list('user__username', 'user_id'))
+
+            demoted = {username: admins[username]
+                       for username in demote if username in admins}
+            promoted = dict(members.filter(user__username__in=promote).exclude(
+                role=OrganizationMember.ADMIN).values_list('user__username', 'user_id'))
 
-        if membership.role != 'Admin':
-            return Response({'detail': 'You dont have the necessary permissions to perform this action'},
-                            status=status.HTTP_403_FORBIDDEN)
+            if len(admins) + len(promoted) - len(demoted) < 1:
+                return Response({'detail': 'An organization must have at least one administrator.'},
+                                status=status.HTTP_400_BAD_REQUEST)
 
-        users = User.objects.filter(username__in=members)
+            if promoted:
+                members.filter(user_id__in=promoted.values()).update(
+                    role=OrganizationMember.ADMIN)
 
-        org_members = OrganizationMember.objects.filter(
-            organization=organization, user__in=users)
+            if demoted:
+                members.filter(user_id__in=demoted.values()).update(
+                    role=OrganizationMember.MEMBER)
 
-        for member in org_members:
-            member.role = 'Admin'
-            member.save()
+            # update() doesn't send signals.
+            invalidate_organization_roles(
+                organization.pk, [*promoted.values(), *demoted.values()])
 
-        return Response(status=status.HTTP_200_OK)
+        return Response({'promoted': list(promoted), 'demoted': list(demoted)},
+                        status=status.HTTP_200_OK)
 
 
 class OrganizationAdminRoleRevokeView(generics.UpdateAPIView):
@@ -150,8 +178,7 @@ class OrganizationAdminRoleRevokeView(generics.UpdateAPIView):
         """
         Check if the user is an admin of the organization
         """
-        return OrganizationMember.objects.filter(
-            organization=organization, user=user, role=OrganizationMember.ADMIN).exists()
+        return get_organization_role(self.request, organization.pk) == OrganizationMember.ADMIN
 
     def remove_admin_role(self, organization, admin_user):
         try:
@@ -5,6 +5,8 @@ from rest_framework import status, generics
 from rest_framework.response import Response
 
 from apps.organizations import models
+from pms.throttling import (
+    IPTokenBucketThrottle, OrganizationTokenBucketThrottle, UserTokenBucketThrottle)
 
 
 class OrganizationAuthView(generics.CreateAPIView):
@@ -19,7 +21,12 @@ class OrganizationAuthView(generics.CreateAPIView):
         - 201 Created: If the user is successfully added as an `OrganizationMember`.
         - 400 Bad Request: If the credentials are invalid (either the organization doesn't exist, 
           the password is incorrect, or the password is missing).
+        - 429 Too Many Requests: If the user, their IP address or the organization
+          made too many attempts.
     """
+    throttle_scope = 'organization_auth'
+    throttle_classes = [UserTokenBucketThrottle,
+                        IPTokenBucketThrottle, OrganizationTokenBucketThrottle]
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         organization_name = request.data.get('organizationName')
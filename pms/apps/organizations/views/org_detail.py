@@ -2,8 +2,11 @@ from rest_framework import status, generics
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from pms.conditional import make_etag, not_modified, set_etag
 from apps.projects.serializers import ProjectRetrievalSerializer
-from apps.organizations.models import Organization, OrganizationMember
+from apps.organizations.models import Organization
+from apps.organizations.utils import (
+    get_organization_by_slug, get_organization_role, get_organization_version)
 from apps.organizations import serializers
 
 
@@ -16,21 +19,26 @@ class OrganizationDetailView(generics.RetrieveAPIView):
         organization_name_slug = kwargs.get('organization_name_slug')
 
         try:
-            organization = Organization.objects.get(
-                organization_name_slug=organization_name_slug)
+            organization = get_organization_by_slug(organization_name_slug)
         except Organization.DoesNotExist:
             return Response({'detail': 'Organization not found'}, status=status.HTTP_404_NOT_FOUND)
 
         # Only allow members of the organization to view the detail.
-        try:
-            membership = OrganizationMember.objects.get(
-                organization=organization, user=self.request.user)
-        except OrganizationMember.DoesNotExist:
+        role = get_organization_role(request, organization.pk)
+
+        if role is None:
             return Response({
                 "error": "You are unauthorized to view this organization",
                 "organization_name": organization.organization_name
             }, status=status.HTTP_403_FORBIDDEN)
 
+        etag = make_etag('organization', organization.pk,
+                         get_organization_version(organization.pk), role)
+
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
         organization_serializer = serializers.OrganizationRetrievalSerializer(
             organization)
 
@@ -39,7 +47,7 @@ class OrganizationDetailView(generics.RetrieveAPIView):
 
         organization_detail = organization_serializer.data
         organization_detail['projects'] = project_serializer.data
-        organization_detail['role'] = membership.role
+        organization_detail['role'] = role
 
-        return Response(
-            organization_detail, status=status.HTTP_200_OK)
+        return set_etag(Response(
+            organization_detail, status=status.HTTP_200_OK), etag)
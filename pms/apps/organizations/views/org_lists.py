@@ -1,5 +1,6 @@
 from rest_framework import generics
 
+from pms.search import ranked_search
 from apps.organizations.models import Organization, OrganizationMember
 from apps.organizations import serializers
 
@@ -7,6 +8,8 @@ from apps.organizations import serializers
 class OrganizationSearchView(generics.ListAPIView):
     """
     Search for organizations by name.
+
+    Returns at most `SEARCH_LIMIT` organizations, best matches first.
     """
 
     serializer_class = serializers.OrganizationRetrievalSerializer
@@ -19,8 +22,7 @@ class OrganizationSearchView(generics.ListAPIView):
         if not name:
             return []
 
-        return Organization.objects.filter(
-            organization_name__icontains=name)
+        return ranked_search(Organization.objects.all(), 'organization_name', name)
 
 
 class UserOrganizationListView(generics.ListAPIView):
@@ -1,6 +1,7 @@
 from django.contrib import admin
 from .models import (Industry, Template, TemplatePhase,
-                     Project, ProjectMember, ProjectPhase)
+                     Project, ProjectMember, ProjectPhase,
+                     ProjectStats, ProjectPhaseStats)
 
 # Register your models here.
 
@@ -10,3 +11,5 @@ admin.site.register(TemplatePhase)
 admin.site.register(Project)
 admin.site.register(ProjectMember)
 admin.site.register(ProjectPhase)
+admin.site.register(ProjectStats)
+admin.site.register(ProjectPhaseStats)
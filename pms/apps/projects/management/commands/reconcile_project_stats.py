@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.projects import models
+from apps.projects.utils.stats import refresh_project_stats
+from apps.projects.utils.versions import bump_project_version
+
+
+class Command(BaseCommand):
+    """
+    Recompute the denormalized task and member counters of projects
+    and their phases from the actual rows.
+    """
+    help = "Recompute the task and member counters of projects and their phases."
+
+    def add_arguments(self, parser):
+        parser.add_argument('project_ids', nargs='*',
+                            help='Ids of the projects to reconcile. Defaults to all projects.')
+
+    def handle(self, *args, **options):
+        projects = models.Project.objects.all()
+
+        if options['project_ids']:
+            projects = projects.filter(pk__in=options['project_ids'])
+
+        reconciled = 0
+        for project in projects.iterator():
+            with transaction.atomic():
+                # Lock the counters so that concurrent updates are not overwritten.
+                list(models.ProjectStats.objects.select_for_update().filter(project=project))
+                refresh_project_stats(project)
+                bump_project_version(project.pk)
+            reconciled += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Reconciled the stats of {reconciled} project(s).'))
@@ -0,0 +1,82 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def count_tasks(tasks, group_by):
+    """
+    Count the tasks of each project/phase, keyed by the `group_by` field.
+    """
+    rows = tasks.values(group_by).annotate(
+        tasks=Count('pk'),
+        tasks_in_progress=Count('pk', filter=Q(status='IN_PROGRESS')),
+        tasks_on_hold=Count('pk', filter=Q(status='ON_HOLD')),
+        tasks_done=Count('pk', filter=Q(status='DONE')),
+    )
+    return {row.pop(group_by): row for row in rows}
+
+
+def backfill_stats(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    ProjectPhase = apps.get_model('projects', 'ProjectPhase')
+    ProjectMember = apps.get_model('projects', 'ProjectMember')
+    ProjectStats = apps.get_model('projects', 'ProjectStats')
+    ProjectPhaseStats = apps.get_model('projects', 'ProjectPhaseStats')
+    Task = apps.get_model('tasks', 'Task')
+
+    project_tasks = count_tasks(Task.objects.all(), 'project_id')
+    phase_tasks = count_tasks(Task.objects.all(), 'project_phase_id')
+    members = dict(ProjectMember.objects.values('project_id').annotate(
+        members=Count('pk')).values_list('project_id', 'members'))
+
+    ProjectStats.objects.bulk_create([
+        ProjectStats(project_id=project_id, members=members.get(project_id, 0),
+                     **project_tasks.get(project_id, {}))
+        for project_id in Project.objects.values_list('pk', flat=True)
+    ], batch_size=1000)
+
+    ProjectPhaseStats.objects.bulk_create([
+        ProjectPhaseStats(phase_id=phase_id, **phase_tasks.get(phase_id, {}))
+        for phase_id in ProjectPhase.objects.values_list('pk', flat=True)
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0027_delete_customphase'),
+        ('tasks', '0013_task_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectPhaseStats',
+            fields=[
+                ('phase', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='projects.projectphase', verbose_name='Project phase')),
+                ('tasks', models.IntegerField(default=0, verbose_name='Tasks')),
+                ('tasks_in_progress', models.IntegerField(default=0, verbose_name='Tasks in progress')),
+                ('tasks_on_hold', models.IntegerField(default=0, verbose_name='Tasks on hold')),
+                ('tasks_done', models.IntegerField(default=0, verbose_name='Tasks done')),
+            ],
+            options={
+                'verbose_name_plural': 'Project phase stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectStats',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='projects.project', verbose_name='Project')),
+                ('tasks', models.IntegerField(default=0, verbose_name='Tasks')),
+                ('tasks_in_progress', models.IntegerField(default=0, verbose_name='Tasks in progress')),
+                ('tasks_on_hold', models.IntegerField(default=0, verbose_name='Tasks on hold')),
+                ('tasks_done', models.IntegerField(default=0, verbose_name='Tasks done')),
+                ('members', models.IntegerField(default=0, verbose_name='Members')),
+            ],
+            options={
+                'verbose_name_plural': 'Project stats',
+            },
+        ),
+        migrations.RunPython(backfill_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:26
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_workflow_fingerprints(apps, schema_editor):
+    # Same algorithm as `apps.projects.models.workflow_fingerprint`.
+    Template = apps.get_model('projects', 'Template')
+
+    templates = Template.objects.prefetch_related('phases')
+    for template in templates.iterator(chunk_size=500):
+        normalized = sorted({phase.phase_name.strip().casefold()
+                             for phase in template.phases.all()})
+        template.workflow_fingerprint = hashlib.sha256(
+            '\n'.join(normalized).encode()).hexdigest()
+        template.save(update_fields=['workflow_fingerprint'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0029_template_template_name_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='template',
+            name='workflow_fingerprint',
+            field=models.CharField(default='', editable=False, max_length=64, verbose_name='Workflow fingerprint'),
+        ),
+        migrations.AddIndex(
+            model_name='template',
+            index=models.Index(fields=['industry', 'workflow_fingerprint'], name='template_workflow_idx'),
+        ),
+        migrations.RunPython(backfill_workflow_fingerprints, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:28
+
+import itertools
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def deduplicate_project_slugs(apps, schema_editor):
+    # Older projects may share a slug (or have none); the first project keeps
+    # a shared slug and the others get the next free suffix, as
+    # `allocate_slug` would have done.
+    Project = apps.get_model('projects', 'Project')
+
+    taken = set(Project.objects.values_list('project_name_slug', flat=True))
+    kept = set()
+
+    for project in Project.objects.order_by('created_at', 'project_id').iterator(chunk_size=500):
+        slug = project.project_name_slug
+
+        if slug and slug not in kept:
+            kept.add(slug)
+            continue
+
+        base = slug or slugify(project.project_name)
+        candidates = itertools.chain(
+            [base], (f'{base}-{n}' for n in itertools.count(1)))
+        slug = next(candidate for candidate in candidates if candidate not in taken)
+
+        taken.add(slug)
+        kept.add(slug)
+
+        project.project_name_slug = slug
+        project.save(update_fields=['project_name_slug'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0030_template_workflow_fingerprint'),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate_project_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='project',
+            name='project_name_slug',
+            field=models.SlugField(help_text='A URL-safe slug version of the project name.', max_length=60, unique=True, verbose_name='Project Name Slug'),
+        ),
+    ]
@@ -1,5 +1,9 @@
 import uuid
-from django.db import models
+import hashlib
+from typing import Iterable
+
+from django.db import models, transaction
+from django.contrib.postgres.indexes import GinIndex
 from apps.organizations.models import Organization
 from apps.users.models import User
 from pms.utils import base_62_pk
@@ -45,6 +49,15 @@ def get_default_industry():
     return industry.pk
 
 
+def workflow_fingerprint(phase_names: Iterable[str]) -> str:
+    """
+    Hash a workflow so that templates with the same phases have the same fingerprint,
+    regardless of the order, case, surrounding whitespace or repetition of the phase names.
+    """
+    normalized = sorted({name.strip().casefold() for name in phase_names})
+    return hashlib.sha256('\n'.join(normalized).encode()).hexdigest()
+
+
 class Template(models.Model):
     """
     Represents a reusable project template that is categorized by industry.
@@ -60,6 +73,8 @@ class Template(models.Model):
         template_id (UUIDField): A unique identifier for the template, automatically 
                                  generated using UUID.
         template_name (CharField): The name of the template.
+        workflow_fingerprint (CharField): `workflow_fingerprint` of the template's phase names,
+                                          used to find templates with the same workflow.
     """
     industry = models.ForeignKey(Industry, on_delete=models.SET_DEFAULT,
                                  default=get_default_industry, related_name="templates", verbose_name="Industry ID")
@@ -67,6 +82,17 @@ class Template(models.Model):
         primary_key=True, default=uuid.uuid4, verbose_name="Template ID")
     template_name = models.CharField(
         max_length=50, verbose_name="Template name")
+    workflow_fingerprint = models.CharField(
+        max_length=64, default='', editable=False, verbose_name="Workflow fingerprint")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['industry', 'workflow_fingerprint'],
+                         name='template_workflow_idx'),
+            # Trigram index used to search templates by name.
+            GinIndex(fields=['template_name'], opclasses=['gin_trgm_ops'],
+                     name='template_name_trgm_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.template_name
@@ -124,7 +150,8 @@ class Project(models.Model):
     project_name = models.CharField(
         max_length=40, help_text="The name of the project, unique within the organization.", verbose_name="Project name")
     project_name_slug = models.SlugField(
-        max_length=60, help_text="A URL-safe slug version of the project name.", verbose_name="Project Name Slug")
+        max_length=60, unique=True, help_text="A URL-safe slug version of the project name.",
+        verbose_name="Project Name Slug")
     description = models.TextField(
         blank=True, verbose_name="Project description")
     created_at = models.DateTimeField(
@@ -162,6 +189,11 @@ class ProjectMember(models.Model):
         Project, on_delete=models.CASCADE, related_name="members", verbose_name="Project")
     role = models.CharField(max_length=50, choices=ROLES, default=MEMBER)
 
+    def save(self, *args, **kwargs):
+        # Save the membership and update the project's member counter atomically.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
 
 class ProjectPhase(models.Model):
     """
@@ -177,3 +209,49 @@ class ProjectPhase(models.Model):
 
     def __str__(self) -> str:
         return f'{self.project.project_name}| {self.phase_name}'
+
+
+class ProjectStats(models.Model):
+    """
+    Denormalized task and member counters of a `Project`.
+
+    The counters are kept in sync with F-expression updates whenever tasks or
+    memberships of the project are created, updated or deleted, so that a
+    project's statistics can be read without counting its rows.
+    Use the `reconcile_project_stats` management command to recompute them.
+    """
+    project = models.OneToOneField(
+        Project, on_delete=models.CASCADE, primary_key=True, related_name='stats', verbose_name='Project')
+    tasks = models.IntegerField(default=0, verbose_name='Tasks')
+    tasks_in_progress = models.IntegerField(
+        default=0, verbose_name='Tasks in progress')
+    tasks_on_hold = models.IntegerField(default=0, verbose_name='Tasks on hold')
+    tasks_done = models.IntegerField(default=0, verbose_name='Tasks done')
+    members = models.IntegerField(default=0, verbose_name='Members')
+
+    class Meta:
+        verbose_name_plural = 'Project stats'
+
+    def __str__(self) -> str:
+        return f'{self.project_id} | stats'
+
+
+class ProjectPhaseStats(models.Model):
+    """
+    Denormalized task counters of a `ProjectPhase`.
+
+    See `ProjectStats`.
+    """
+    phase = models.OneToOneField(
+        ProjectPhase, on_delete=models.CASCADE, primary_key=True, related_name='stats', verbose_name='Project phase')
+    tasks = models.IntegerField(default=0, verbose_name='Tasks')
+    tasks_in_progress = models.IntegerField(
+        default=0, verbose_name='Tasks in progress')
+    tasks_on_hold = models.IntegerField(default=0, verbose_name='Tasks on hold')
+    tasks_done = models.IntegerField(default=0, verbose_name='Tasks done')
+
+    class Meta:
+        verbose_name_plural = 'Project phase stats'
+
+    def __str__(self) -> str:
+        return f'{self.phase_id} | stats'
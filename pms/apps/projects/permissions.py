@@ -0,0 +1,35 @@
+from rest_framework import permissions
+
+from apps.projects import models
+from apps.projects.utils.memberships import get_project_role
+
+
+def get_project_id(obj) -> str:
+    """
+    Get the id of the project that `obj` belongs to without fetching the project.
+    """
+    if isinstance(obj, models.Project):
+        return obj.pk
+    return obj.project_id
+
+
+class IsProjectMember(permissions.BasePermission):
+    """
+    Allows access only to members of the project the object belongs to.
+
+    The object may be a `Project` or any model with a `project` foreign key.
+    """
+    message = 'You are not authorized to access this information.'
+
+    def has_object_permission(self, request, view, obj) -> bool:
+        return get_project_role(request, get_project_id(obj)) is not None
+
+
+class IsProjectManager(permissions.BasePermission):
+    """
+    Allows access only to managers of the project the object belongs to.
+    """
+    message = 'You are not authorized to perform this action.'
+
+    def has_object_permission(self, request, view, obj) -> bool:
+        return get_project_role(request, get_project_id(obj)) == models.ProjectMember.MANAGER
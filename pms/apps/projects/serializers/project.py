@@ -4,7 +4,9 @@ from rest_framework import serializers
 from rest_framework.request import Request
 from apps.organizations.serializers import OrganizationRetrievalSerializer
 from apps.projects.utils.slugs import slugify_project_name
+from apps.projects.utils.versions import bump_project_version
 from apps.projects import models
+from pms.slugs import save_with_unique_slug
 
 
 class ProjectCreationSerializer(serializers.ModelSerializer):
@@ -64,16 +66,13 @@ class ProjectCreationSerializer(serializers.ModelSerializer):
         organization = validated_data.get('organization')
         project_name = validated_data.get('project_name')
         description = validated_data.get('description')
-        project_name_slug = slugify_project_name(project_name)
 
-        if template:
-            project = models.Project.objects.create(organization=organization, template=template,
-                                                    project_name=project_name, project_name_slug=project_name_slug,
-                                                    description=description, deadline=deadline)
-        else:
-            project = models.Project.objects.create(organization=organization,
-                                                    project_name=project_name, project_name_slug=project_name_slug,
-                                                    description=description, deadline=deadline)
+        project = save_with_unique_slug(
+            lambda: slugify_project_name(project_name),
+            lambda project_name_slug: models.Project.objects.create(
+                organization=organization, template=template,
+                project_name=project_name, project_name_slug=project_name_slug,
+                description=description, deadline=deadline))
 
         models.ProjectMember.objects.create(
             member=request.user, project=project, role='Manager')
@@ -82,6 +81,9 @@ class ProjectCreationSerializer(serializers.ModelSerializer):
             template_phases = [models.ProjectPhase(
                 project=project, phase_name=phase.phase_name) for phase in template.phases.all()]
             models.ProjectPhase.objects.bulk_create(template_phases)
+            models.ProjectPhaseStats.objects.bulk_create(
+                [models.ProjectPhaseStats(phase=phase) for phase in template_phases])
+            bump_project_version(project.pk)
 
         return project
 
@@ -51,16 +51,13 @@ class TemplateSerializer(serializers.ModelSerializer):
         self.context['template_phases'] = template_phases
 
         # Check if a template with the same phases exists in the industry
-        industry_templates = industry.templates.prefetch_related("phases")
-        for template in industry_templates:
-            existing_phases = template.phases.values_list(
-                "phase_name", flat=True)
-            if set(template_phases) == set(existing_phases):
-                raise serializers.ValidationError(
-                    {
-                        "template_phases": "Another template in the selected industry has the same workflow."
-                    }
-                )
+        fingerprint = models.workflow_fingerprint(template_phases)
+        if industry.templates.filter(workflow_fingerprint=fingerprint).exists():
+            raise serializers.ValidationError(
+                {
+                    "template_phases": "Another template in the selected industry has the same workflow."
+                }
+            )
 
         return super().validate(attrs)
 
@@ -74,6 +71,7 @@ class TemplateSerializer(serializers.ModelSerializer):
         template = models.Template.objects.create(
             industry=industry,
             template_name=template_name,
+            workflow_fingerprint=models.workflow_fingerprint(template_phases),
         )
 
         # Create the template phases
@@ -97,7 +95,7 @@ class TemplateSearchSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = models.Template
-        fields = '__all__'
+        fields = ['industry', 'template_id', 'template_name']
 
 
 class TemplatePhaseSerializer(serializers.ModelSerializer):
@@ -0,0 +1,78 @@
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from pms.utils import is_cascade_deletion
+from apps.organizations.models import Organization
+from apps.organizations.utils import bump_organization_version
+from apps.projects import models
+from apps.projects.utils import stats
+from apps.projects.utils.lookups import project_cache
+from apps.projects.utils.memberships import invalidate_project_roles
+from apps.projects.utils.versions import bump_project_version
+
+
+@receiver(post_save, sender=models.ProjectMember)
+@receiver(post_delete, sender=models.ProjectMember)
+def invalidate_project_role(sender, instance: models.ProjectMember, **kwargs):
+    invalidate_project_roles(instance.project_id, [instance.member_id])
+
+
+@receiver(post_save, sender=models.Project)
+def create_project_stats(sender, instance: models.Project, created: bool, raw: bool = False, **kwargs):
+    if created and not raw:
+        models.ProjectStats.objects.create(project=instance)
+
+
+@receiver(post_save, sender=models.ProjectPhase)
+def create_project_phase_stats(sender, instance: models.ProjectPhase, created: bool, raw: bool = False, **kwargs):
+    if created and not raw:
+        models.ProjectPhaseStats.objects.create(phase=instance)
+
+
+@receiver(pre_delete, sender=models.ProjectPhase)
+def count_deleted_phase(sender, instance: models.ProjectPhase, origin=None, **kwargs):
+    # the tasks of the phase are deleted with it without updating the
+    # counters one by one. The counters of a deleted project go away.
+    if not is_cascade_deletion(sender, origin):
+        stats.remove_phase(instance)
+
+
+@receiver(post_save, sender=models.ProjectMember)
+def count_added_member(sender, instance: models.ProjectMember, created: bool, raw: bool = False, **kwargs):
+    if created and not raw:
+        stats.add_members(instance.project_id)
+
+
+@receiver(post_delete, sender=models.ProjectMember)
+def count_removed_member(sender, instance: models.ProjectMember, **kwargs):
+    stats.add_members(instance.project_id, -1)
+
+
+@receiver(post_save, sender=models.Project)
+@receiver(post_delete, sender=models.Project)
+def bump_version_of_project(sender, instance: models.Project, **kwargs):
+    bump_project_version(instance.pk)
+
+
+@receiver(post_save, sender=models.ProjectPhase)
+@receiver(post_delete, sender=models.ProjectPhase)
+@receiver(post_save, sender=models.ProjectMember)
+@receiver(post_delete, sender=models.ProjectMember)
+def bump_version_of_related_project(sender, instance, **kwargs):
+    bump_project_version(instance.project_id)
+
+
+@receiver(post_save, sender=models.Project)
+@receiver(post_delete, sender=models.Project)
+def invalidate_cached_project(sender, instance: models.Project, **kwargs):
+    project_cache.delete(instance.pk)
+    # the organization's detail lists its projects.
+    bump_organization_version(instance.organization_id)
+
+
+@receiver(post_save, sender=Organization)
+def invalidate_cached_projects_of_organization(sender, instance: Organization, created: bool, **kwargs):
+    # cached projects include their organization.
+    if not created:
+        project_cache.delete_many(
+            instance.projects.values_list('project_id', flat=True))
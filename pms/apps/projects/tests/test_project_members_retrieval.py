@@ -0,0 +1,116 @@
+import datetime
+
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from apps.projects import models
+from apps.users.models import User
+from apps.organizations.models import Organization, OrganizationMember
+
+
+class ProjectMembersRetrievalTests(APITestCase):
+    """
+    Tests for listing the members of a project and the members of its
+    organization who are not in the project.
+    """
+
+    def setUp(self):
+        ####################################
+        # create users.
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser', email='othermail@test.com', password='securepassword123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        ####################################
+        # create an organization with both users as members.
+        self.organization = Organization.objects.create(
+            organization_name='Test org', organization_name_slug='test-org',
+            organization_password='securepassword123')
+
+        OrganizationMember.objects.create(
+            organization=self.organization, user=self.user, role=OrganizationMember.ADMIN)
+        OrganizationMember.objects.create(
+            organization=self.organization, user=self.other_user)
+
+        ##################################
+        # create a project with the first user as its only member.
+        self.project = models.Project.objects.create(
+            organization=self.organization, project_name="Test project",
+            description='Testing project creation',
+            deadline=datetime.date.today() + datetime.timedelta(days=1))
+
+        models.ProjectMember.objects.create(
+            project=self.project, member=self.user, role=models.ProjectMember.MANAGER)
+
+        self.members_url = reverse('project_members_list', kwargs={
+                                   'project_id': self.project.pk})
+        self.non_members_url = reverse('non_project_members_list', kwargs={
+                                       'project_id': self.project.pk})
+
+    def test_members_retrieval(self):
+        response = self.client.get(self.members_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['username'] for user in response.data], ['testuser'])
+
+    def test_non_members_retrieval(self):
+        response = self.client.get(self.non_members_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['username'] for user in response.data], ['otheruser'])
+
+    def test_non_members_can_be_filtered_by_username_prefix(self):
+        user = User.objects.create_user(
+            username='thirduser', email='thirdmail@test.com', password='securepassword123'
+        )
+        OrganizationMember.objects.create(organization=self.organization, user=user)
+
+        response = self.client.get(self.non_members_url, {'q': 'Third'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['username'] for user in response.data], ['thirduser'])
+
+    def test_non_members_can_be_paginated(self):
+        user = User.objects.create_user(
+            username='thirduser', email='thirdmail@test.com', password='securepassword123'
+        )
+        OrganizationMember.objects.create(organization=self.organization, user=user)
+
+        response = self.client.get(self.non_members_url, {'page_size': 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['username'] for user in response.data['results']], ['otheruser'])
+
+        response = self.client.get(
+            self.non_members_url, {'page_size': 1, 'cursor': response.data['next_cursor']})
+
+        self.assertEqual([user['username'] for user in response.data['results']], ['thirduser'])
+        self.assertIsNone(response.data['next_cursor'])
+
+    def test_members_of_non_existent_project_returns_404(self):
+        url = reverse('project_members_list', kwargs={'project_id': '123'})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        url = reverse('non_project_members_list', kwargs={'project_id': '123'})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unauthenticated_users_are_rejected(self):
+        response = APIClient().get(self.members_url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn('detail', response.data)
+
+    def test_other_methods_are_not_allowed(self):
+        response = self.client.post(self.members_url)
+
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
@@ -0,0 +1,102 @@
+import datetime
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from apps.projects import models
+from apps.users.models import User
+from apps.organizations.models import Organization
+
+
+class ProjectMembershipCacheTests(APITestCase):
+    """
+    Tests for the cached project membership checks.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+        ####################################
+        # create a manager and another user.
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        self.other_user = User.objects.create_user(
+            username='testuser2', email='testmail2@test.com', password='securepassword123'
+        )
+        self.other_client = APIClient()
+        self.other_client.force_authenticate(user=self.other_user)
+
+        ####################################
+        # create an organization and a project.
+        self.organization = Organization.objects.create(
+            organization_name='Test org', organization_name_slug='test-org',
+            organization_password='securepassword123')
+
+        self.project = models.Project.objects.create(
+            organization=self.organization, project_name="Test project",
+            description='Testing project creation',
+            deadline=datetime.date.today() + datetime.timedelta(days=1))
+
+        models.ProjectMember.objects.create(
+            project=self.project, member=self.user, role=models.ProjectMember.MANAGER)
+
+        self.phase = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+
+        self.url = reverse('project_phase_detail', kwargs={
+                           'phase_id': self.phase.pk})
+
+    def membership_queries(self, client: APIClient) -> list[str]:
+        with CaptureQueriesContext(connection) as queries:
+            client.get(self.url)
+
+        table = models.ProjectMember._meta.db_table
+        return [query['sql'] for query in queries if table in query['sql']]
+
+    def test_membership_is_only_queried_once(self):
+        self.assertEqual(len(self.membership_queries(self.client)), 1)
+        self.assertEqual(len(self.membership_queries(self.client)), 0)
+
+    def test_added_member_gains_access(self):
+        response = self.other_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        add_url = reverse('project_members_addition', kwargs={
+                          'project_id': self.project.pk})
+        self.client.post(
+            add_url, {'members': [self.other_user.username]}, format='json')
+
+        response = self.other_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['role'], models.ProjectMember.MEMBER)
+
+    def test_removed_member_loses_access(self):
+        membership = models.ProjectMember.objects.create(
+            project=self.project, member=self.other_user)
+
+        response = self.other_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        membership.delete()
+
+        response = self.other_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_role_change_is_applied(self):
+        membership = models.ProjectMember.objects.create(
+            project=self.project, member=self.other_user)
+        self.other_client.get(self.url)
+
+        membership.role = models.ProjectMember.MANAGER
+        membership.save()
+
+        response = self.other_client.get(self.url)
+        self.assertEqual(response.data['role'], models.ProjectMember.MANAGER)
@@ -1,10 +1,13 @@
 import datetime
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 
-from apps.projects.models import ProjectPhase
+from apps.projects.models import ProjectPhase, ProjectStats
+from apps.tasks.models import Task, TaskAssignment
 from apps.users.models import User
 
 
@@ -74,3 +77,40 @@ class ProjectPhaseDeletionTests(APITestCase):
             pk=self.project_phase.pk).exists()
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertTrue(phase_exists)
+
+    def create_phase_with_tasks(self, count: int) -> ProjectPhase:
+        phase = ProjectPhase.objects.create(
+            project_id=self.project['project_id'], phase_name=f'phase with {count} tasks')
+
+        for i in range(count):
+            task = Task.objects.create(project_id=self.project['project_id'], project_phase=phase,
+                                       task_name=f'task {i}', deadline=datetime.date.today(),
+                                       status=Task.DONE if i % 2 else Task.IN_PROGRESS)
+            TaskAssignment.objects.create(task=task, user=self.project_member)
+
+        return phase
+
+    def test_deleted_tasks_are_uncounted(self):
+        self.create_phase_with_tasks(2)
+        phase = self.create_phase_with_tasks(3)
+
+        self.manager_client.delete(reverse('delete_project_phase', kwargs={'phase_id': phase.pk}))
+
+        stats = ProjectStats.objects.get(project_id=self.project['project_id'])
+        self.assertEqual((stats.tasks, stats.tasks_in_progress, stats.tasks_done), (2, 1, 1))
+
+    def test_query_count_does_not_depend_on_task_count(self):
+        few_tasks = self.create_phase_with_tasks(1)
+        many_tasks = self.create_phase_with_tasks(10)
+
+        # cache the manager's role.
+        self.manager_client.delete(self.url)
+
+        with CaptureQueriesContext(connection) as few_queries:
+            self.manager_client.delete(reverse('delete_project_phase', kwargs={'phase_id': few_tasks.pk}))
+
+        with CaptureQueriesContext(connection) as many_queries:
+            self.manager_client.delete(reverse('delete_project_phase', kwargs={'phase_id': many_tasks.pk}))
+
+        self.assertEqual(len(few_queries), len(many_queries))
+        self.assertFalse(Task.objects.exists())
@@ -0,0 +1,96 @@
+import datetime
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from apps.projects import models
+from apps.tasks.models import Task
+from apps.users.models import User
+from apps.organizations.models import Organization
+
+
+class ProjectPhaseDetailTests(APITestCase):
+    """
+    Tests for retrieving a project phase's kanban board.
+    """
+
+    def setUp(self):
+        ####################################
+        # create a user.
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        ####################################
+        # create an organization.
+        self.organization = Organization.objects.create(
+            organization_name='Test org', organization_name_slug='test-org',
+            organization_password='securepassword123')
+
+        ##################################
+        # create a project and make the user a member.
+        self.deadline = datetime.date.today() + datetime.timedelta(days=1)
+
+        self.project = models.Project.objects.create(
+            organization=self.organization, project_name="Test project",
+            description='Testing project creation', deadline=self.deadline)
+
+        models.ProjectMember.objects.create(
+            project=self.project, member=self.user, role=models.ProjectMember.MANAGER)
+
+        self.phase = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+
+        self.url = reverse('project_phase_detail', kwargs={
+                           'phase_id': self.phase.pk})
+
+    def create_tasks(self, count: int, status: str = Task.IN_PROGRESS):
+        Task.objects.bulk_create([
+            Task(project=self.project, project_phase=self.phase, task_name=f'{status} task {i}',
+                 deadline=self.deadline, status=status)
+            for i in range(count)
+        ])
+
+    def test_tasks_are_grouped_by_status(self):
+        self.create_tasks(2, Task.IN_PROGRESS)
+        self.create_tasks(1, Task.ON_HOLD)
+        self.create_tasks(3, Task.DONE)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['in_progress']), 2)
+        self.assertEqual(len(response.data['on_hold']), 1)
+        self.assertEqual(len(response.data['completed']), 3)
+        self.assertEqual(response.data['role'], models.ProjectMember.MANAGER)
+        self.assertEqual(
+            response.data['completed'][0]['project_phase']['phase_id'], self.phase.pk)
+
+    def test_query_count_does_not_depend_on_task_count(self):
+        self.create_tasks(1)
+        # warm the membership cache.
+        self.client.get(self.url)
+
+        with CaptureQueriesContext(connection) as few_tasks:
+            self.client.get(self.url)
+
+        self.create_tasks(20, Task.DONE)
+        with CaptureQueriesContext(connection) as many_tasks:
+            self.client.get(self.url)
+
+        self.assertEqual(len(few_tasks), len(many_tasks))
+
+    def test_non_project_member_cant_view_phase(self):
+        user = User.objects.create_user(
+            username='testuser2', email='testmail2@test.com', password='securepassword123'
+        )
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,212 @@
+import asyncio
+import datetime
+from unittest import mock
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import transaction
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from pms import pubsub
+from pms.pubsub import SUBSCRIBER_QUEUE_SIZE
+from apps.projects import models
+from apps.tasks.events import publish_phase_event
+from apps.tasks.models import Task
+from apps.users.models import User
+from apps.organizations.models import Organization
+
+
+# Without Redis, events are delivered within the process.
+LOCAL_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# The cache of `pms.settings`, which the tests run against in CI.
+REDIS_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://cache:6379',
+    }
+}
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class ProjectPhaseEventsTests(APITestCase):
+    """
+    Tests for streaming the changes to a project phase's board.
+
+    The tests use the local memory cache, so events are delivered within
+    the process instead of through Redis and are received as soon as the
+    stream has started.
+    """
+
+    def setUp(self):
+        ####################################
+        # create a user.
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        ####################################
+        # create an organization.
+        self.organization = Organization.objects.create(
+            organization_name='Test org', organization_name_slug='test-org',
+            organization_password='securepassword123')
+
+        ##################################
+        # create a project with a phase and a task, and make the user a manager.
+        self.deadline = datetime.date.today() + datetime.timedelta(days=1)
+
+        self.project = models.Project.objects.create(
+            organization=self.organization, project_name="Test project",
+            description='Testing project creation', deadline=self.deadline)
+
+        models.ProjectMember.objects.create(
+            project=self.project, member=self.user, role=models.ProjectMember.MANAGER)
+
+        self.phase = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+
+        self.task = Task.objects.create(
+            project=self.project, project_phase=self.phase, task_name='Test task',
+            deadline=self.deadline)
+
+        self.url = reverse('project_phase_events', kwargs={
+                           'phase_id': self.phase.pk})
+
+    def read_events(self, change) -> list[str]:
+        """
+        Open the stream, make a change once subscribed and return the
+        event that follows.
+        """
+        response = self.client.get(self.url, HTTP_ACCEPT='text/event-stream')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        def commit_change():
+            with self.captureOnCommitCallbacks(execute=True):
+                change()
+
+        async def read():
+            stream = response.streaming_content
+            try:
+                # the stream is subscribed once it has started.
+                first = await anext(stream)
+                await sync_to_async(commit_change)()
+                return [first, await asyncio.wait_for(anext(stream), 5)]
+            finally:
+                await stream.aclose()
+
+        return [frame.decode() for frame in async_to_sync(read)()]
+
+    def test_status_changes_are_streamed(self):
+        def change_status():
+            self.task.status = Task.DONE
+            self.task.save()
+
+        retry, event = self.read_events(change_status)
+
+        self.assertTrue(retry.startswith('retry:'))
+        self.assertTrue(event.startswith('event: task_status_changed\n'))
+        self.assertIn(f'"task_id":"{self.task.pk}"', event)
+        self.assertIn('"previous_status":"IN_PROGRESS","status":"DONE"', event)
+
+    def test_created_tasks_are_streamed(self):
+        def create_task():
+            Task.objects.create(project=self.project, project_phase=self.phase,
+                                task_name='New task', deadline=self.deadline)
+
+        _, event = self.read_events(create_task)
+
+        self.assertTrue(event.startswith('event: task_created\n'))
+        self.assertIn('"task_name":"New task"', event)
+
+    def test_assignments_are_streamed(self):
+        def assign_task():
+            self.client.post(reverse('assign_task', kwargs={'task_id': self.task.pk}),
+                             {'assignees': [self.user.username]}, format='json')
+
+        _, event = self.read_events(assign_task)
+
+        self.assertTrue(event.startswith('event: task_assigned\n'))
+        self.assertIn('"username":"testuser"', event)
+
+    def test_slow_clients_are_asked_to_resync(self):
+        def flood():
+            for i in range(SUBSCRIBER_QUEUE_SIZE + 1):
+                publish_phase_event(self.phase.pk, 'task_deleted', {'task_id': str(i)})
+
+        _, event = self.read_events(flood)
+
+        self.assertTrue(event.startswith('event: resync\n'))
+
+    def test_non_project_member_cant_follow_phase(self):
+        user = User.objects.create_user(
+            username='testuser2', email='testmail2@test.com', password='securepassword123'
+        )
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(self.url, HTTP_ACCEPT='text/event-stream')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(response.content.startswith(b'event: error\n'))
+
+    def test_non_existent_phase_returns_404(self):
+        url = reverse('project_phase_events', kwargs={'phase_id': '123'})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_stream_releases_database_connection(self):
+        with mock.patch('apps.projects.views.phase.connection', in_atomic_block=False) as connection:
+            response = self.client.get(self.url, HTTP_ACCEPT='text/event-stream')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        connection.close.assert_called_once_with()
+
+    def test_rolled_back_tasks_are_not_serialized(self):
+        with mock.patch('apps.tasks.serializers.TaskRetrievalSerializer') as serializer:
+            with self.captureOnCommitCallbacks(execute=True):
+                with self.assertRaises(RuntimeError), transaction.atomic():
+                    Task.objects.create(project=self.project, project_phase=self.phase,
+                                        task_name='New task', deadline=self.deadline)
+                    raise RuntimeError
+
+        serializer.assert_not_called()
+
+
+@override_settings(CACHES=REDIS_CACHES)
+class PubSubRedisTests(SimpleTestCase):
+    """
+    Tests for delivering published messages to the subscribers of every
+    process through Redis.
+    """
+
+    def setUp(self):
+        try:
+            pubsub.get_redis_client().ping()
+        except Exception:
+            self.skipTest('Redis is not available.')
+
+    def test_messages_are_delivered_through_redis(self):
+        async def receive():
+            with pubsub.subscribe('redis-test') as subscription:
+                # the listener subscribes to Redis in the background, so
+                # publish until it has.
+                for _ in range(50):
+                    await sync_to_async(pubsub._publish)('redis-test', 'message')
+
+                    try:
+                        return await asyncio.wait_for(subscription.get(), 0.1)
+                    except asyncio.TimeoutError:
+                        pass
+
+        self.assertEqual(async_to_sync(receive)(), 'message')
@@ -1,10 +1,17 @@
 import datetime
+from io import StringIO
 
+from django.core.cache import cache
+from django.core.management import call_command
 from django.urls import reverse
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 
+from pms.conditional import make_etag
 from apps.projects import models
+from apps.projects.utils.lookups import get_project
+from apps.projects.utils.versions import get_project_version, project_version_key
+from apps.tasks.models import Task
 from apps.users.models import User
 from apps.organizations.models import Organization
 
@@ -82,3 +89,129 @@ class ProjectStatisticsRetreivalTests(APITestCase):
         # wrong pk
         response = self.client.get(f'{self.url}?pk=12345/')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_non_existent_project_has_no_version(self):
+        """
+        Test that no version stamp is created for projects that don't exist,
+        so that they are never answered with a 304.
+        """
+        version = get_project_version('12345')
+        etag = make_etag('stats', '12345', version)
+        cache.clear()
+
+        response = self.client.get(f'{self.url}?pk=12345', HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIsNone(cache.get(project_version_key('12345')))
+
+    def create_task(self, phase, name, status=Task.IN_PROGRESS):
+        return Task.objects.create(project=self.project, project_phase=phase, task_name=name,
+                                   deadline=self.project.deadline, status=status)
+
+    def test_stats_follow_task_changes(self):
+        """
+        Test that the counters are updated when tasks are created, updated and deleted.
+        """
+        phase = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+        models.ProjectMember.objects.create(project=self.project, member=self.user)
+
+        task = self.create_task(phase, 'first task')
+        self.create_task(phase, 'second task', Task.ON_HOLD)
+
+        task.status = Task.DONE
+        task.save()
+
+        self.create_task(phase, 'third task').delete()
+
+        response = self.client.get(f'{self.url}?pk={self.project.pk}')
+
+        self.assertEqual(response.data['tasks'], 2)
+        self.assertEqual(response.data['members'], 1)
+        self.assertEqual(response.data['tasks_in_progress'], 0)
+        self.assertEqual(response.data['tasks_on_hold'], 1)
+        self.assertEqual(response.data['tasks_completed'], 1)
+        self.assertEqual(response.data['percentage_completion'], 50)
+
+        phase.stats.refresh_from_db()
+        self.assertEqual(phase.stats.tasks, 2)
+        self.assertEqual(phase.stats.tasks_done, 1)
+
+    def test_stats_are_read_with_one_query(self):
+        """
+        Test that the statistics are read without counting rows.
+        """
+        # the project itself is cached.
+        get_project(self.project.pk)
+
+        with self.assertNumQueries(1):
+            self.client.get(f'{self.url}?pk={self.project.pk}')
+
+    def test_phase_deletion_updates_project_stats(self):
+        """
+        Test that deleting a phase removes its tasks from the project's counters.
+        """
+        phase = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+        self.create_task(phase, 'first task')
+
+        phase.delete()
+
+        response = self.client.get(f'{self.url}?pk={self.project.pk}')
+        self.assertEqual(response.data['tasks'], 0)
+        self.assertEqual(response.data['tasks_in_progress'], 0)
+
+    def test_reconcile_command_fixes_counters(self):
+        """
+        Test that the `reconcile_project_stats` command recomputes drifted counters.
+        """
+        phase = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+        self.create_task(phase, 'first task')
+
+        models.ProjectStats.objects.filter(
+            project=self.project).update(tasks=10, tasks_in_progress=7)
+
+        call_command('reconcile_project_stats', self.project.pk, stdout=StringIO())
+
+        response = self.client.get(f'{self.url}?pk={self.project.pk}')
+        self.assertEqual(response.data['tasks'], 1)
+        self.assertEqual(response.data['tasks_in_progress'], 1)
+
+    def test_cached_stats_are_invalidated_by_task_changes(self):
+        """
+        Test that repeated reads are served from the cache until a task changes.
+        """
+        phase = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+        url = f'{self.url}?pk={self.project.pk}'
+
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.data['tasks'], 0)
+
+        self.create_task(phase, 'first task')
+
+        response = self.client.get(url)
+        self.assertEqual(response.data['tasks'], 1)
+
+    def test_unchanged_stats_are_not_sent_again(self):
+        """
+        Test that a client holding the current statistics gets a 304 response,
+        until a task changes.
+        """
+        url = f'{self.url}?pk={self.project.pk}'
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        phase = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+        self.create_task(phase, 'first task')
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['tasks'], 1)
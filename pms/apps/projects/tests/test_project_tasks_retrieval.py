@@ -0,0 +1,220 @@
+import json
+import pickle
+import datetime
+
+from asgiref.sync import async_to_sync
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from apps.projects import models
+from apps.projects.utils.lookups import project_cache
+from apps.tasks.models import Task, TaskAssignment
+from apps.tasks.pagination import TaskPagination
+from apps.users.models import User
+from apps.organizations.models import Organization
+
+
+class ProjectTasksRetrievalTests(APITestCase):
+    """
+    Tests for retrieving a project's tasks.
+    """
+
+    def setUp(self):
+        ####################################
+        # create a user.
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        ####################################
+        # create an organization.
+        self.organization = Organization.objects.create(
+            organization_name='Test org', organization_name_slug='test-org',
+            organization_password='securepassword123')
+
+        ##################################
+        # create a project with two phases.
+        today = datetime.date.today()
+
+        self.project = models.Project.objects.create(
+            organization=self.organization, project_name="Test project",
+            description='Testing project creation', deadline=today + datetime.timedelta(days=30))
+
+        self.design = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+        self.build = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Build')
+
+        ##################################
+        # create tasks with a deadline on each of the next 5 days.
+        self.tasks = []
+        for i in range(5):
+            self.tasks.append(Task.objects.create(
+                project=self.project, project_phase=self.design if i % 2 else self.build,
+                task_name=f'task {i}', deadline=today + datetime.timedelta(days=i + 1),
+                status=Task.DONE if i < 2 else Task.IN_PROGRESS))
+
+        self.url = reverse('project_tasks_retrieval', kwargs={
+                           'project_id': self.project.pk})
+
+    def test_tasks_retrieval(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([task['task_id'] for task in response.data['tasks']],
+                         [task.pk for task in self.tasks])
+        self.assertIsNone(response.data['next_cursor'])
+
+    def test_every_task_is_returned_without_a_page_request(self):
+        deadline = self.tasks[-1].deadline
+        Task.objects.bulk_create(
+            Task(project=self.project, project_phase=self.design,
+                 task_name=f'extra task {i}', deadline=deadline)
+            for i in range(TaskPagination.page_size))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data['tasks']), TaskPagination.page_size + 5)
+        self.assertIsNone(response.data['next_cursor'])
+
+    def test_pages_follow_each_other(self):
+        task_ids = []
+        cursor = ''
+
+        while True:
+            response = self.client.get(
+                self.url, {'page_size': 2, 'cursor': cursor})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['tasks']), 2)
+
+            task_ids += [task['task_id'] for task in response.data['tasks']]
+            cursor = response.data['next_cursor']
+            if not cursor:
+                break
+
+        self.assertEqual(task_ids, [task.pk for task in self.tasks])
+
+    def test_tasks_with_same_deadline_are_not_skipped(self):
+        deadline = self.tasks[0].deadline
+        for i in range(3):
+            Task.objects.create(project=self.project, project_phase=self.design,
+                                task_name=f'same deadline {i}', deadline=deadline)
+
+        first_page = self.client.get(self.url, {'page_size': 2})
+        second_page = self.client.get(
+            self.url, {'page_size': 2, 'cursor': first_page.data['next_cursor']})
+
+        task_ids = [task['task_id']
+                    for task in first_page.data['tasks'] + second_page.data['tasks']]
+        expected = Task.objects.filter(deadline=deadline).order_by(
+            'task_id').values_list('task_id', flat=True)
+
+        self.assertEqual(task_ids, list(expected))
+
+    def test_filter_by_status(self):
+        response = self.client.get(self.url, {'status': Task.DONE})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['tasks']), 2)
+
+    def test_filter_by_phase(self):
+        response = self.client.get(self.url, {'phase': self.design.pk})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['tasks']), 2)
+
+    def test_filter_by_assignee(self):
+        TaskAssignment.objects.create(task=self.tasks[3], user=self.user)
+
+        response = self.client.get(self.url, {'assignee': self.user.username})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([task['task_id'] for task in response.data['tasks']],
+                         [self.tasks[3].pk])
+
+    def read_stream(self, response) -> bytes:
+        """
+        Read the body of a response streamed from an async iterator.
+        """
+        async def read():
+            return b''.join([chunk async for chunk in response.streaming_content])
+
+        return async_to_sync(read)()
+
+    def test_json_streaming(self):
+        response = self.client.get(self.url, {'stream': 1, 'status': Task.IN_PROGRESS})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+
+        data = json.loads(self.read_stream(response))
+        self.assertEqual(data['project_id'], self.project.pk)
+        self.assertEqual([task['task_id'] for task in data['tasks']],
+                         [task.pk for task in self.tasks[2:]])
+        self.assertIsNone(data['next_cursor'])
+
+    def test_ndjson_streaming(self):
+        response = self.client.get(
+            self.url, HTTP_ACCEPT='application/x-ndjson')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        lines = self.read_stream(response).splitlines()
+        self.assertEqual([json.loads(line)['task_id'] for line in lines],
+                         [task.pk for task in self.tasks])
+
+    def test_invalid_status_fails(self):
+        response = self.client.get(self.url, {'status': 'UNKNOWN'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_cursor_fails(self):
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_non_existent_project_returns_404(self):
+        url = reverse('project_tasks_retrieval', kwargs={'project_id': '123'})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_repeated_retrieval_uses_cached_project(self):
+        self.client.get(self.url)
+
+        # only the tasks are queried.
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_organization_password_is_not_cached(self):
+        self.client.get(self.url)
+
+        password = Organization.objects.get(pk=self.organization.pk).organization_password
+        cached = project_cache.get_or_set(self.project.pk, lambda: None)
+
+        self.assertEqual(cached.organization, self.organization)
+        self.assertNotIn(password.encode(), pickle.dumps(cached))
+
+    def test_project_changes_invalidate_cached_project(self):
+        self.client.get(self.url)
+
+        self.project.project_name = 'Renamed project'
+        self.project.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data['project_name'], 'Renamed project')
+
+    def test_organization_changes_invalidate_cached_project(self):
+        self.client.get(self.url)
+
+        self.organization.organization_name = 'Renamed org'
+        self.organization.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data['organization']['organization_name'], 'Renamed org')
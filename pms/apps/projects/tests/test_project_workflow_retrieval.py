@@ -0,0 +1,103 @@
+import datetime
+
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from apps.projects import models
+from apps.users.models import User
+from apps.organizations.models import Organization
+
+
+class ProjectWorkflowRetrievalTests(APITestCase):
+    """
+    Tests for retrieving the phases (workflow) of a project.
+    """
+
+    def setUp(self):
+        ####################################
+        # create a user.
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        ####################################
+        # create an organization and a project.
+        self.organization = Organization.objects.create(
+            organization_name='Test org', organization_name_slug='test-org',
+            organization_password='securepassword123')
+
+        self.project = models.Project.objects.create(
+            organization=self.organization, project_name="Test project",
+            description='Testing project creation',
+            deadline=datetime.date.today() + datetime.timedelta(days=1))
+
+        models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+
+        self.url = reverse('project_phases', kwargs={
+                           'project_id': self.project.pk})
+
+    def test_workflow_retrieval(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['project_id'], self.project.pk)
+        self.assertEqual([phase['phase_name'] for phase in response.data['phases']],
+                         ['Design'])
+
+    def test_workflow_is_served_from_cache(self):
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_phase_changes_invalidate_cached_workflow(self):
+        self.client.get(self.url)
+
+        phase = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Build')
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data['phases']), 2)
+
+        phase.phase_name = 'Testing'
+        phase.save()
+        response = self.client.get(self.url)
+        self.assertIn('Testing', [phase['phase_name']
+                      for phase in response.data['phases']])
+
+        phase.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data['phases']), 1)
+
+    def test_non_existent_project_returns_404(self):
+        url = reverse('project_phases', kwargs={'project_id': '123'})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_unchanged_workflow_is_not_sent_again(self):
+        response = self.client.get(self.url)
+        etag = response['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_changed_workflow_is_sent_again(self):
+        etag = self.client.get(self.url)['ETag']
+
+        models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Build')
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(len(response.data['phases']), 2)
@@ -118,6 +118,25 @@ class TemplateCreationTests(APITransactionTestCase):
         self.assertIsInstance(response.data, dict)
         self.assertIn('template_phases', response.data)
 
+    def test_reordered_workflow_is_a_duplicate(self):
+        """
+        Test that the order and case of phase names don't make a workflow different.
+        """
+        url = reverse('create_template')
+
+        self.client.post(url, self.data, format='json')
+
+        data = {
+            **self.data,
+            'template_name': "reordered workflow template",
+            'template_phases': ['Do Z', 'do x', ' DO Y '],
+        }
+
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('template_phases', response.data)
+
     def test_valid_industry_in_creating_template(self):
         """
         Test that a template must be created with an existing industry.
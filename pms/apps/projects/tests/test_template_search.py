@@ -22,7 +22,7 @@ class TemplateSearchTests(APITestCase):
 
         #######################################
         # create an industry
-        industry = models.Industry.objects.create(
+        self.industry = industry = models.Industry.objects.create(
             industry_name="Test industry"
         )
 
@@ -31,7 +31,7 @@ class TemplateSearchTests(APITestCase):
         self.template = models.Template.objects.create(
             industry=industry, template_name="test template")
 
-        self.url = reverse('template_search') + f'?name=t'
+        self.url = reverse('template_search') + '?name=t'
 
     def test_users_can_search_for_template(self):
         """
@@ -40,3 +40,26 @@ class TemplateSearchTests(APITestCase):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIsInstance(response.data, list)
+
+    def test_templates_starting_with_the_search_term_come_first(self):
+        """
+        Test that prefix matches are ranked before other matches.
+        """
+        models.Template.objects.create(
+            industry=self.industry, template_name="agile scrum")
+        models.Template.objects.create(
+            industry=self.industry, template_name="scrum")
+
+        response = self.client.get(reverse('template_search'), {'name': 'scrum'})
+
+        self.assertEqual([template['template_name'] for template in response.data],
+                         ['scrum', 'agile scrum'])
+        self.assertEqual(response.data[0]['industry']['industry_name'], 'Test industry')
+
+    def test_workflow_fingerprint_is_not_exposed(self):
+        """
+        Test that only the public fields of templates are returned.
+        """
+        response = self.client.get(self.url)
+
+        self.assertEqual(set(response.data[0]), {'industry', 'template_id', 'template_name'})
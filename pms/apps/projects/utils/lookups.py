@@ -0,0 +1,29 @@
+from django.http import Http404
+
+from pms.tiered_cache import TieredCache
+from .. import models
+
+# Projects are read on almost every request but rarely change, so they are
+# cached in each process as well as in Redis.
+project_cache = TieredCache('project')
+
+
+def get_project(project_id: str) -> models.Project:
+    """
+    Get a project, with its organization, by its id.
+
+    The password hash of the organization is not cached: it is deferred and
+    loaded from the database if it is used.
+
+    Raises `Project.DoesNotExist` if there is no such project.
+    """
+    return project_cache.get_or_set(
+        project_id, lambda: models.Project.objects.select_related('organization')
+        .defer('organization__organization_password').get(pk=project_id))
+
+
+def get_project_or_404(project_id: str) -> models.Project:
+    try:
+        return get_project(project_id)
+    except models.Project.DoesNotExist:
+        raise Http404('No Project matches the given query.')
@@ -1,20 +1,40 @@
-from typing import Optional
+from typing import Iterable, Optional
+
+from rest_framework.request import Request
 
 from .. import models
-from apps.users.models import User
+from pms.roles import get_cached_role, invalidate_cached_roles
+
+
+def project_role_cache_key(project_id: str, user_id) -> str:
+    return f'project-role:{project_id}:{user_id}'
 
 
-def get_project_membership(project: models.Project, user: User) -> Optional[models.ProjectMember]:
+def get_project_role(request: Request, project_id: str) -> Optional[str]:
     """
-    Retrieves a project member.
+    Retrieves the role of the requesting user in a project.
 
-    This function retrieves a membership for a given project and user
-    without considering the role. It returns None if no such membership 
-    exists.
+    The role is memoized for the duration of the request and cached
+    across requests. It returns None if the user is not a member of the project.
     """
-    try:
-        membership = models.ProjectMember.objects.get(
-            project=project, member=user)
-        return membership
-    except models.ProjectMember.DoesNotExist:
+    user = request.user
+
+    if not user.is_authenticated:
         return None
+
+    def load_role():
+        return models.ProjectMember.objects.filter(
+            project_id=project_id, member=user).values_list('role', flat=True).first()
+
+    return get_cached_role(request, project_role_cache_key(project_id, user.pk), load_role)
+
+
+def invalidate_project_roles(project_id: str, user_ids: Iterable) -> None:
+    """
+    Remove the cached roles of users in a project.
+
+    Membership changes made without `save()`/`delete()` (e.g. `bulk_create`
+    or `update()`) don't send signals and must call this explicitly.
+    """
+    invalidate_cached_roles(project_role_cache_key(project_id, user_id)
+                            for user_id in user_ids)
@@ -1,4 +1,4 @@
-from django.utils.text import slugify
+from pms.slugs import allocate_slug
 from ..models import Project
 
 
@@ -6,11 +6,4 @@ def slugify_project_name(project_name: str) -> str:
     """
     Slugify the project name and ensure it is unique.
     """
-    project_name_slug = slugify(project_name)
-
-    counter = 1
-    while Project.objects.filter(project_name_slug=project_name_slug).exists():
-        project_name_slug = f"{project_name_slug}-{counter}"
-        counter += 1
-
-    return project_name_slug
+    return allocate_slug(Project.objects.all(), 'project_name_slug', project_name)
@@ -0,0 +1,92 @@
+from django.db.models import Count, F, Q
+
+from apps.tasks.models import Task
+from .. import models
+
+# Maps a task status to the counter field that tracks it.
+STATUS_COUNTERS = {
+    Task.IN_PROGRESS: 'tasks_in_progress',
+    Task.ON_HOLD: 'tasks_on_hold',
+    Task.DONE: 'tasks_done',
+}
+
+
+def _increment(queryset, counters: dict[str, int]) -> None:
+    counters = {field: delta for field, delta in counters.items() if delta}
+
+    if counters:
+        queryset.update(**{field: F(field) + delta
+                           for field, delta in counters.items()})
+
+
+def add_tasks(project_id: str, phase_id: str, status: str, count: int = 1) -> None:
+    """
+    Update the counters after `count` tasks with `status` were added to a phase.
+
+    A negative `count` removes tasks.
+    """
+    counters = {'tasks': count, STATUS_COUNTERS[status]: count}
+
+    _increment(models.ProjectStats.objects.filter(project_id=project_id), counters)
+    _increment(models.ProjectPhaseStats.objects.filter(phase_id=phase_id), counters)
+
+
+def move_tasks(project_id: str, phase_id: str, old_status: str, new_status: str, count: int = 1) -> None:
+    """
+    Update the counters after `count` tasks of a phase changed from `old_status` to `new_status`.
+    """
+    if old_status == new_status:
+        return
+
+    counters = {STATUS_COUNTERS[old_status]: -count,
+                STATUS_COUNTERS[new_status]: count}
+
+    _increment(models.ProjectStats.objects.filter(project_id=project_id), counters)
+    _increment(models.ProjectPhaseStats.objects.filter(phase_id=phase_id), counters)
+
+
+def remove_phase(phase: models.ProjectPhase) -> None:
+    """
+    Update the project's counters before a phase is deleted with its tasks.
+    """
+    counters = _count_tasks(phase.phase_tasks.all())
+
+    _increment(models.ProjectStats.objects.filter(project_id=phase.project_id),
+               {field: -count for field, count in counters.items()})
+
+
+def add_members(project_id: str, count: int = 1) -> None:
+    """
+    Update the member counter after `count` members were added to a project.
+
+    A negative `count` removes members.
+    """
+    _increment(models.ProjectStats.objects.filter(
+        project_id=project_id), {'members': count})
+
+
+def _count_tasks(tasks) -> dict[str, int]:
+    return tasks.aggregate(
+        tasks=Count('pk'),
+        **{field: Count('pk', filter=Q(status=status))
+           for status, field in STATUS_COUNTERS.items()}
+    )
+
+
+def refresh_project_stats(project: models.Project) -> models.ProjectStats:
+    """
+    Recompute the counters of a project and its phases from their rows.
+    """
+    stats, _ = models.ProjectStats.objects.update_or_create(
+        project=project,
+        defaults={
+            **_count_tasks(project.tasks.all()),
+            'members': project.members.count(),
+        }
+    )
+
+    for phase in project.phases.all():
+        models.ProjectPhaseStats.objects.update_or_create(
+            phase=phase, defaults=_count_tasks(phase.phase_tasks.all()))
+
+    return stats
@@ -0,0 +1,67 @@
+from typing import Any, Callable
+
+from django.core.cache import cache
+
+from pms.versions import bump_version, get_version
+from .. import models
+
+# How long a cached response is kept. Entries of outdated versions are never
+# read again and simply expire.
+PROJECT_DATA_CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+
+def project_version_key(project_id: str) -> str:
+    return f'project-version:{project_id}'
+
+
+def get_project_version(project_id: str) -> int:
+    """
+    Get the current version of a project's data.
+    """
+    return get_version(project_version_key(project_id))
+
+
+def bump_project_version(project_id: str) -> None:
+    """
+    Mark all the cached data of a project as outdated.
+    """
+    bump_version(project_version_key(project_id))
+
+
+def bump_assignee_project_versions(user_id) -> None:
+    """
+    Mark the cached data of the projects a user is assigned tasks in as
+    outdated, e.g. after the user's username or profile picture changed:
+    task details list their assignees.
+    """
+    project_ids = models.Project.objects.filter(
+        tasks__assignments__user_id=user_id).values_list('project_id', flat=True).distinct()
+
+    for project_id in project_ids:
+        bump_project_version(project_id)
+
+
+def get_cached_project_data(endpoint: str, project_id: str, build: Callable[[], Any],
+                            version: int | None = None) -> Any:
+    """
+    Return the data of `endpoint` for a project, building it only if the current
+    version of the project's data has not been cached yet.
+
+    params:
+        - endpoint: Name identifying the cached data.
+        - project_id: Id of the project the data belongs to.
+        - build: Callable returning the data. Exceptions it raises are not cached.
+        - version: The current version of the project's data, if already known.
+    """
+    if version is None:
+        version = get_project_version(project_id)
+
+    key = f'project-data:{endpoint}:{project_id}:{version}'
+
+    data = cache.get(key)
+
+    if data is None:
+        data = build()
+        cache.set(key, data, timeout=PROJECT_DATA_CACHE_TIMEOUT)
+
+    return data
@@ -9,6 +9,7 @@ from .members import (
 )
 from .phase import (
     ProjectPhaseDetailView,
+    ProjectPhaseEventsView,
     ProjectPhaseRetrieveView,
     ProjectPhaseCreateView,
     ProjectPhaseDeleteView,
@@ -26,6 +27,7 @@ __all__ = [
     'NonProjectMemberListView',
     'ProjectMemberAdditionView',
     'ProjectPhaseDetailView',
+    'ProjectPhaseEventsView',
     'ProjectPhaseRetrieveView',
     'ProjectPhaseCreateView',
     'ProjectTasksView',
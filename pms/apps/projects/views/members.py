@@ -1,64 +1,87 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
 from django.db import transaction
-from django.shortcuts import get_object_or_404
+from django.db.models import Exists, OuterRef, QuerySet
 
 from rest_framework import generics
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.exceptions import ValidationError
 
+from pms.async_views import AsyncAPIView
 from apps.users.models import User
+from apps.users.pagination import UserPagination
 from apps.users.serializers import UserRetrievalSerializer
+from apps.users.utils import filter_by_username_prefix
+from apps.organizations.models import OrganizationMember
 from apps.projects import models
+from apps.projects.utils import stats
+from apps.projects.utils.lookups import get_project_or_404
+from apps.projects.utils.memberships import invalidate_project_roles
+from apps.projects.utils.versions import bump_project_version
 
 
-class ProjectMembersListView(generics.ListAPIView):
+class ProjectMembersListView(AsyncAPIView):
     """
     Returns a list of members of a project.
     """
 
-    serializer_class = UserRetrievalSerializer
-
-    def get_queryset(self):
-        project_id = self.kwargs.get('project_id')
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        project_id = kwargs.get('project_id')
 
-        if not project_id:
-            raise ValidationError({'detail': 'No project was provided.'})
+        members = User.objects.filter(
+            projects__project_id=project_id).order_by('projects__pk')
 
-        project = get_object_or_404(models.Project, pk=project_id)
+        # the project only needs to exist, so it is looked up alongside the members.
+        _, members = await asyncio.gather(
+            sync_to_async(get_project_or_404)(project_id), list_users(members))
 
-        memberships = project.members.all()
-        members = [membership.member for membership in memberships]
-        return members
+        return Response(UserRetrievalSerializer(members, many=True).data, status=status.HTTP_200_OK)
 
 
-class NonProjectMemberListView(generics.ListAPIView):
+class NonProjectMemberListView(AsyncAPIView):
     """
     Returns a list of users who are members of an organization
-    but not members of the project.
+    but not members of the project, ordered by username.
+
+    Query params:
+        - `q`: Only include users whose username starts with it.
+        - `cursor`, `page_size`: Paginate the users. The response is then an
+          object with the page's `results` and the `next_cursor`.
     """
 
-    serializer_class = UserRetrievalSerializer
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        project_id = kwargs.get('project_id')
 
-    def get_queryset(self):
-        project_id = self.kwargs.get('project_id')
+        organization_memberships = OrganizationMember.objects.filter(
+            organization__projects__project_id=project_id, user_id=OuterRef('pk'))
+        project_memberships = models.ProjectMember.objects.filter(
+            project_id=project_id, member_id=OuterRef('pk'))
 
-        if not project_id:
-            raise ValidationError(
-                {'detail': 'No project was provided'})
+        non_project_members = filter_by_username_prefix(User.objects.filter(
+            Exists(organization_memberships), ~Exists(project_memberships)), request)
 
-        project = get_object_or_404(models.Project, pk=project_id)
+        paginator = UserPagination()
+        paginated = paginator.is_requested(request)
 
-        organization_members = User.objects.filter(
-            organizationmember__organization=project.organization)
+        if paginated:
+            users = paginator.apaginate_queryset(non_project_members, request)
+        else:
+            users = list_users(non_project_members.order_by(*paginator.ordering))
 
-        project_members = models.ProjectMember.objects.filter(
-            project=project).values_list('member_id', flat=True)
+        _, users = await asyncio.gather(sync_to_async(get_project_or_404)(project_id), users)
 
-        non_project_members = organization_members.exclude(
-            user_id__in=project_members)
+        data = UserRetrievalSerializer(users, many=True).data
 
-        return non_project_members
+        if paginated:
+            data = {'results': data, 'next_cursor': paginator.next_cursor}
+
+        return Response(data, status=status.HTTP_200_OK)
+
+
+async def list_users(users: QuerySet) -> list[User]:
+    return [user async for user in users]
 
 
 class ProjectMemberAdditionView(generics.CreateAPIView):
@@ -82,13 +105,20 @@ class ProjectMemberAdditionView(generics.CreateAPIView):
 
         users = User.objects.filter(username__in=username_set)
 
-        project = get_object_or_404(models.Project, pk=project_id)
+        project = get_project_or_404(project_id)
 
-        models.ProjectMember.objects.bulk_create(
+        memberships = models.ProjectMember.objects.bulk_create(
             [
                 models.ProjectMember(project=project, member=user)
                 for user in users
             ]
         )
 
+        # `bulk_create` doesn't send `post_save`, so invalidate the cached
+        # roles of the new members and count them here.
+        invalidate_project_roles(
+            project.pk, [membership.member_id for membership in memberships])
+        stats.add_members(project.pk, len(memberships))
+        bump_project_version(project.pk)
+
         return Response(status=status.HTTP_201_CREATED)
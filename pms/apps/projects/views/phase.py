@@ -1,14 +1,28 @@
 import re
+import asyncio
 
-from django.shortcuts import get_object_or_404
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.http import Http404, StreamingHttpResponse
 
 from rest_framework import generics
 from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
+from pms.async_views import AsyncAPIView
+from pms.conditional import make_etag, not_modified, set_etag
+from pms.pubsub import subscribe
+from pms.renderers import EventStreamRenderer, render_event
+from apps.tasks.events import phase_events_channel
 from apps.tasks.models import Task
-from apps.projects.utils.memberships import get_project_membership
+from apps.projects.permissions import IsProjectMember, IsProjectManager
+from apps.projects.utils.lookups import get_project, get_project_or_404
+from apps.projects.utils.memberships import get_project_role
+from apps.projects.utils.versions import get_cached_project_data, get_project_version
 from apps.tasks.serializers import TaskRetrievalSerializer
 from apps.projects import models, serializers
 
@@ -24,8 +38,22 @@ class ProjectPhaseRetrieveView(generics.RetrieveAPIView):
         if not project_id:
             return Response({'detail': 'No project was provided.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        project = get_object_or_404(models.Project, pk=project_id)
+        # the version is only read for existing projects.
+        project = get_project_or_404(project_id)
 
+        version = get_project_version(project.pk)
+        etag = make_etag('workflow', project.pk, version)
+
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        project_data = get_cached_project_data(
+            'workflow', project.pk, lambda: self.get_workflow(project), version=version)
+
+        return set_etag(Response(project_data, status=status.HTTP_200_OK), etag)
+
+    def get_workflow(self, project: models.Project) -> dict:
         project_data = serializers.ProjectRetrievalSerializer(project).data
 
         project_phases = project.phases.all()
@@ -35,47 +63,124 @@ class ProjectPhaseRetrieveView(generics.RetrieveAPIView):
 
         project_data['phases'] = serializer.data
 
-        return Response(project_data, status=status.HTTP_200_OK)
+        return dict(project_data)
 
 
-class ProjectPhaseDetailView(generics.RetrieveAPIView):
+class ProjectPhaseDetailView(AsyncAPIView):
     """
     Retrieve detailed information about a specific ProjectPhase.
     """
 
-    def get(self, request: Request, *args, **kwargs) -> Response:
+    async def get(self, request: Request, *args, **kwargs) -> Response:
         phase_id = kwargs.get('phase_id')
 
-        project_phase: models.ProjectPhase = get_object_or_404(
-            models.ProjectPhase, pk=phase_id)
+        try:
+            project_phase = await models.ProjectPhase.objects.select_related(
+                'project__organization').aget(pk=phase_id)
+        except models.ProjectPhase.DoesNotExist:
+            raise Http404('No ProjectPhase matches the given query.')
 
         project = project_phase.project
 
-        try:
-            membership = models.ProjectMember.objects.get(
-                project=project, member=self.request.user)
-        except models.ProjectMember.DoesNotExist:
-            return Response({'detail': 'You are not authorized to access this information'},
-                            status=status.HTTP_403_FORBIDDEN)
-
-        in_progress_tasks = Task.objects.filter(
-            project_phase=project_phase, status=Task.IN_PROGRESS)
-        on_hold_tasks = Task.objects.filter(
-            project_phase=project_phase, status=Task.ON_HOLD)
-        done_tasks = Task.objects.filter(
-            project_phase=project_phase, status=Task.DONE)
+        # Fetch the whole board in a single query, along with the user's role.
+        # Tasks loaded through the phase's related manager already reference
+        # `project_phase`, so serializing the nested phase does not hit the database again.
+        role, tasks = await asyncio.gather(
+            sync_to_async(get_project_role)(request, project.pk),
+            self.get_tasks(project_phase))
+
+        if role is None:
+            raise PermissionDenied(IsProjectMember.message)
+
+        columns = {Task.IN_PROGRESS: [], Task.ON_HOLD: [], Task.DONE: []}
+        for task in tasks:
+            columns[task.status].append(task)
 
         detail = {
             "project": serializers.ProjectRetrievalSerializer(project).data,
             "phase": serializers.ProjectPhaseSerializer(project_phase).data,
-            'role': membership.role,
-            "in_progress": TaskRetrievalSerializer(in_progress_tasks, many=True).data,
-            "on_hold": TaskRetrievalSerializer(on_hold_tasks, many=True).data,
-            "completed": TaskRetrievalSerializer(done_tasks, many=True).data,
+            'role': role,
+            "in_progress": TaskRetrievalSerializer(columns[Task.IN_PROGRESS], many=True).data,
+            "on_hold": TaskRetrievalSerializer(columns[Task.ON_HOLD], many=True).data,
+            "completed": TaskRetrievalSerializer(columns[Task.DONE], many=True).data,
         }
 
         return Response(detail, status=status.HTTP_200_OK)
 
+    async def get_tasks(self, project_phase: models.ProjectPhase) -> list[Task]:
+        return [task async for task in project_phase.phase_tasks.all()]
+
+
+class ProjectPhaseEventsView(AsyncAPIView):
+    """
+    Stream the changes to the board of a project phase as server-sent events.
+
+    Each event carries JSON data:
+        - `task_created`, `task_updated`: `{"task": <task>}`
+        - `task_status_changed`: `{"task_id", "previous_status", "status", "version"}`
+        - `task_assigned`, `task_unassigned`: `{"task_id", "username"}`
+        - `task_deleted`: `{"task_id"}`
+
+    A `resync` event is sent when events may have been missed (e.g. the
+    client reads too slowly), after which the stream ends: the client should
+    fetch the board again and reconnect.
+    """
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, EventStreamRenderer]
+
+    # Comments are sent when there are no events, so that proxies don't close the connection.
+    heartbeat_interval = 15  # seconds
+
+    # How long browsers wait before reconnecting after the connection is lost.
+    retry_interval = 3000  # milliseconds
+
+    async def get(self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+        phase_id = kwargs.get('phase_id')
+
+        try:
+            project_id = await models.ProjectPhase.objects.values_list(
+                'project_id', flat=True).aget(pk=phase_id)
+        except models.ProjectPhase.DoesNotExist:
+            raise Http404('No ProjectPhase matches the given query.')
+
+        if await sync_to_async(get_project_role)(request, project_id) is None:
+            raise PermissionDenied(IsProjectMember.message)
+
+        # the stream doesn't query the database but can stay open for hours,
+        # so release the connection of the request now.
+        await sync_to_async(self.close_database_connection)()
+
+        response = StreamingHttpResponse(self.stream_events(phase_events_channel(phase_id)),
+                                         content_type=EventStreamRenderer.media_type)
+        response['Cache-Control'] = 'no-cache'
+        # stop nginx from buffering the events.
+        response['X-Accel-Buffering'] = 'no'
+
+        return response
+
+    @staticmethod
+    def close_database_connection() -> None:
+        # inside a transaction (e.g. in tests), closing the connection
+        # would break the transaction.
+        if not connection.in_atomic_block:
+            connection.close()
+
+    async def stream_events(self, channel: str):
+        with subscribe(channel) as subscription:
+            yield f'retry: {self.retry_interval}\n\n'
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.get(), self.heartbeat_interval)
+                except TimeoutError:
+                    yield ': keep-alive\n\n'
+                    continue
+
+                if event is None:
+                    yield render_event('resync', {})
+                    return
+
+                yield event
+
 
 class ProjectPhaseCreateView(generics.CreateAPIView):
     """
@@ -86,6 +191,7 @@ class ProjectPhaseCreateView(generics.CreateAPIView):
     """
 
     serializer_class = serializers.ProjectPhaseCreateSerializer
+    permission_classes = [IsAuthenticated, IsProjectManager]
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         project_id = kwargs.get('project_id')
@@ -95,16 +201,11 @@ class ProjectPhaseCreateView(generics.CreateAPIView):
             return Response({'detail': 'Please provide a name for your new project workflow.'},
                             status=status.HTTP_400_BAD_REQUEST)
         try:
-            project = models.Project.objects.get(pk=project_id)
+            project = get_project(project_id)
         except models.Project.DoesNotExist:
             return Response({'detail': 'Could not get the project.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            models.ProjectMember.objects.get(
-                project=project, member=self.request.user, role=models.ProjectMember.MANAGER)
-        except models.ProjectMember.DoesNotExist:
-            return Response({'detail': 'You are not authorized to perform this action'},
-                            status=status.HTTP_403_FORBIDDEN)
+        self.check_object_permissions(request, project)
 
         data = {
             'project': project_id,
@@ -125,6 +226,7 @@ class ProjectPhaseDeleteView(generics.DestroyAPIView):
     """
     Handle DELETE requests to remove a project phase.
     """
+    permission_classes = [IsAuthenticated, IsProjectManager]
 
     def delete(self, request: Request, *args, **kwargs) -> Response:
         phase_id = kwargs.get('phase_id')
@@ -135,11 +237,7 @@ class ProjectPhaseDeleteView(generics.DestroyAPIView):
             return Response({'detail': 'Could not find the project phase'},
                             status=status.HTTP_404_NOT_FOUND)
 
-        membership = get_project_membership(phase.project, request.user)
-
-        if not membership or membership.role != models.ProjectMember.MANAGER:
-            return Response({'detail': 'You are not authorized to perform this action'},
-                            status=status.HTTP_403_FORBIDDEN)
+        self.check_object_permissions(request, phase)
 
         phase.delete()
 
@@ -150,6 +248,7 @@ class ProjectPhaseRenameView(generics.UpdateAPIView):
     """
     Handle PUT requests to rename a project phase.
     """
+    permission_classes = [IsAuthenticated, IsProjectManager]
 
     def put(self, request: Request, *args, **kwargs) -> Response:
         phase_id: str = kwargs.get('phase_id')
@@ -174,14 +273,9 @@ class ProjectPhaseRenameView(generics.UpdateAPIView):
             return Response({'detail': 'Could not find the project phase'},
                             status=status.HTTP_404_NOT_FOUND)
 
-        membership = get_project_membership(
-            project_phase.project, request.user)
-
-        if not membership or membership.role != models.ProjectMember.MANAGER:
-            return Response({'detail': 'You are not authorized to perform this action'},
-                            status=status.HTTP_403_FORBIDDEN)
+        self.check_object_permissions(request, project_phase)
 
-        if models.ProjectPhase.objects.filter(project=project_phase.project, phase_name__iexact=new_name).exists():
+        if models.ProjectPhase.objects.filter(project_id=project_phase.project_id, phase_name__iexact=new_name).exists():
             return Response({'detail': 'A project phase with that name already exists within the project'},
                             status=status.HTTP_400_BAD_REQUEST)
 
@@ -9,6 +9,7 @@ from pms.utils import camel_case_to_snake_case
 
 from apps.projects import models, serializers
 from apps.organizations.models import OrganizationMember
+from apps.organizations.utils import get_organization_role
 
 
 class ProjectCreateView(generics.CreateAPIView):
@@ -42,16 +43,15 @@ class ProjectCreateView(generics.CreateAPIView):
             return Response({'organization': ['This field is required']},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            membership = OrganizationMember.objects.get(
-                organization_id=organization_id, user=self.request.user)
-        except OrganizationMember.DoesNotExist:
+        role = get_organization_role(request, organization_id)
+
+        if not role:
             # Dont allow a person who is not a member of the organization to create a project.
             return Response({
                 'non_field_errors': ['You must be a member of the organization to create a project']},
                 status=status.HTTP_400_BAD_REQUEST)
 
-        if membership.role != 'Admin':
+        if role != OrganizationMember.ADMIN:
             return Response({
                 'non_field_errors': ['You dont have the necessary permissions to \
                  create a project for this organization']},
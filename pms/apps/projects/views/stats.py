@@ -1,11 +1,13 @@
-from django.db.models import Count, Case, When, IntegerField
-from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from pms.conditional import make_etag, not_modified, set_etag
 from apps.projects import models
+from apps.projects.utils.lookups import get_project_or_404
+from apps.projects.utils.stats import refresh_project_stats
+from apps.projects.utils.versions import get_cached_project_data, get_project_version
 
 
 class ProjectStatsView(APIView):
@@ -21,30 +23,39 @@ class ProjectStatsView(APIView):
         if not pk:
             return Response({'detail': 'No project was provided'}, status=status.HTTP_400_BAD_REQUEST)
 
-        project = get_object_or_404(models.Project, pk=pk)
+        # the version is only read for existing projects.
+        project = get_project_or_404(pk)
 
-        task_counts = project.tasks.aggregate(
-            total_tasks=Count('task_id'),
-            in_progress=Count(
-                Case(When(status='IN_PROGRESS', then=1), output_field=IntegerField())),
-            on_hold=Count(Case(When(status='ON_HOLD', then=1),
-                          output_field=IntegerField())),
-            completed=Count(
-                Case(When(status='DONE', then=1), output_field=IntegerField())),
-        )
+        version = get_project_version(project.pk)
+        etag = make_etag('stats', project.pk, version)
 
-        total_tasks = task_counts['total_tasks']
-        completed_tasks = task_counts['completed']
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        stats = get_cached_project_data(
+            'stats', project.pk, lambda: self.get_stats(project), version=version)
+
+        return set_etag(Response(stats, status=status.HTTP_200_OK), etag)
+
+    def get_stats(self, project: models.Project) -> dict:
+        try:
+            project_stats = models.ProjectStats.objects.get(project=project)
+        except models.ProjectStats.DoesNotExist:
+            project_stats = refresh_project_stats(project)
+
+        total_tasks = project_stats.tasks
+        completed_tasks = project_stats.tasks_done
 
         stats = {
             'project_name': project.project_name,
             'tasks': total_tasks,
-            'members': project.members.count(),
+            'members': project_stats.members,
             'description': project.description,
-            'tasks_in_progress': task_counts['in_progress'],
-            'tasks_on_hold': task_counts['on_hold'],
-            'tasks_completed': task_counts['completed'],
+            'tasks_in_progress': project_stats.tasks_in_progress,
+            'tasks_on_hold': project_stats.tasks_on_hold,
+            'tasks_completed': completed_tasks,
             'percentage_completion': (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0,
         }
 
-        return Response(stats, status=status.HTTP_200_OK)
+        return stats
@@ -1,34 +1,134 @@
-from django.shortcuts import get_object_or_404
+import json
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
 
 from rest_framework import status
-from rest_framework.views import APIView
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from apps.projects import models, serializers
+from pms.async_views import AsyncAPIView
+from pms.renderers import NDJSONRenderer, render_json_line
+from apps.projects import serializers
+from apps.projects.utils.lookups import get_project_or_404
 
+from apps.tasks.models import Task
+from apps.tasks.pagination import TaskPagination
 from apps.tasks.serializers import TaskRetrievalSerializer
 
 
-class ProjectTasksView(APIView):
+class ProjectTasksView(AsyncAPIView):
     """
-    Returns all the tasks related to a project.
+    Returns the tasks related to a project, ordered by deadline.
+
+    Every task is returned unless a page is requested with the `cursor` or
+    `page_size` query parameter. Pages are keyed by a cursor: the
+    `next_cursor` of the response should be sent back as the `cursor` query
+    parameter to get the next page.
+
+    Supported query parameters:
+        - `status`: Only return tasks with this status.
+        - `phase`: Only return tasks in the project phase with this id.
+        - `assignee`: Only return tasks assigned to the user with this username.
+        - `cursor`, `page_size`: Pagination.
+        - `stream`: When set to `1`, stream every matching task instead of a
+          single page. Requesting `application/x-ndjson` streams one task per line.
     """
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
 
-    def get(self, request: Request, *args, **kwargs) -> Response:
+    # Number of rows fetched from the database cursor at a time when streaming.
+    stream_chunk_size = 500
+
+    async def get(self, request: Request, *args, **kwargs) -> Response:
         project_id = self.kwargs.get('project_id')
 
-        if not project_id:
-            return Response({'detail': 'No project was provided.'}, status=status.HTTP_400_BAD_REQUEST)
+        task_status = request.query_params.get('status')
+        if task_status and task_status not in dict(Task.TASK_STATUS_CHOICES):
+            return Response({'detail': "Invalid status choice. Status must either be "
+                             "'IN_PROGRESS', 'ON_HOLD' or 'DONE'"}, status=status.HTTP_400_BAD_REQUEST)
 
-        project = get_object_or_404(models.Project, pk=project_id)
+        tasks = self.filter_tasks(
+            Task.objects.filter(project_id=project_id).select_related('project_phase'))
 
-        project_detail = serializers.ProjectRetrievalSerializer(project).data
+        if isinstance(request.accepted_renderer, NDJSONRenderer):
+            await sync_to_async(get_project_or_404)(project_id)
+            return StreamingHttpResponse(self.stream_ndjson(tasks),
+                                         content_type=NDJSONRenderer.media_type)
+
+        if request.query_params.get('stream') == '1':
+            project = await sync_to_async(get_project_or_404)(project_id)
+            project_detail = serializers.ProjectRetrievalSerializer(project).data
+            return StreamingHttpResponse(self.stream_json(project_detail, tasks),
+                                         content_type='application/json')
 
-        tasks = project.tasks.all()
+        paginator = TaskPagination()
 
-        tasks_data = TaskRetrievalSerializer(tasks, many=True).data
+        if paginator.is_requested(request):
+            page = paginator.apaginate_queryset(tasks, request)
+        else:
+            page = list_tasks(tasks.order_by(*paginator.ordering))
 
-        project_detail['tasks'] = tasks_data
+        # the tasks only depend on the project's id, so the project is looked up alongside them.
+        project, page = await asyncio.gather(
+            sync_to_async(get_project_or_404)(project_id), page)
+
+        project_detail = serializers.ProjectRetrievalSerializer(project).data
+        project_detail['tasks'] = TaskRetrievalSerializer(page, many=True).data
+        project_detail['next_cursor'] = paginator.next_cursor
 
         return Response(project_detail, status=status.HTTP_200_OK)
+
+    async def iter_tasks(self, tasks):
+        """
+        Serialize tasks one at a time while reading them from a server-side cursor,
+        so that the whole queryset is never held in memory.
+        """
+        serializer = TaskRetrievalSerializer()
+        tasks = tasks.order_by(*TaskPagination.ordering)
+
+        async for task in tasks.aiterator(chunk_size=self.stream_chunk_size):
+            yield serializer.to_representation(task)
+
+    async def stream_ndjson(self, tasks):
+        async for task in self.iter_tasks(tasks):
+            yield render_json_line(task)
+
+    async def stream_json(self, project_detail, tasks):
+        """
+        Stream the same document as the paginated response, with every task
+        in `tasks` and no next page.
+        """
+        # Open the project's object and leave it unclosed to append the tasks.
+        yield json.dumps(project_detail, cls=JSONEncoder)[:-1] + ', "tasks": ['
+
+        separator = ''
+        async for task in self.iter_tasks(tasks):
+            yield separator + json.dumps(task, cls=JSONEncoder)
+            separator = ', '
+
+        yield '], "next_cursor": null}'
+
+    def filter_tasks(self, tasks):
+        query_params = self.request.query_params
+
+        task_status = query_params.get('status')
+        phase_id = query_params.get('phase')
+        assignee = query_params.get('assignee')
+
+        if task_status:
+            tasks = tasks.filter(status=task_status)
+
+        if phase_id:
+            tasks = tasks.filter(project_phase_id=phase_id)
+
+        if assignee:
+            tasks = tasks.filter(assignments__user__username=assignee)
+
+        return tasks
+
+
+async def list_tasks(tasks) -> list[Task]:
+    return [task async for task in tasks]
@@ -5,6 +5,7 @@ from rest_framework import status
 
 from rest_framework.response import Response
 
+from pms.search import ranked_search
 from pms.utils import camel_case_to_snake_case
 from apps.projects import models, serializers
 
@@ -44,6 +45,8 @@ class TemplateCreateView(generics.CreateAPIView):
 class TemplateSearchView(generics.ListAPIView):
     """
     Handles searching for a template by name.
+
+    Returns at most `SEARCH_LIMIT` templates, best matches first.
     """
 
     serializer_class = serializers.TemplateSearchSerializer
@@ -55,5 +58,5 @@ class TemplateSearchView(generics.ListAPIView):
         if not name:
             return []
 
-        return models.Template.objects.filter(
-            template_name__icontains=name)
+        return ranked_search(models.Template.objects.select_related('industry'),
+                             'template_name', name)
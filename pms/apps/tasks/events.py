@@ -0,0 +1,47 @@
+from typing import Callable
+
+from pms.pubsub import publish
+from pms.renderers import render_event
+from apps.tasks import models, serializers
+
+
+def phase_events_channel(phase_id: str) -> str:
+    return f'phase:{phase_id}'
+
+
+def publish_phase_event(phase_id: str, event: str, data: dict | Callable[[], dict]) -> None:
+    """
+    Send an event to the clients following the board of a project phase,
+    once the current transaction commits.
+
+    `data` may be a callable, called once the transaction commits.
+    """
+    publish(phase_events_channel(phase_id),
+            lambda: render_event(event, data() if callable(data) else data))
+
+
+def publish_task_created(task: models.Task) -> None:
+    # serialized on commit: not at all if the transaction is rolled back.
+    publish_phase_event(task.project_phase_id, 'task_created',
+                        lambda: {'task': serializers.TaskRetrievalSerializer(task).data})
+
+
+def publish_task_updated(task: models.Task) -> None:
+    publish_phase_event(task.project_phase_id, 'task_updated',
+                        lambda: {'task': serializers.TaskRetrievalSerializer(task).data})
+
+
+def publish_task_status_changed(phase_id: str, task_id: str, previous_status: str,
+                                status: str, version: int) -> None:
+    publish_phase_event(phase_id, 'task_status_changed', {
+        'task_id': task_id, 'previous_status': previous_status,
+        'status': status, 'version': version})
+
+
+def publish_task_deleted(task: models.Task) -> None:
+    publish_phase_event(task.project_phase_id, 'task_deleted', {'task_id': task.pk})
+
+
+def publish_task_assignment(phase_id: str, task_id: str, username: str, assigned: bool = True) -> None:
+    publish_phase_event(phase_id, 'task_assigned' if assigned else 'task_unassigned',
+                        {'task_id': task_id, 'username': username})
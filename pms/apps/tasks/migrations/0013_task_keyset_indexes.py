@@ -0,0 +1,27 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0027_delete_customphase'),
+        ('tasks', '0012_alter_task_task_name'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='task_name',
+            field=models.CharField(db_comment='Task name unique within a phase of a project', max_length=100, verbose_name='Task name'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'deadline', 'task_id'], name='task_project_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'status', 'deadline', 'task_id'], name='task_project_status_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 04:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0013_task_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='version',
+            field=models.PositiveIntegerField(default=0, help_text='Incremented on every update of the task, for optimistic concurrency.', verbose_name='Task version'),
+        ),
+    ]
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from apps.projects.models import ProjectPhase, Project
 from apps.users.models import User
 
@@ -40,6 +40,38 @@ class Task(models.Model):
         help_text="The current status of the task.",
         verbose_name="Task status"
     )
+    version = models.PositiveIntegerField(
+        default=0, help_text="Incremented on every update of the task, for optimistic concurrency.",
+        verbose_name="Task version")
+
+    class Meta:
+        indexes = [
+            # Support listing a project's tasks ordered by deadline,
+            # optionally filtered by status, with keyset pagination.
+            models.Index(fields=['project', 'deadline', 'task_id'],
+                         name='task_project_deadline_idx'),
+            models.Index(fields=['project', 'status', 'deadline', 'task_id'],
+                         name='task_project_status_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        task = super().from_db(db, field_names, values)
+        # Remember the saved status to detect status changes when the task is saved.
+        task._saved_status = task.__dict__.get('status')
+        return task
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            self.version += 1
+
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'version'}
+
+        # Save the task and update the task counters of its project atomically.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
 
     def __str__(self):
         return f'{self.project.project_name} | {self.task_name}'
@@ -0,0 +1,8 @@
+from pms.pagination import KeysetPagination
+
+
+class TaskPagination(KeysetPagination):
+    """
+    Paginates tasks by deadline, using the task id to break ties.
+    """
+    ordering = ('deadline', 'task_id')
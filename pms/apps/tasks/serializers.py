@@ -1,11 +1,15 @@
+from collections import Counter
 from datetime import datetime, timezone
 from django.db import transaction
+from django.db.models.functions import Lower
 from rest_framework import serializers
 
-from apps.projects.models import ProjectPhase
+from apps.projects.models import Project, ProjectPhase
 from apps.projects.serializers import ProjectPhaseSerializer
+from apps.projects.utils import stats
+from apps.projects.utils.versions import bump_project_version
 from apps.users.models import User
-from . import models
+from . import events, models
 
 
 class TaskCreationSerializser(serializers.ModelSerializer):
@@ -90,6 +94,184 @@ class TaskCreationSerializser(serializers.ModelSerializer):
                   'deadline', 'description']
 
 
+class TaskImportListSerializer(serializers.ListSerializer):
+    """
+    Validates and creates a batch of imported tasks.
+
+    Every row is validated on its own first. The checks that need the database
+    (the phase exists, the task name is unique in its phase) are then run for
+    the whole batch with a fixed number of queries. Errors are reported per
+    row, in the order of the rows, with an empty dict for valid rows.
+    """
+    # ListSerializer sets `max_length` from its arguments.
+    max_tasks = 1000
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            raise serializers.ValidationError({
+                'non_field_errors': ['Expected a list of tasks.']
+            })
+
+        if not data:
+            raise serializers.ValidationError({
+                'non_field_errors': ['No tasks were provided.']
+            })
+
+        if len(data) > self.max_tasks:
+            raise serializers.ValidationError({
+                'non_field_errors': [f'A maximum of {self.max_tasks} tasks can be imported at once.']
+            })
+
+        rows, errors = [], []
+
+        for item in data:
+            try:
+                rows.append(self.child.run_validation(item))
+                errors.append({})
+            except serializers.ValidationError as exc:
+                rows.append(None)
+                errors.append(exc.detail)
+
+        self.validate_rows(rows, errors)
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        return rows
+
+    def validate_rows(self, rows: list, errors: list) -> None:
+        """
+        Validate the rows against the project and its existing tasks.
+        """
+        project: Project = self.context['project']
+        phases = list(project.phases.all())
+        phases_by_id = {phase.pk: phase for phase in phases}
+        phases_by_name = {}
+        for phase in phases:
+            phases_by_name.setdefault(phase.phase_name.casefold(), phase)
+
+        # resolve the phase of every row.
+        for row, row_errors in zip(rows, errors):
+            if row is None:
+                continue
+
+            if 'project_phase' in row:
+                phase = phases_by_id.get(row['project_phase'])
+            else:
+                phase = phases_by_name.get(row['phase_name'].casefold())
+
+            if phase is None:
+                row_errors['project_phase'] = [
+                    'Could not get the phase of the project']
+            else:
+                row['project_phase'] = phase
+
+        valid_rows = [row for row, row_errors in zip(rows, errors)
+                      if row is not None and not row_errors]
+
+        if not valid_rows:
+            return
+
+        # task names already used in the phases, fetched with a single query.
+        existing_names = set(models.Task.objects
+                             .filter(project_phase__in={row['project_phase'] for row in valid_rows})
+                             .annotate(name=Lower('task_name'))
+                             .filter(name__in={row['task_name'].lower() for row in valid_rows})
+                             .values_list('project_phase_id', 'name'))
+
+        for row, row_errors in zip(rows, errors):
+            if row is None or row_errors:
+                continue
+
+            name = (row['project_phase'].pk, row['task_name'].lower())
+
+            if name in existing_names:
+                row_errors['task_name'] = [
+                    'A task with this name already exists in this phase.']
+            existing_names.add(name)
+
+            # enusre the deadline of a task is not later than the deadline of the project.
+            if row['deadline'] > project.deadline:
+                row_errors['deadline'] = [
+                    "The deadline of a task cannot be later than the project's deadline date."]
+
+    @transaction.atomic
+    def create(self, validated_data):
+        project: Project = self.context['project']
+
+        tasks = models.Task.objects.bulk_create([
+            models.Task(
+                project=project,
+                project_phase=row['project_phase'],
+                task_name=row['task_name'],
+                description=row['description'],
+                deadline=row['deadline'],
+                status=row['status'],
+            )
+            for row in validated_data
+        ], batch_size=500)
+
+        # bulk_create doesn't send signals, so the counters and the
+        # project version are updated here.
+        counts = Counter((task.project_phase_id, task.status) for task in tasks)
+        for (phase_id, status), count in counts.items():
+            stats.add_tasks(project.pk, phase_id, status, count)
+
+        bump_project_version(project.pk)
+
+        for task in tasks:
+            events.publish_task_created(task)
+
+        return tasks
+
+
+class TaskImportSerializer(serializers.Serializer):
+    """
+    Serializer for a single row of a task import.
+
+    The phase is given either by its id (`project_phase`) or by its name (`phase_name`).
+    Use with `many=True`.
+    """
+    project_phase = serializers.CharField(required=False)
+    phase_name = serializers.CharField(required=False)
+    task_name = serializers.CharField()
+    deadline = serializers.DateField()
+    description = serializers.CharField()
+    status = serializers.ChoiceField(
+        choices=models.Task.TASK_STATUS_CHOICES, default=models.Task.IN_PROGRESS)
+
+    validate_task_name = TaskCreationSerializser.validate_task_name
+    validate_deadline = TaskCreationSerializser.validate_deadline
+    validate_description = TaskCreationSerializser.validate_description
+
+    def validate(self, attrs):
+        if not attrs.get('project_phase') and not attrs.get('phase_name'):
+            raise serializers.ValidationError({
+                'project_phase': 'Either the phase id or the phase name is required.'
+            })
+
+        return attrs
+
+    class Meta:
+        list_serializer_class = TaskImportListSerializer
+
+
+class TaskVersionSerializer(serializers.Serializer):
+    """
+    A task and, optionally, the version of the task the client last saw.
+    """
+    task_id = serializers.CharField()
+    version = serializers.IntegerField(required=False, min_value=0)
+
+
+class TaskBulkStatusUpdateSerializer(serializers.Serializer):
+    """
+    Serializer for moving many tasks to the same status.
+    """
+    status = serializers.ChoiceField(choices=models.Task.TASK_STATUS_CHOICES)
+    tasks = TaskVersionSerializer(many=True, allow_empty=False, max_length=500)
+
+
 class TaskAssignMentSerializer(serializers.Serializer):
     """
     Serializer for assigning users to a task.
@@ -137,6 +319,11 @@ class TaskAssignMentSerializer(serializers.Serializer):
         models.TaskAssignment.objects.bulk_create(
             new_assignments, ignore_conflicts=True)
 
+        # `bulk_create` doesn't send `post_save`; task details list their assignees.
+        bump_project_version(task.project_id)
+        for assignment in new_assignments:
+            events.publish_task_assignment(task.project_phase_id, task.pk, assignment.user.username)
+
         return {'task': task, 'assigned_users': [user.username for user in users]}
 
 
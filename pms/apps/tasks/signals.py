@@ -0,0 +1,117 @@
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from pms.utils import is_cascade_deletion
+from apps.tasks import events
+from apps.tasks.models import Task, TaskAssignment
+from apps.projects.utils import stats
+from apps.projects.utils.versions import bump_assignee_project_versions, bump_project_version
+from apps.users.models import User
+
+
+# Connected before `count_saved_task`, which records the saved status.
+@receiver(post_save, sender=Task)
+def publish_saved_task(sender, instance: Task, created: bool, raw: bool = False, **kwargs):
+    if raw:
+        return
+
+    saved_status = getattr(instance, '_saved_status', None)
+
+    if created:
+        events.publish_task_created(instance)
+    elif saved_status and saved_status != instance.status:
+        events.publish_task_status_changed(instance.project_phase_id, instance.pk,
+                                           saved_status, instance.status, instance.version)
+    else:
+        events.publish_task_updated(instance)
+
+
+# Tasks deleted along with their phase or project are not handled one by
+# one: the phase or project takes care of the counters and the version, and
+# its board goes away.
+@receiver(post_delete, sender=Task)
+def publish_deleted_task(sender, instance: Task, origin=None, **kwargs):
+    if not is_cascade_deletion(sender, origin):
+        events.publish_task_deleted(instance)
+
+
+@receiver(post_save, sender=Task)
+def count_saved_task(sender, instance: Task, created: bool, raw: bool = False, **kwargs):
+    if raw:
+        return
+
+    if created:
+        stats.add_tasks(instance.project_id,
+                        instance.project_phase_id, instance.status)
+    else:
+        saved_status = getattr(instance, '_saved_status', None)
+        if saved_status:
+            stats.move_tasks(instance.project_id, instance.project_phase_id,
+                             saved_status, instance.status)
+
+    instance._saved_status = instance.status
+
+
+@receiver(post_delete, sender=Task)
+def count_deleted_task(sender, instance: Task, origin=None, **kwargs):
+    if is_cascade_deletion(sender, origin):
+        return
+
+    status = getattr(instance, '_saved_status', None) or instance.status
+    stats.add_tasks(instance.project_id,
+                    instance.project_phase_id, status, -1)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def bump_version_of_project(sender, instance: Task, origin=None, **kwargs):
+    if not is_cascade_deletion(sender, origin):
+        bump_project_version(instance.project_id)
+
+
+# Assignments deleted along with their task are covered by the task's
+# deletion, and those of a deleted user by `unassign_deleted_user`.
+@receiver(post_save, sender=TaskAssignment)
+@receiver(post_delete, sender=TaskAssignment)
+def bump_version_of_assigned_project(sender, instance: TaskAssignment, origin=None, **kwargs):
+    # task details list their assignees.
+    if not is_cascade_deletion(sender, origin):
+        bump_project_version(instance.task.project_id)
+
+
+@receiver(post_save, sender=TaskAssignment)
+@receiver(post_delete, sender=TaskAssignment)
+def publish_task_assignment(sender, instance: TaskAssignment, origin=None, **kwargs):
+    if not is_cascade_deletion(sender, origin):
+        events.publish_task_assignment(instance.task.project_phase_id, instance.task_id,
+                                       instance.user.username, assigned=kwargs['signal'] is post_save)
+
+
+# Fields of users shown in the task details they are assigned to.
+ASSIGNEE_FIELDS = {'username', 'profile_picture'}
+
+
+@receiver(post_save, sender=User)
+def outdate_task_details_of_assignee(sender, instance: User, created: bool, raw: bool = False,
+                                     update_fields=None, **kwargs):
+    if created or raw:
+        return
+
+    if update_fields is None or ASSIGNEE_FIELDS & set(update_fields):
+        bump_assignee_project_versions(instance.pk)
+
+
+@receiver(pre_delete, sender=User)
+def unassign_deleted_user(sender, instance: User, **kwargs):
+    """
+    Update the boards of the tasks a deleted user was assigned to, with a
+    single query instead of one per assignment.
+    """
+    tasks = list(Task.objects.filter(assignments__user=instance).values_list(
+        'task_id', 'project_id', 'project_phase_id'))
+
+    for project_id in {project_id for _, project_id, _ in tasks}:
+        bump_project_version(project_id)
+
+    for task_id, _, phase_id in tasks:
+        events.publish_task_assignment(phase_id, task_id, instance.username, assigned=False)
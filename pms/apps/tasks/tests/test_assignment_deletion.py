@@ -5,6 +5,7 @@ from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 
 from apps.projects.models import ProjectPhase
+from apps.projects.utils.versions import get_project_version
 from apps.tasks.models import TaskAssignment
 from apps.users.models import User
 
@@ -98,6 +99,19 @@ class TaskAssignMentDeletionTests(APITestCase):
                 task=self.task['task_id'], user=user)
         )
 
+    def test_deleting_assignee_outdates_task_detail(self):
+        """
+        Test that the assignments of a deleted user are removed from the
+        cached task details.
+        """
+        project_id = self.project.data['project_id']
+        version = get_project_version(project_id)
+
+        self.member_client.delete(reverse('account_delete'))
+
+        self.assertFalse(TaskAssignment.objects.exists())
+        self.assertNotEqual(get_project_version(project_id), version)
+
     def test_deletion_requires_project_manager_role(self):
         """
         Test that a non-project manager cannot delete a task assignment.
@@ -81,3 +81,45 @@ class TaskAssignMentTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIsInstance(response.data, list)
         self.assertEqual(response.data[0]['username'], self.user2.username)
+
+    def test_non_task_assignees_are_retrieved_in_one_query(self):
+        # one query finds the task's project, the other the non-assignees.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_non_task_assignees_can_be_filtered_by_username_prefix(self):
+        user3 = User.objects.create_user(
+            username='otheruser', email='testmail3@test.com', password='securepassword123'
+        )
+        ProjectMember.objects.create(project=self.project, member=user3)
+
+        response = self.client.get(self.url, {'q': 'Other'})
+
+        self.assertEqual([user['username'] for user in response.data], ['otheruser'])
+
+    def test_non_task_assignees_can_be_paginated(self):
+        for i in range(3):
+            user = User.objects.create_user(
+                username=f'user{i}', email=f'user{i}@test.com', password='securepassword123'
+            )
+            ProjectMember.objects.create(project=self.project, member=user)
+
+        response = self.client.get(self.url, {'page_size': 3})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['username'] for user in response.data['results']],
+                         ['testuser2', 'user0', 'user1'])
+
+        response = self.client.get(
+            self.url, {'page_size': 3, 'cursor': response.data['next_cursor']})
+
+        self.assertEqual([user['username'] for user in response.data['results']], ['user2'])
+        self.assertIsNone(response.data['next_cursor'])
+
+    def test_non_existent_task_fails(self):
+        url = reverse('non_assignees', kwargs={'task_id': '123'})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
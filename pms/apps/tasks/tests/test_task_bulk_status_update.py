@@ -0,0 +1,136 @@
+import datetime
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from apps.projects import models
+from apps.tasks.models import Task
+from apps.users.models import User
+from apps.organizations.models import Organization
+
+
+class BulkUpdateTaskStatusTests(APITestCase):
+    """
+    Tests for moving many tasks to a status at once.
+    """
+
+    def setUp(self):
+        ############################
+        # create a user
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        ####################################
+        # create an organization and a project.
+        self.organization = Organization.objects.create(
+            organization_name='Test org', organization_name_slug='test-org',
+            organization_password='securepassword123')
+
+        self.project = models.Project.objects.create(
+            organization=self.organization, project_name="Test project",
+            description='Testing project creation',
+            deadline=datetime.date.today() + datetime.timedelta(days=30))
+
+        models.ProjectMember.objects.create(
+            project=self.project, member=self.user)
+
+        self.phase = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+
+        ############################
+        # create tasks
+        self.tasks = [
+            Task.objects.create(project=self.project, project_phase=self.phase,
+                                task_name=f'test task {i}', deadline=self.project.deadline)
+            for i in range(5)
+        ]
+
+        self.url = reverse('bulk_update_task_status')
+
+    def data(self, tasks: list[Task], new_status: str = Task.DONE, versions: dict | None = None) -> dict:
+        versions = versions or {}
+        tasks = [{'task_id': task.pk} for task in tasks]
+
+        for task in tasks:
+            if task['task_id'] in versions:
+                task['version'] = versions[task['task_id']]
+
+        return {'status': new_status, 'tasks': tasks}
+
+    def test_task_statuses_are_updated(self):
+        response = self.client.put(
+            self.url, self.data(self.tasks[:3]), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            Task.objects.filter(status=Task.DONE).count(), 3)
+        self.assertEqual({task['version'] for task in response.data['tasks']}, {1})
+
+        stats = models.ProjectStats.objects.get(project=self.project)
+        self.assertEqual(stats.tasks_done, 3)
+        self.assertEqual(stats.tasks_in_progress, 2)
+
+    def test_query_count_does_not_depend_on_task_count(self):
+        with CaptureQueriesContext(connection) as few_tasks:
+            self.client.put(self.url, self.data(self.tasks[:1]), format='json')
+
+        with CaptureQueriesContext(connection) as many_tasks:
+            self.client.put(self.url, self.data(
+                self.tasks[1:], Task.ON_HOLD), format='json')
+
+        self.assertEqual(len(few_tasks), len(many_tasks))
+
+    def test_stale_version_conflicts(self):
+        task = self.tasks[0]
+        task.task_name = 'renamed task'
+        task.save()
+
+        response = self.client.put(self.url, self.data(
+            self.tasks[:2], versions={task.pk: 0, self.tasks[1].pk: 0}), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['conflicts'], [
+                         {'task_id': task.pk, 'version': 1}])
+        self.assertFalse(Task.objects.filter(status=Task.DONE).exists())
+
+        response = self.client.put(self.url, self.data(
+            self.tasks[:2], versions={task.pk: 1, self.tasks[1].pk: 0}), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_non_members_cant_update_tasks(self):
+        other_project = models.Project.objects.create(
+            organization=self.organization, project_name="Other project",
+            project_name_slug='other-project', deadline=self.project.deadline)
+        other_phase = models.ProjectPhase.objects.create(
+            project=other_project, phase_name='Design')
+        other_task = Task.objects.create(project=other_project, project_phase=other_phase,
+                                         task_name='other task', deadline=self.project.deadline)
+
+        response = self.client.put(self.url, self.data(
+            [self.tasks[0], other_task]), format='json')
+
+        # answered like a missing task, so that task ids can't be probed.
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['task_ids'], [other_task.pk])
+        self.assertFalse(Task.objects.filter(status=Task.DONE).exists())
+
+    def test_missing_tasks_return_404(self):
+        data = self.data(self.tasks[:1])
+        data['tasks'].append({'task_id': 'unknown'})
+
+        response = self.client.put(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['task_ids'], ['unknown'])
+
+    def test_invalid_status_fails(self):
+        response = self.client.put(self.url, self.data(
+            self.tasks, 'UNKNOWN'), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -1,4 +1,5 @@
 import datetime
+from unittest import mock
 
 from django.urls import reverse
 from rest_framework.test import APIClient, APITestCase
@@ -6,6 +7,7 @@ from rest_framework import status
 
 from apps.tasks import models
 from apps.projects.models import ProjectPhase
+from apps.users import profile_pictures
 from apps.users.models import User
 
 
@@ -87,3 +89,58 @@ class TaskDetailTest(APITestCase):
         response = client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_unchanged_task_detail_is_not_sent_again(self):
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_task_changes_change_the_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        task = models.Task.objects.get(pk=self.task.data['task_id'])
+        task.status = models.Task.DONE
+        task.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], models.Task.DONE)
+
+    def test_assignments_change_the_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        self.client.post(reverse('assign_task', kwargs={'task_id': self.task.data['task_id']}),
+                         {'assignees': [self.user.username]}, format='json')
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['assignees']), 1)
+
+    def assign_user(self) -> str:
+        """
+        Assign the user to the task and return the ETag of the task detail.
+        """
+        self.client.post(reverse('assign_task', kwargs={'task_id': self.task.data['task_id']}),
+                         {'assignees': [self.user.username]}, format='json')
+
+        return self.client.get(self.url)['ETag']
+
+    def test_assignee_username_changes_change_the_etag(self):
+        etag = self.assign_user()
+
+        self.client.put(reverse('username_update'), {'username': 'newusername'})
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['assignees'][0]['username'], 'newusername')
+
+    def test_assignee_profile_picture_changes_change_the_etag(self):
+        etag = self.assign_user()
+
+        with (mock.patch.object(profile_pictures, 'save_profile_pic', return_value='new-picture'),
+              mock.patch.object(profile_pictures, 'delete_unused_profile_picture')):
+            profile_pictures.process_profile_picture(self.user.pk, b'picture')
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
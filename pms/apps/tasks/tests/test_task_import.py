@@ -0,0 +1,149 @@
+import datetime
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from apps.projects import models
+from apps.tasks.models import Task
+from apps.users.models import User
+from apps.organizations.models import Organization
+
+
+class TaskImportTests(APITestCase):
+    """
+    Tests for importing tasks in bulk.
+    """
+
+    def setUp(self):
+        ############################
+        # create a user
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        ####################################
+        # create an organization and a project managed by the user.
+        self.organization = Organization.objects.create(
+            organization_name='Test org', organization_name_slug='test-org',
+            organization_password='securepassword123')
+
+        self.project = models.Project.objects.create(
+            organization=self.organization, project_name="Test project",
+            description='Testing project creation',
+            deadline=datetime.date.today() + datetime.timedelta(days=30))
+
+        models.ProjectMember.objects.create(
+            project=self.project, member=self.user, role=models.ProjectMember.MANAGER)
+
+        self.design = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Design')
+        self.build = models.ProjectPhase.objects.create(
+            project=self.project, phase_name='Build')
+
+        self.deadline = f'{datetime.date.today() + datetime.timedelta(days=1)}'
+        self.url = reverse('import_tasks', kwargs={
+                           'project_id': self.project.pk})
+
+    def task(self, i: int, **kwargs) -> dict:
+        return {
+            'project_phase': self.design.pk,
+            'task_name': f'imported task {i}',
+            'deadline': self.deadline,
+            'description': 'task description',
+            **kwargs,
+        }
+
+    def test_tasks_are_imported(self):
+        tasks = [self.task(i) for i in range(3)]
+        tasks.append({'phase_name': 'build', 'task_name': 'imported task 3',
+                      'deadline': self.deadline, 'description': 'task description',
+                      'status': Task.DONE})
+
+        response = self.client.post(self.url, tasks, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['tasks']), 4)
+        self.assertEqual(self.design.phase_tasks.count(), 3)
+        self.assertEqual(self.build.phase_tasks.get().status, Task.DONE)
+
+        stats = models.ProjectStats.objects.get(project=self.project)
+        self.assertEqual(stats.tasks, 4)
+        self.assertEqual(stats.tasks_in_progress, 3)
+        self.assertEqual(stats.tasks_done, 1)
+        self.assertEqual(models.ProjectPhaseStats.objects.get(
+            phase=self.build).tasks_done, 1)
+
+    def test_csv_import(self):
+        csv = ('task_name,deadline,description,phase_name\n'
+               f'csv task one,{self.deadline},first task,Design\n'
+               f'csv task two,{self.deadline},second task,Build\n')
+
+        response = self.client.post(
+            self.url, csv, content_type='text/csv')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.project.tasks.count(), 2)
+
+    def test_query_count_does_not_depend_on_task_count(self):
+        # warm the membership cache.
+        self.client.post(self.url, [self.task(0)], format='json')
+
+        with CaptureQueriesContext(connection) as few_tasks:
+            self.client.post(self.url, [self.task(1)], format='json')
+
+        with CaptureQueriesContext(connection) as many_tasks:
+            self.client.post(
+                self.url, [self.task(i) for i in range(2, 52)], format='json')
+
+        self.assertEqual(len(few_tasks), len(many_tasks))
+        self.assertEqual(self.project.tasks.count(), 52)
+
+    def test_errors_are_reported_per_row(self):
+        Task.objects.create(project=self.project, project_phase=self.design,
+                            task_name='existing task', deadline=self.deadline)
+        too_late = f'{self.project.deadline + datetime.timedelta(days=1)}'
+
+        tasks = [
+            self.task(0),
+            self.task(1, task_name='Existing Task'),
+            self.task(2, deadline=too_late),
+            self.task(3, project_phase='unknown'),
+            self.task(4, task_name='x'),
+            self.task(0),
+        ]
+
+        response = self.client.post(self.url, tasks, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('task_name', response.data[1])
+        self.assertIn('deadline', response.data[2])
+        self.assertIn('project_phase', response.data[3])
+        self.assertIn('task_name', response.data[4])
+        # the name is already used by the first row.
+        self.assertIn('task_name', response.data[5])
+
+        # no task is created if any row is invalid.
+        self.assertEqual(self.project.tasks.count(), 1)
+
+    def test_empty_import_fails(self):
+        response = self.client.post(self.url, [], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_only_managers_can_import_tasks(self):
+        user = User.objects.create_user(
+            username='testuser2', email='testmail2@test.com', password='securepassword123'
+        )
+        models.ProjectMember.objects.create(project=self.project, member=user)
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.post(self.url, [self.task(0)], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(self.project.tasks.exists())
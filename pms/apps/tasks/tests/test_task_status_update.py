@@ -84,6 +84,15 @@ class UpdateTaskStatusTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_task_attributes_are_not_status_choices(self):
+        for invalid_status in ('pk', 'save', None):
+            response = self.client.put(self.url, {'status': invalid_status}, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        task = models.Task.objects.get(pk=self.task.data['task_id'])
+        self.assertEqual(task.status, models.Task.IN_PROGRESS)
+
     def test_non_existent_task_status_update(self):
         data = {
             'status': 'ON_HOLD'
@@ -4,6 +4,8 @@ from . import views
 
 urlpatterns = [
     path('task/create/', views.TaskCreateView.as_view(), name='create_task'),
+    path('project/<str:project_id>/tasks/import/',
+         views.TaskImportView.as_view(), name='import_tasks'),
     path('task/detail/<str:task_id>/',
          views.TaskDetailView.as_view(), name='task_detail'),
     path('task/<str:task_id>/non-assignees/',
@@ -12,6 +14,8 @@ urlpatterns = [
          views.TaskAssignmentView.as_view(), name='assign_task'),
     path('task/<str:task_id>/status/update/',
          views.TaskStatusUpdateView.as_view(), name='update_task_status'),
+    path('task/status/update/',
+         views.TaskBulkStatusUpdateView.as_view(), name='bulk_update_task_status'),
     path('assignment/<str:task_id>/delete/',
          views.TaskAssignmentDeleteView.as_view(), name='delete_task_assignment'),
 ]
@@ -1,6 +1,7 @@
-from .task_status_update import TaskStatusUpdateView
+from .task_status_update import TaskStatusUpdateView, TaskBulkStatusUpdateView
 from .task_detail import TaskDetailView
 from .task_creation import TaskCreateView
+from .task_import import TaskImportView
 
 from .task_assignment import (
     TaskAssignmentView,
@@ -13,6 +14,8 @@ __all__ = [
     'NonTaskAssigneesListView',
     'TaskAssignmentDeleteView',
     'TaskCreateView',
+    'TaskImportView',
     'TaskStatusUpdateView',
+    'TaskBulkStatusUpdateView',
     'TaskDetailView',
 ]
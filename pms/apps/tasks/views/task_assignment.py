@@ -1,4 +1,6 @@
+from django.db.models import Exists, OuterRef
 from rest_framework import status, generics
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError
@@ -8,7 +10,11 @@ from apps.tasks import models
 from apps.tasks import serializers
 from apps.users.models import User
 from apps.projects.models import ProjectMember
+from apps.projects.permissions import IsProjectManager
+from apps.projects.utils.memberships import get_project_role
+from apps.users.pagination import UserPagination
 from apps.users.serializers import UserRetrievalSerializer
+from apps.users.utils import filter_by_username_prefix
 
 
 class TaskAssignmentView(generics.CreateAPIView):
@@ -18,6 +24,7 @@ class TaskAssignmentView(generics.CreateAPIView):
     This endpoint allows users to be assigned to a specific task.
     """
     serializer_class = serializers.TaskAssignMentSerializer
+    permission_classes = [IsAuthenticated, IsProjectManager]
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         task_id = self.kwargs.get('task_id')
@@ -27,16 +34,7 @@ class TaskAssignmentView(generics.CreateAPIView):
         except models.Task.DoesNotExist:
             return Response({'detail': 'Could not get the task'}, status=status.HTTP_404_NOT_FOUND)
 
-        try:
-            membership = ProjectMember.objects.get(
-                project=task.project, member=self.request.user)
-        except ProjectMember.DoesNotExist:
-            return Response({'detail': 'You are unauthorized to access this information.'},
-                            status=status.HTTP_403_FORBIDDEN)
-
-        if membership.role != 'Manager':
-            return Response({'detail': 'You are unauthorized to perform this action.'},
-                            status=status.HTTP_403_FORBIDDEN)
+        self.check_object_permissions(request, task)
 
         data = {
             'task_id': task_id,
@@ -57,7 +55,12 @@ class NonTaskAssigneesListView(generics.ListAPIView):
     assigned to a specific task.
 
     The response will be a list of users who are project members but not 
-    task assignees.
+    task assignees, ordered by username.
+
+    Query params:
+        - `q`: Only include users whose username starts with it.
+        - `cursor`, `page_size`: Paginate the users. The response is then an
+          object with the page's `results` and the `next_cursor`.
     """
 
     serializer_class = UserRetrievalSerializer
@@ -65,24 +68,36 @@ class NonTaskAssigneesListView(generics.ListAPIView):
     def get_queryset(self):
         task_id = self.kwargs.get('task_id')
 
-        try:
-            task = models.Task.objects.get(pk=task_id)
-        except models.Task.DoesNotExist:
-            raise ValidationError({'detail': 'Could not get the task.'})
-
-        project = task.project
+        project_id = models.Task.objects.filter(
+            pk=task_id).values_list('project_id', flat=True).first()
 
-        task_assignments = set(models.TaskAssignment.objects.filter(
-            task_id=task_id).values_list('user', flat=True))
+        if project_id is None:
+            raise ValidationError({'detail': 'Could not get the task.'})
 
         memberships = ProjectMember.objects.filter(
-            project=project).values_list('member', flat=True)
+            project_id=project_id, member_id=OuterRef('pk'))
+        assignments = models.TaskAssignment.objects.filter(
+            task_id=task_id, user_id=OuterRef('pk'))
 
         # Exclude users who are assigned to the task
-        non_assignees_ids = [
-            member for member in memberships if member not in task_assignments]
+        non_assignees = User.objects.filter(Exists(memberships), ~Exists(assignments))
+
+        return filter_by_username_prefix(non_assignees, self.request)
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        non_assignees = self.get_queryset()
+        paginator = UserPagination()
 
-        return User.objects.filter(user_id__in=[non_assignees_id for non_assignees_id in non_assignees_ids])
+        if not paginator.is_requested(request):
+            serializer = self.get_serializer(
+                non_assignees.order_by(*paginator.ordering), many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        serializer = self.get_serializer(
+            paginator.paginate_queryset(non_assignees, request), many=True)
+
+        return Response({'results': serializer.data, 'next_cursor': paginator.next_cursor},
+                        status=status.HTTP_200_OK)
 
 
 class TaskAssignmentDeleteView(generics.DestroyAPIView):
@@ -129,16 +144,10 @@ class TaskAssignmentDeleteView(generics.DestroyAPIView):
             return None
 
     def is_project_manager(self, task: models.Task, user: User):
-        try:
-            project = task.project
-            membership = ProjectMember.objects.get(
-                project=project, member=user)
-            return membership.role == ProjectMember.MANAGER
-        except ProjectMember.DoesNotExist:
-            return False
+        return get_project_role(self.request, task.project_id) == ProjectMember.MANAGER
 
     def get_task_assignment(self, task, assignee):
         try:
-            return models.TaskAssignment.objects.get(task=task, user=assignee)
+            return models.TaskAssignment.objects.select_related('task', 'user').get(task=task, user=assignee)
         except models.TaskAssignment.DoesNotExist:
             return None
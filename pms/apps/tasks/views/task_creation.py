@@ -1,11 +1,13 @@
 from rest_framework import status, generics
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 
 from pms.utils import camel_case_to_snake_case
 
-from apps.projects.models import ProjectMember, ProjectPhase
+from apps.projects.models import ProjectPhase
+from apps.projects.permissions import IsProjectManager
 from apps.tasks import serializers
 from apps.tasks import models
 
@@ -18,6 +20,7 @@ class TaskCreateView(generics.CreateAPIView):
     """
     model = models.Task
     serializer_class = serializers.TaskCreationSerializser
+    permission_classes = [IsAuthenticated, IsProjectManager]
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         data = request.data
@@ -31,18 +34,7 @@ class TaskCreateView(generics.CreateAPIView):
             return Response({'project_phase': ['Could not get the phase of the project']},
                             status=status.HTTP_404_NOT_FOUND)
 
-        project = project_phase.project
-
-        try:
-            membership = ProjectMember.objects.get(
-                project=project, member=self.request.user)
-        except ProjectMember.DoesNotExist:
-            return Response({'non_field_errors': ['You are not authorized to perform this action.']},
-                            status=status.HTTP_403_FORBIDDEN)
-
-        if membership.role != 'Manager':
-            return Response({'non_field_errors': ['You are not authorized to perform this action.']},
-                            status=status.HTTP_403_FORBIDDEN)
+        self.check_object_permissions(request, project_phase)
 
         serializer = self.get_serializer(data=transformed_data)
 
@@ -52,3 +44,9 @@ class TaskCreateView(generics.CreateAPIView):
             return Response(serialized_task.data, status=status.HTTP_201_CREATED)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    def permission_denied(self, request, message=None, code=None):
+        # The task creation form displays errors as non field errors.
+        if message is not None:
+            message = {'non_field_errors': [message]}
+        super().permission_denied(request, message=message, code=code)
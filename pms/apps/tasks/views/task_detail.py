@@ -1,11 +1,15 @@
 from rest_framework import status, generics
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from pms.conditional import make_etag, not_modified, set_etag
 from apps.tasks import models
 from apps.tasks import serializers
 from apps.users.models import User
-from apps.projects.models import ProjectMember
+from apps.projects.permissions import IsProjectMember
+from apps.projects.utils.memberships import get_project_role
+from apps.projects.utils.versions import get_project_version
 from apps.users.serializers import UserRetrievalSerializer
 
 
@@ -13,21 +17,28 @@ class TaskDetailView(generics.RetrieveAPIView):
     """
     View for retrieving a task detail.
     """
+    permission_classes = [IsAuthenticated, IsProjectMember]
 
     def get(self, request: Request, *args, **kwargs) -> Response:
         task_id = kwargs.get('task_id')
 
         try:
-            task = models.Task.objects.get(pk=task_id)
+            task = models.Task.objects.select_related(
+                'project_phase').get(pk=task_id)
         except models.Task.DoesNotExist:
             return Response({'detail': 'Could not get the task'}, status=status.HTTP_404_NOT_FOUND)
 
-        try:
-            membership = ProjectMember.objects.get(
-                project=task.project, member=self.request.user)
-        except ProjectMember.DoesNotExist:
-            return Response({'detail': 'You are unauthorized to access this information.'},
-                            status=status.HTTP_403_FORBIDDEN)
+        self.check_object_permissions(request, task)
+
+        role = get_project_role(request, task.project_id)
+
+        # assignments and changes to the task's phase bump the project's version.
+        etag = make_etag('task', task_id, task.version,
+                         get_project_version(task.project_id), role)
+
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
 
         task_data = serializers.TaskRetrievalSerializer(task).data
 
@@ -39,6 +50,6 @@ class TaskDetailView(generics.RetrieveAPIView):
         assignees = UserRetrievalSerializer(users, many=True).data
 
         task_data['assignees'] = assignees
-        task_data['role'] = membership.role
+        task_data['role'] = role
 
-        return Response(task_data, status=status.HTTP_200_OK)
+        return set_etag(Response(task_data, status=status.HTTP_200_OK), etag)
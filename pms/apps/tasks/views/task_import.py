@@ -0,0 +1,56 @@
+from django.shortcuts import get_object_or_404
+from rest_framework import status, generics
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from pms.parsers import CSVParser
+from pms.utils import camel_case_to_snake_case
+
+from apps.projects.models import Project
+from apps.projects.permissions import IsProjectManager
+from apps.tasks import serializers
+
+
+class TaskImportView(generics.GenericAPIView):
+    """
+    View for importing many tasks into a project at once.
+
+    The request body is either a JSON list of tasks (or an object with a
+    `tasks` list) or a CSV file with a header row. Each task has a `task_name`,
+    `deadline`, `description`, optional `status` and either the `project_phase`
+    id or the `phase_name` of its phase.
+
+    Either every task is created or, if any row is invalid, none is and the
+    errors of every row are returned.
+    """
+    serializer_class = serializers.TaskImportSerializer
+    permission_classes = [IsAuthenticated, IsProjectManager]
+    parser_classes = [*api_settings.DEFAULT_PARSER_CLASSES, CSVParser]
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        self.project = get_object_or_404(
+            Project, pk=self.kwargs.get('project_id'))
+
+        self.check_object_permissions(request, self.project)
+
+        data = request.data
+        if isinstance(data, dict):
+            data = data.get('tasks')
+
+        serializer = self.get_serializer(
+            data=camel_case_to_snake_case(data), many=True)
+
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        tasks = serializer.save()
+
+        return Response({'tasks': serializers.TaskRetrievalSerializer(tasks, many=True).data},
+                        status=status.HTTP_201_CREATED)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['project'] = self.project
+        return context
@@ -1,8 +1,15 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import F
 from rest_framework import status, generics
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from apps.tasks import models
+from apps.projects.models import ProjectMember
+from apps.projects.utils import stats
+from apps.projects.utils.versions import bump_project_version
+from apps.tasks import events, models, serializers
 
 
 class TaskStatusUpdateView(generics.UpdateAPIView):
@@ -17,7 +24,7 @@ class TaskStatusUpdateView(generics.UpdateAPIView):
         new_status = request.data.get('status')
         task_id = kwargs.get('task_id')
 
-        if not hasattr(models.Task, new_status):
+        if new_status not in dict(models.Task.TASK_STATUS_CHOICES):
             return Response({"detail": "Invalid status choice. Status must either be \
                              'IN_PROGRESS', 'ON_HOLD' or 'DONE"}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -28,6 +35,84 @@ class TaskStatusUpdateView(generics.UpdateAPIView):
 
         task.status = new_status
 
-        task.save()
+        task.save(update_fields=['status'])
 
         return Response(status=status.HTTP_200_OK)
+
+
+class TaskBulkStatusUpdateView(generics.GenericAPIView):
+    """
+    Moves many tasks to the same status at once, e.g. when several
+    cards of a kanban board are moved to another column.
+
+    This view expects a PUT request with the new `status` and a list of `tasks`,
+    each with a `task_id` and optionally the `version` of the task the client
+    last saw. If any of these tasks was changed since, nothing is updated and
+    the current versions of the conflicting tasks are returned.
+
+    Tasks that don't exist or belong to projects the user isn't a member of
+    are listed in a 404 response.
+    """
+    serializer_class = serializers.TaskBulkStatusUpdateSerializer
+
+    def put(self, request: Request, *args, **kwargs) -> Response:
+        serializer = self.get_serializer(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        new_status = serializer.validated_data['status']
+        expected_versions = {task['task_id']: task.get('version')
+                             for task in serializer.validated_data['tasks']}
+
+        with transaction.atomic():
+            # lock the tasks so that they can't change between the checks and the update.
+            tasks = list(models.Task.objects.select_for_update()
+                         .filter(pk__in=expected_versions,
+                                 project__in=ProjectMember.objects.filter(
+                                     member=request.user).values('project_id'))
+                         .order_by('task_id')
+                         .values('task_id', 'project_id', 'project_phase_id', 'status', 'version'))
+
+            # tasks of other projects are answered like missing ones, so
+            # that their ids can't be probed.
+            missing = expected_versions.keys() - {task['task_id'] for task in tasks}
+            if missing:
+                return Response({'detail': 'Could not get task', 'task_ids': sorted(missing)},
+                                status=status.HTTP_404_NOT_FOUND)
+
+            conflicts = [{'task_id': task['task_id'], 'version': task['version']}
+                         for task in tasks
+                         if expected_versions[task['task_id']] not in (None, task['version'])]
+
+            if conflicts:
+                return Response({'detail': 'Some tasks were changed by someone else.', 'conflicts': conflicts},
+                                status=status.HTTP_409_CONFLICT)
+
+            changed = [task for task in tasks if task['status'] != new_status]
+
+            models.Task.objects.filter(pk__in=[task['task_id'] for task in changed]).update(
+                status=new_status, version=F('version') + 1)
+
+            # update() doesn't send signals, so the counters and the
+            # project versions are updated here.
+            moves = Counter((task['project_id'], task['project_phase_id'], task['status'])
+                            for task in changed)
+            for (project_id, phase_id, old_status), count in moves.items():
+                stats.move_tasks(project_id, phase_id,
+                                 old_status, new_status, count)
+
+            for project_id in {task['project_id'] for task in changed}:
+                bump_project_version(project_id)
+
+            for task in changed:
+                events.publish_task_status_changed(task['project_phase_id'], task['task_id'],
+                                                   task['status'], new_status, task['version'] + 1)
+
+        for task in changed:
+            task['status'] = new_status
+            task['version'] += 1
+
+        return Response({'tasks': [{'task_id': task['task_id'], 'status': task['status'], 'version': task['version']}
+                                   for task in tasks]},
+                        status=status.HTTP_200_OK)
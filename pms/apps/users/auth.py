@@ -1,26 +1,48 @@
 from typing import Any
-from django.contrib.auth.backends import BaseBackend
+
+from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth.models import AbstractUser
+from django.db.models import Case, Q, Value, When
+from django.db.models.functions import Lower
 from django.http import HttpRequest
 from .models import User
 
 
-class EmailAuthBackend(BaseBackend):
+class UsernameOrEmailBackend(ModelBackend):
     """
-    Allow users to log in with their email
+    Allow users to log in with their username or their email.
+
+    The user is looked up by username or (case-insensitive) email in a
+    single query, and exactly one password hash is computed per attempt,
+    whether or not the user exists.
     """
 
     def authenticate(self, request: HttpRequest, username: str = None, password: str = None, **kwargs: Any) -> AbstractUser | None:
-        try:
-            user = User.objects.get(email=username)
-            if user.check_password(password):
-                return user
-            return None
-        except User.DoesNotExist:
+        # allauth passes the login as `email` when logging in by email.
+        login = username if username is not None else kwargs.get('email')
+
+        if login is None or password is None:
             return None
 
-    def get_user(self, user_id) -> AbstractUser | None:
-        try:
-            return User.objects.get(pk=user_id)
-        except User.DoesNotExist:
+        user = self.get_user_by_login(login)
+
+        if user is None:
+            # Hash the password anyway so that the response time doesn't
+            # reveal whether the user exists.
+            User().set_password(password)
             return None
+
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def get_user_by_login(self, login: str) -> User | None:
+        """
+        Return the user whose username or email is `login`.
+
+        A username that looks like another user's email takes precedence.
+        """
+        return (User.objects.alias(email_lower=Lower('email'))
+                .filter(Q(username=login) | Q(email_lower=Lower(Value(login))))
+                .order_by(Case(When(username=login, then=0), default=1), 'pk')
+                .first())
@@ -0,0 +1,54 @@
+from dj_rest_auth.jwt_auth import JWTCookieAuthentication
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from .models import User
+from .utils import get_cached_user
+
+
+class CachedUserMixin:
+    """
+    Resolve the user of a validated token from the user cache instead of
+    querying the database on every request.
+
+    Performs the same checks as `JWTAuthentication.get_user`.
+    """
+
+    def get_user(self, validated_token: Token) -> User:
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = get_cached_user(user_id)
+
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != user.password_digest:
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
+
+
+class CachedJWTCookieAuthentication(CachedUserMixin, JWTCookieAuthentication):
+    """
+    Authenticate requests with the access token of the JWT cookie (or header).
+    """
+
+
+class CachedJWTAuthentication(CachedUserMixin, JWTAuthentication):
+    """
+    Authenticate requests with the access token of the Authorization header.
+    """
@@ -0,0 +1,63 @@
+from io import BytesIO
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.projects.utils.versions import bump_assignee_project_versions
+from apps.users.models import User
+from apps.users.utils import user_cache
+from services.avatars import is_stored_picture, save_profile_pic
+from services.s3.client import s3_client
+
+# Prefix of the private objects pictures were stored under before the avatar storage.
+LEGACY_PREFIX = 'profile-pics/'
+
+
+class Command(BaseCommand):
+    """
+    Move the profile pictures uploaded before the avatar storage into it.
+
+    Until a user's picture is moved, the default picture is shown for them.
+    """
+    help = "Render the legacy S3 profile pictures into the avatar storage."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--delete', action='store_true',
+                            help='Delete the legacy objects once they are moved.')
+
+    def handle(self, *args, **options):
+        users = User.objects.exclude(
+            profile_picture=settings.DEFAULT_PROFILE_PICTURE)
+
+        migrated = failed = 0
+        for user_id, picture_name in users.values_list('pk', 'profile_picture').iterator():
+            if is_stored_picture(picture_name):
+                continue
+
+            key = LEGACY_PREFIX + picture_name
+            picture = BytesIO()
+
+            try:
+                s3_client.download_fileobj(
+                    settings.AWS_STORAGE_BUCKET_NAME, key, picture)
+            except ClientError as e:
+                self.stderr.write(f'Could not download {key}: {e}')
+                failed += 1
+                continue
+
+            picture.seek(0)
+            # only update users who didn't upload a new picture meanwhile.
+            User.objects.filter(pk=user_id, profile_picture=picture_name).update(
+                profile_picture=save_profile_pic(picture))
+            user_cache.delete(user_id)
+            bump_assignee_project_versions(user_id)
+
+            if options['delete']:
+                s3_client.delete_object(
+                    Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
+
+            migrated += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Moved the profile pictures of {migrated} user(s), {failed} failed.'))
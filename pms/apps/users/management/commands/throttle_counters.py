@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from pms.pubsub import get_redis_client
+from pms.throttling import get_throttle_counters, reset_throttle_counters
+
+
+class Command(BaseCommand):
+    """
+    Show how many requests the token bucket throttles allowed and rejected,
+    e.g. to be collected by monitoring.
+    """
+    help = "Show the allowed and rejected requests of each throttle scope."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true',
+                            help='Reset the counters once they are shown.')
+
+    def handle(self, *args, **options):
+        if get_redis_client() is None:
+            self.stderr.write('The cache is not Redis: requests are only counted '
+                              'by the process which throttled them.')
+
+        for name, count in sorted(get_throttle_counters().items()):
+            self.stdout.write(f'{name} {count}')
+
+        if options['reset']:
+            reset_throttle_counters()
@@ -1,6 +1,7 @@
 import uuid
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
 from .validators import username_validator
@@ -31,5 +32,11 @@ class User(AbstractUser):
     profile_picture = models.CharField(
         max_length=255, help_text='Name of the profile picture in S3 bucket', default='DEFAULTPROFILEPICTURE')
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # looks up users by email when they log in.
+            models.Index(Lower('email'), name='user_email_lower_idx'),
+        ]
+
     def __str__(self) -> str:
         return self.username
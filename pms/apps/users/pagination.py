@@ -0,0 +1,8 @@
+from pms.pagination import KeysetPagination
+
+
+class UserPagination(KeysetPagination):
+    """
+    Paginates users by username.
+    """
+    ordering = ('username',)
@@ -0,0 +1,100 @@
+import logging
+from io import BytesIO
+from typing import Optional
+
+from django.core.cache import cache
+
+from apps.projects.utils.versions import bump_assignee_project_versions
+from services.avatars import delete_profile_pic, save_profile_pic
+from services.utils.background import run_in_background
+from .models import User
+from .utils import user_cache
+
+PENDING = 'pending'
+FAILED = 'failed'
+
+# How long the processing status of an upload is kept. A job lost with its
+# process (e.g. on a restart) stops showing as pending after this.
+STATUS_TIMEOUT = 10 * 60  # 10 minutes
+
+
+def profile_picture_status_key(user_id) -> str:
+    return f'profile-picture-status:{user_id}'
+
+
+def get_profile_picture_status(user_id) -> Optional[str]:
+    """
+    Return the status of the user's last profile picture upload: `pending`
+    while it is processed, `failed` if it could not be processed and None
+    once it is done.
+    """
+    return cache.get(profile_picture_status_key(user_id))
+
+
+def queue_profile_picture(user: User, picture: bytes) -> None:
+    """
+    Queue an uploaded profile picture to be processed and uploaded off the request.
+    """
+    cache.set(profile_picture_status_key(user.pk),
+              PENDING, timeout=STATUS_TIMEOUT)
+    run_in_background(process_profile_picture, user.pk, picture)
+
+
+def process_profile_picture(user_id, picture: bytes) -> bool:
+    """
+    Render and store a profile picture, then point the user to it.
+
+    params:
+        - user_id: The id of the user who uploaded the picture.
+        - picture: The content of the uploaded file.
+        - return: True if the picture was stored, else False.
+    """
+    status_key = profile_picture_status_key(user_id)
+
+    try:
+        picture_name = save_profile_pic(BytesIO(picture))
+    except Exception:
+        logging.exception('Could not process the profile picture of %s', user_id)
+        cache.set(status_key, FAILED, timeout=STATUS_TIMEOUT)
+        return False
+
+    previous_picture = User.objects.filter(
+        pk=user_id).values_list('profile_picture', flat=True).first()
+
+    User.objects.filter(pk=user_id).update(profile_picture=picture_name)
+    user_cache.delete(user_id)
+    bump_assignee_project_versions(user_id)
+    cache.delete(status_key)
+
+    if previous_picture and previous_picture != picture_name:
+        delete_unused_profile_picture(previous_picture)
+
+    return True
+
+
+def delete_unused_profile_picture(picture_name: str, excluded_user: Optional[User] = None) -> bool:
+    """
+    Delete a stored profile picture unless a user still uses it.
+
+    Pictures are content-addressed, so users who uploaded the same image share it.
+
+    params:
+        - picture_name: The name of the picture.
+        - excluded_user: A user whose use of the picture is ignored, e.g. a user being deleted.
+        - return: False if the picture could not be deleted, else True.
+    """
+    users = User.objects.filter(profile_picture=picture_name)
+
+    if excluded_user is not None:
+        users = users.exclude(pk=excluded_user.pk)
+
+    if users.exists():
+        return True
+
+    try:
+        delete_profile_pic(picture_name)
+    except Exception:
+        logging.exception('Could not delete the profile picture %s', picture_name)
+        return False
+
+    return True
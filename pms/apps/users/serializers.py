@@ -8,10 +8,18 @@ from django.db import IntegrityError
 from allauth.socialaccount.providers.oauth2.client import OAuth2Error
 from rest_framework import serializers
 from dj_rest_auth.registration.serializers import RegisterSerializer
+from dj_rest_auth.jwt_auth import CookieTokenRefreshSerializer
 from .models import User
-from .utils import slugify_username
+from .utils import slugify_username, save_username_slug
+from .profile_pictures import get_profile_picture_status
+from .tokens import RefreshToken
+from pms.slugs import save_with_unique_slug
 
-from services.s3.profile_pics import get_profile_pic_url
+from services.avatars import get_profile_pic_url
+
+# Size of the profile pictures in lists of users. Lists show small icons,
+# 64px keeps them sharp on high density screens.
+LIST_PROFILE_PICTURE_SIZE = 64
 
 
 class UserRetrievalSerializer(serializers.ModelSerializer):
@@ -26,8 +34,7 @@ class UserRetrievalSerializer(serializers.ModelSerializer):
         fields = ['username', 'profile_picture',]
 
     def get_profile_picture(self, user) -> str:
-        presigned_url = get_profile_pic_url(user.profile_picture)
-        return presigned_url
+        return get_profile_pic_url(user.profile_picture, LIST_PROFILE_PICTURE_SIZE)
 
 
 class UserDetailsSerializer(serializers.ModelSerializer):
@@ -39,17 +46,20 @@ class UserDetailsSerializer(serializers.ModelSerializer):
     """
 
     profile_picture = serializers.SerializerMethodField()
+    profile_picture_status = serializers.SerializerMethodField()
 
     class Meta:
         model = User
         fields = (
             "pk", "email", "username", "username_slug",
-            "profile_picture",
+            "profile_picture", "profile_picture_status",
         )
 
     def get_profile_picture(self, user) -> str:
-        presigned_url = get_profile_pic_url(user.profile_picture)
-        return presigned_url
+        return get_profile_pic_url(user.profile_picture)
+
+    def get_profile_picture_status(self, user) -> str | None:
+        return get_profile_picture_status(user.pk)
 
 
 try:
@@ -254,8 +264,15 @@ class CustomRegisterSerializer(RegisterSerializer):
     def save(self, request):
         user = super().save(request)
 
-        user.username_slug = slugify_username(user.username)
-
-        user.save()
+        save_with_unique_slug(lambda: slugify_username(user.username, user),
+                              lambda slug: save_username_slug(user, slug))
 
         return user
+
+
+class TokenRefreshSerializer(CookieTokenRefreshSerializer):
+    """
+    Refresh the access token with the refresh token cookie, rejecting
+    blacklisted refresh tokens and blacklisting the rotated ones.
+    """
+    token_class = RefreshToken
@@ -0,0 +1,69 @@
+from unittest import mock
+
+from django.contrib.auth import authenticate, base_user
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from apps.users.models import User
+
+
+class UsernameOrEmailBackendTests(APITestCase):
+    """
+    Tests for logging in with a username or an email.
+    """
+
+    def setUp(self):
+        ############################
+        # create test user
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+
+    def test_user_can_log_in_with_username_or_email(self):
+        response = APIClient().post(reverse('rest_login'), {
+            'username': 'TestMail@test.com', 'password': 'securepassword123'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = APIClient().post(reverse('rest_login'), {
+            'username': 'testuser', 'password': 'securepassword123'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_user_is_looked_up_once(self):
+        # one query and one password hash, whether or not the user exists.
+        for login in ['testuser', 'testmail@test.com', 'unknown@test.com']:
+            with (self.assertNumQueries(1),
+                  mock.patch.object(base_user, 'make_password',
+                                    wraps=base_user.make_password) as make_password,
+                  mock.patch.object(base_user, 'check_password',
+                                    wraps=base_user.check_password) as check_password):
+                authenticate(username=login, password='wrongpassword')
+
+            self.assertEqual(make_password.call_count + check_password.call_count, 1)
+
+    def test_username_takes_precedence_over_email(self):
+        other_user = User.objects.create_user(
+            username='testmail@test.com', email='othermail@test.com', password='otherpassword123'
+        )
+
+        self.assertEqual(authenticate(username='testmail@test.com',
+                                      password='otherpassword123'), other_user)
+        self.assertIsNone(authenticate(username='testmail@test.com',
+                                       password='securepassword123'))
+
+    def test_username_takes_precedence_over_several_emails(self):
+        # emails are unique, but not case-insensitively.
+        for username, email in [('shareduser1', 'Shared@test.com'), ('shareduser2', 'shared@TEST.com')]:
+            User.objects.create_user(username=username, email=email, password='otherpassword123')
+        username_user = User.objects.create_user(
+            username='shared@test.com', email='thirdmail@test.com', password='thirdpassword123'
+        )
+
+        self.assertEqual(authenticate(username='shared@test.com',
+                                      password='thirdpassword123'), username_user)
+
+    def test_inactive_user_cant_log_in(self):
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertIsNone(authenticate(username='testuser', password='securepassword123'))
@@ -0,0 +1,77 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from apps.users.models import User
+
+rates = {
+    'login_user': '2/min',
+    'login_ip': '3/min',
+}
+
+
+@override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK,
+                                   'DEFAULT_THROTTLE_RATES': rates})
+class LoginThrottlingTests(APITestCase):
+    """
+    Tests for throttling login attempts per account and per IP address.
+    """
+
+    def setUp(self):
+        # start with full buckets.
+        cache.clear()
+
+        ############################
+        # create test user
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.client = APIClient()
+
+        self.url = reverse('rest_login')
+
+    def test_account_attempts_are_throttled(self):
+        wrong_password = {'username': 'testmail@test.com', 'password': 'wrongpassword'}
+
+        for _ in range(2):
+            response = self.client.post(self.url, wrong_password, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # the login is normalized, so changing its case doesn't help.
+        response = self.client.post(
+            self.url, {**wrong_password, 'username': 'TestMail@test.com'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_account_attempts_are_throttled_per_ip_address(self):
+        wrong_password = {'username': 'testmail@test.com', 'password': 'wrongpassword'}
+
+        for _ in range(3):
+            self.client.post(self.url, wrong_password, format='json', REMOTE_ADDR='10.0.0.1')
+
+        # the account can't be locked out from another address.
+        response = self.client.post(
+            self.url, {'username': 'testmail@test.com', 'password': 'securepassword123'},
+            format='json', REMOTE_ADDR='10.0.0.2')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_ip_attempts_are_throttled(self):
+        for i in range(3):
+            response = self.client.post(
+                self.url, {'username': f'user{i}@test.com', 'password': 'password'}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(
+            self.url, {'username': 'testmail@test.com', 'password': 'securepassword123'},
+            format='json')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_login_succeeds_within_limits(self):
+        response = self.client.post(
+            self.url, {'username': 'testmail@test.com', 'password': 'securepassword123'},
+            format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access_token', response.cookies)
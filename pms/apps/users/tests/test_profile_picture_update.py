@@ -0,0 +1,139 @@
+import tempfile
+from io import BytesIO
+from unittest import mock
+
+from PIL import Image
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from apps.users import profile_pictures
+from apps.users.models import User
+from services.avatars import get_avatar_storage, rendition_name
+from services.utils.image_processing import AVATAR_SIZES, render_avatars
+
+
+class ProfilePictureUpdateTests(APITestCase):
+    """
+    Tests for uploading a profile picture.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+        ############################
+        # store the pictures in a temporary directory.
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+
+        storages = {**settings.STORAGES, 'avatars': {
+            'BACKEND': 'django.core.files.storage.FileSystemStorage',
+            'OPTIONS': {'location': media_root.name, 'base_url': '/media/avatars/'},
+        }}
+        storage_settings = override_settings(STORAGES=storages)
+        storage_settings.enable()
+        self.addCleanup(storage_settings.disable)
+
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        self.url = reverse('update_avatar')
+
+    def image(self, color: str = 'red', content_type: str = 'image/png') -> SimpleUploadedFile:
+        buffer = BytesIO()
+        Image.new('RGB', (600, 400), color).save(buffer, format='PNG')
+        return SimpleUploadedFile('avatar.png', buffer.getvalue(), content_type=content_type)
+
+    def test_upload_is_processed_off_the_request(self):
+        with mock.patch.object(profile_pictures, 'run_in_background') as run_in_background:
+            response = self.client.put(
+                self.url, {'avatar': self.image()}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(
+            response.data['profile_picture_status'], profile_pictures.PENDING)
+
+        func, user_id, picture = run_in_background.call_args.args
+        self.assertIs(func, profile_pictures.process_profile_picture)
+        self.assertEqual(user_id, self.user.pk)
+        self.assertTrue(picture.startswith(b'\x89PNG'))
+
+    def test_processed_picture_is_assigned_to_user(self):
+        cache.set(profile_pictures.profile_picture_status_key(self.user.pk),
+                  profile_pictures.PENDING)
+
+        self.assertTrue(profile_pictures.process_profile_picture(
+            self.user.pk, self.image().read()))
+
+        self.user.refresh_from_db()
+        self.assertTrue(get_avatar_storage().exists(
+            rendition_name(self.user.profile_picture, 300)))
+        self.assertIsNone(
+            profile_pictures.get_profile_picture_status(self.user.pk))
+
+    def test_replaced_picture_is_deleted(self):
+        profile_pictures.process_profile_picture(
+            self.user.pk, self.image('red').read())
+        self.user.refresh_from_db()
+        previous_picture = self.user.profile_picture
+
+        profile_pictures.process_profile_picture(
+            self.user.pk, self.image('blue').read())
+
+        self.assertFalse(get_avatar_storage().exists(
+            rendition_name(previous_picture, 300)))
+
+    def test_shared_picture_is_kept(self):
+        other_user = User.objects.create_user(
+            username='testuser2', email='testmail2@test.com', password='securepassword123'
+        )
+        profile_pictures.process_profile_picture(
+            self.user.pk, self.image().read())
+        profile_pictures.process_profile_picture(
+            other_user.pk, self.image().read())
+        self.user.refresh_from_db()
+
+        response = self.client.delete(reverse('account_delete'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(get_avatar_storage().exists(
+            rendition_name(self.user.profile_picture, 300)))
+
+    def test_failed_processing_is_reported(self):
+        self.assertFalse(profile_pictures.process_profile_picture(
+            self.user.pk, b'not an image'))
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_picture,
+                         settings.DEFAULT_PROFILE_PICTURE)
+        self.assertEqual(profile_pictures.get_profile_picture_status(
+            self.user.pk), profile_pictures.FAILED)
+
+    def test_invalid_image_is_rejected(self):
+        upload = SimpleUploadedFile(
+            'avatar.png', b'not an image', content_type='image/png')
+
+        with mock.patch.object(profile_pictures, 'run_in_background') as run_in_background:
+            response = self.client.put(
+                self.url, {'avatar': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        run_in_background.assert_not_called()
+
+    def test_every_size_is_rendered(self):
+        buffer = BytesIO()
+        Image.new('RGB', (1600, 1200), 'red').save(buffer, format='JPEG')
+        buffer.seek(0)
+
+        renditions = render_avatars(buffer)
+
+        self.assertEqual(
+            {size: Image.open(rendition).size for size, rendition in renditions.items()},
+            {size: (size, size) for size in AVATAR_SIZES})
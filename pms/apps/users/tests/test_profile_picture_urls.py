@@ -0,0 +1,66 @@
+import tempfile
+from io import BytesIO
+
+from PIL import Image
+from django.conf import settings
+from django.test import override_settings
+from django.templatetags.static import static
+from rest_framework.test import APITestCase
+
+from apps.users.models import User
+from apps.users.serializers import UserDetailsSerializer, UserRetrievalSerializer
+from services.avatars import get_avatar_storage, rendition_name, save_profile_pic
+
+
+class ProfilePictureUrlTests(APITestCase):
+    """
+    Tests for the public URLs of profile pictures.
+    """
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+
+        storages = {**settings.STORAGES, 'avatars': {
+            'BACKEND': 'django.core.files.storage.FileSystemStorage',
+            'OPTIONS': {'location': media_root.name, 'base_url': '/media/avatars/'},
+        }}
+        storage_settings = override_settings(STORAGES=storages)
+        storage_settings.enable()
+        self.addCleanup(storage_settings.disable)
+
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+
+    def save_picture(self) -> str:
+        buffer = BytesIO()
+        Image.new('RGB', (400, 400), 'red').save(buffer, format='PNG')
+        buffer.seek(0)
+        return save_profile_pic(buffer)
+
+    def test_default_picture_is_a_static_file(self):
+        url = UserRetrievalSerializer(self.user).data['profile_picture']
+        self.assertEqual(url, static(settings.DEFAULT_PROFILE_PICTURE_STATIC))
+
+    def test_pictures_have_content_addressed_urls(self):
+        picture_name = self.save_picture()
+        self.user.profile_picture = picture_name
+        self.user.save()
+
+        # the same image is stored under the same name.
+        self.assertEqual(self.save_picture(), picture_name)
+
+        self.assertEqual(UserDetailsSerializer(self.user).data['profile_picture'],
+                         '/media/avatars/' + rendition_name(picture_name, 300))
+        self.assertEqual(UserRetrievalSerializer([self.user], many=True).data[0]['profile_picture'],
+                         '/media/avatars/' + rendition_name(picture_name, 64))
+        self.assertTrue(get_avatar_storage().exists(
+            rendition_name(picture_name, 32)))
+
+    def test_legacy_pictures_show_the_default_picture(self):
+        self.user.profile_picture = str(self.user.pk)
+        self.user.save()
+
+        url = UserRetrievalSerializer(self.user).data['profile_picture']
+        self.assertEqual(url, static(settings.DEFAULT_PROFILE_PICTURE_STATIC))
@@ -0,0 +1,102 @@
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.users.authentication import CachedJWTCookieAuthentication
+from apps.users.models import User
+from apps.users.utils import user_cache
+
+
+class TokenAuthenticationTests(APITestCase):
+    """
+    Tests for authenticating requests with the access token cookie, whose
+    user is cached.
+    """
+
+    def setUp(self):
+        ############################
+        # create test user and authenticate with an access token.
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.token = AccessToken.for_user(self.user)
+
+        self.client = APIClient()
+        self.client.cookies['access_token'] = str(self.token)
+
+        self.authentication = CachedJWTCookieAuthentication()
+        self.url = reverse('rest_user_details')
+
+    def test_user_is_authenticated_with_the_cookie(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['username'], 'testuser')
+
+    def test_user_is_loaded_once(self):
+        with self.assertNumQueries(1):
+            self.authentication.get_user(self.token)
+
+        with self.assertNumQueries(0):
+            user = self.authentication.get_user(self.token)
+
+        self.assertEqual(user, self.user)
+
+    def test_username_update_invalidates_cached_user(self):
+        self.authentication.get_user(self.token)
+
+        response = self.client.put(reverse('username_update'), {'username': 'newusername'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['username'], 'newusername')
+
+    def test_deleted_user_is_rejected(self):
+        self.authentication.get_user(self.token)
+
+        response = self.client.delete(reverse('account_delete'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.get_user(self.token)
+
+    def test_inactive_user_is_rejected(self):
+        self.authentication.get_user(self.token)
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authentication.get_user(self.token)
+
+    def test_password_hash_is_not_cached(self):
+        self.authentication.get_user(self.token)
+
+        fields = user_cache.get_or_set(self.user.pk, lambda: None)
+
+        self.assertEqual(fields['username'], 'testuser')
+        self.assertNotIn('password', fields)
+        self.assertNotIn(self.user.password, fields.values())
+
+    def test_password_is_loaded_when_used(self):
+        self.authentication.get_user(self.token)
+        user = self.authentication.get_user(self.token)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(user.check_password('securepassword123'))
+
+    def test_tokens_are_revoked_when_password_changes(self):
+        with mock.patch.object(api_settings, 'CHECK_REVOKE_TOKEN', True):
+            token = AccessToken.for_user(self.user)
+            self.assertEqual(self.authentication.get_user(token), self.user)
+
+            self.user.set_password('newsecurepassword123')
+            self.user.save()
+
+            with self.assertRaises(AuthenticationFailed):
+                self.authentication.get_user(token)
@@ -0,0 +1,70 @@
+import time
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from rest_framework import status
+
+from apps.users.models import User
+from apps.users.tokens import RefreshToken, blacklist_token, blacklisted_token_key
+
+
+class TokenRefreshTests(APITestCase):
+    """
+    Tests for rotating refresh tokens and blacklisting the rotated ones.
+    """
+
+    def setUp(self):
+        ############################
+        # create test user and log them in with a refresh token cookie.
+        self.user = User.objects.create_user(
+            username='testuser', email='testmail@test.com', password='securepassword123'
+        )
+        self.refresh = RefreshToken.for_user(self.user)
+
+        self.client = APIClient()
+        self.client.cookies['refresh_token'] = str(self.refresh)
+
+        self.url = reverse('token_refresh')
+
+    def test_refresh_rotates_refresh_token(self):
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', response.data)
+        self.assertIn('access_token', response.cookies)
+        self.assertNotEqual(response.cookies['refresh_token'].value, str(self.refresh))
+
+    def test_rotated_token_is_blacklisted(self):
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # the new token works, the rotated one doesn't.
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        client = APIClient()
+        client.cookies['refresh_token'] = str(self.refresh)
+
+        response = client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_expired_tokens_are_not_stored(self):
+        blacklist_token('expired', time.time() - 1)
+
+        self.assertFalse(cache.has_key(blacklisted_token_key('expired')))
+
+    def test_logout_blacklists_refresh_token(self):
+        response = self.client.post(reverse('rest_logout'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        client = APIClient()
+        client.cookies['refresh_token'] = str(self.refresh)
+
+        response = client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_missing_refresh_token_is_rejected(self):
+        response = APIClient().post(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
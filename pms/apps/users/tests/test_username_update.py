@@ -40,3 +40,34 @@ class UpdateUsernameTests(APITestCase):
         response = self.client.put(self.url, {'wrongkey': self.user.username})
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_username_slug_is_unique(self):
+        other_user = User.objects.create_user(
+            username='newusername', email='testmail2@test.com', password='securepassword123'
+        )
+        other_user.username_slug = 'newusername'
+        other_user.save()
+
+        response = self.client.put(self.url, {'username': 'NewUsername'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.username_slug, 'newusername-1')
+
+    def test_user_keeps_own_slug(self):
+        self.client.put(self.url, {'username': 'newusername'})
+        self.client.put(self.url, {'username': 'NewUsername'})
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.username_slug, 'newusername')
+
+    def test_username_update_keeps_other_fields(self):
+        # e.g. a profile picture saved by a background task meanwhile.
+        User.objects.filter(pk=self.user.pk).update(profile_picture='profile_pictures/new.webp')
+
+        response = self.client.put(self.url, {'username': 'newusername'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.username, 'newusername')
+        self.assertEqual(self.user.profile_picture, 'profile_pictures/new.webp')
@@ -0,0 +1,59 @@
+import time
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt import tokens
+
+
+def blacklisted_token_key(jti: str) -> str:
+    return f'blacklisted-token:{jti}'
+
+
+def blacklist_token(jti: str, exp: int) -> None:
+    """
+    Record a token's id as blacklisted until the token expires.
+
+    The blacklist is kept in the shared cache (Redis) rather than in the
+    database, so lookups take one round trip and entries expire with their
+    token instead of piling up.
+
+    params:
+        - jti: The id of the token.
+        - exp: The expiry time of the token, in seconds since the epoch.
+    """
+    timeout = int(exp - time.time())
+
+    # an expired token is rejected anyway.
+    if timeout > 0:
+        cache.set(blacklisted_token_key(jti), True, timeout=timeout)
+
+
+def is_token_blacklisted(jti: str) -> bool:
+    return cache.get(blacklisted_token_key(jti)) is not None
+
+
+class RefreshToken(tokens.RefreshToken):
+    """
+    A refresh token that is checked against, and can be added to, the
+    token blacklist.
+
+    Refresh tokens are blacklisted once they are rotated
+    (`BLACKLIST_AFTER_ROTATION`) and on logout.
+    """
+
+    def verify(self, *args, **kwargs) -> None:
+        self.check_blacklist()
+
+        super().verify(*args, **kwargs)
+
+    def check_blacklist(self) -> None:
+        """
+        Raise `TokenError` if the token is blacklisted.
+        """
+        if is_token_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> None:
+        blacklist_token(self.payload[api_settings.JTI_CLAIM], self.payload['exp'])
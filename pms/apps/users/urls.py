@@ -1,5 +1,4 @@
 from django.urls import path, include
-from rest_framework_simplejwt.views import TokenRefreshView
 from . import views
 
 
@@ -12,11 +11,14 @@ urlpatterns = [
          views.UserAccountDeleteView.as_view(), name="account_delete"),
     path('accounts/register/', views.AccountRegsitrationView.as_view(),
          name='account_registration'),
+    # before `dj_rest_auth.urls`, which has views of the same paths.
+    path('dj-rest-auth/token/refresh/',
+         views.TokenRefreshView.as_view(), name="token_refresh"),
+    path('dj-rest-auth/login/', views.LoginView.as_view(), name='rest_login'),
+    path('dj-rest-auth/logout/', views.LogoutView.as_view(), name='rest_logout'),
     path('dj-rest-auth/', include('dj_rest_auth.urls')),
     path('dj-rest-auth/registration/', include('dj_rest_auth.registration.urls')),
     path('dj-rest-auth/google/',
          views.GoogleLogin.as_view(), name='google_login'),
-    path('dj-rest-auth/token/refresh/',
-         TokenRefreshView.as_view(), name="token_refresh"),
     path('accounts/', include('allauth.urls')),
 ]
@@ -1,16 +1,91 @@
-from django.utils.text import slugify
+from typing import Optional
+
+from django.db.models import QuerySet
+from rest_framework.request import Request
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from pms.slugs import allocate_slug
+from pms.tiered_cache import TieredCache
 from .models import User
 
+# Fields of the users authenticated by their access token, keyed by `user_id`.
+# Access tokens live for 5 minutes, so a user is looked up about once per
+# token in each process instead of on every request.
+user_cache = TieredCache('user', timeout=5 * 60, local_timeout=30)
+
+
+def _get_user_fields(user_id) -> Optional[dict]:
+    user = User.objects.filter(pk=user_id).first()
+
+    if user is None:
+        return None
+
+    # the password hash is not cached, only its digest when tokens are
+    # revoked on password changes.
+    fields = {field.attname: getattr(user, field.attname)
+              for field in User._meta.concrete_fields if field.attname != 'password'}
+
+    if api_settings.CHECK_REVOKE_TOKEN:
+        fields['password_digest'] = get_md5_hash_password(user.password)
+
+    return fields
+
+
+def get_cached_user(user_id) -> Optional[User]:
+    """
+    Return the user with the given id, or None if there is none.
+
+    The user is cached until it is saved or deleted; writes that bypass
+    `save` (e.g. `QuerySet.update`) must call `user_cache.delete`.
+
+    The password of the user is deferred: it is loaded from the database
+    when it is used. With `CHECK_REVOKE_TOKEN`, the digest of the password
+    is set as `password_digest`.
+    """
+    fields = user_cache.get_or_set(user_id, lambda: _get_user_fields(user_id))
+
+    if fields is None:
+        return None
 
-def slugify_username(username: str) -> str:
+    fields = dict(fields)
+    password_digest = fields.pop('password_digest', None)
+
+    user = User.from_db(User.objects.db, list(fields), list(fields.values()))
+    user.password_digest = password_digest
+
+    return user
+
+
+def slugify_username(username: str, user: Optional[User] = None) -> str:
     """
     Slugify the username and ensure it is unique.
+
+    If `user` is given, its current slug is not treated as taken.
+    """
+    users = User.objects.all()
+
+    if user is not None and user.pk is not None:
+        users = users.exclude(pk=user.pk)
+
+    return allocate_slug(users, 'username_slug', username)
+
+
+def save_username_slug(user: User, username_slug: str) -> None:
+    """
+    Save the user with the given username slug.
+    """
+    user.username_slug = username_slug
+    user.save(update_fields=['username', 'username_slug'])
+
+
+def filter_by_username_prefix(users: QuerySet, request: Request) -> QuerySet:
+    """
+    Keep the users whose username starts with the `q` query parameter, if any.
     """
-    username_slug = slugify(username)
+    prefix = request.query_params.get('q', '').strip()
 
-    counter = 1
-    while User.objects.filter(username_slug=username_slug).exists():
-        username_slug = f"{username_slug}-{counter}"
-        counter += 1
+    if prefix:
+        users = users.filter(username__istartswith=prefix)
 
-    return username_slug
+    return users
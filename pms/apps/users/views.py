@@ -5,17 +5,24 @@ from dotenv import load_dotenv
 from django.core.exceptions import ValidationError
 from allauth.socialaccount.providers.google.views import GoogleOAuth2Adapter
 from allauth.socialaccount.providers.oauth2.client import OAuth2Client
-from rest_framework_simplejwt.tokens import RefreshToken
 from dj_rest_auth.registration.views import RegisterView
 from dj_rest_auth.registration.views import SocialLoginView
+from dj_rest_auth.app_settings import api_settings as rest_auth_settings
+from dj_rest_auth.jwt_auth import get_refresh_view
+from dj_rest_auth.views import LoginView as BaseLoginView, LogoutView as BaseLogoutView
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.request import Request
-from .serializers import SocialLoginSerializer, UserDetailsSerializer
+from .serializers import SocialLoginSerializer, TokenRefreshSerializer, UserDetailsSerializer
+from .tokens import RefreshToken
 from .models import User
 from .validators import username_validator
-from .utils import slugify_username
-from services.s3.profile_pics import upload_profile_pic, delete_profile_pic
+from .utils import slugify_username, save_username_slug
+from pms.slugs import save_with_unique_slug
+from pms.throttling import IPTokenBucketThrottle, UserTokenBucketThrottle
+from .profile_pictures import delete_unused_profile_picture, queue_profile_picture
+from services.utils.image_processing import is_valid_image
 
 load_dotenv()
 
@@ -30,6 +37,8 @@ class AccountRegsitrationView(RegisterView):
     the response by setting the access and refresh tokens as HTTP-only cookies.
     By default, `dj-rest-auth` does not set these tokens as cookies during registration.
     """
+    throttle_scope = 'registration'
+    throttle_classes = [IPTokenBucketThrottle]
 
     def post(self, request, *args, **kwargs):
 
@@ -72,9 +81,49 @@ class GoogleLogin(SocialLoginView):
     serializer_class = SocialLoginSerializer
 
 
+class LoginView(BaseLoginView):
+    """
+    Log the user in, throttling the attempts on each account and from each
+    IP address before their password is checked.
+    """
+    throttle_scope = 'login'
+    throttle_classes = [UserTokenBucketThrottle, IPTokenBucketThrottle]
+
+
+class TokenRefreshView(get_refresh_view()):
+    """
+    Refresh the access token cookie, rotating the refresh token.
+    """
+    serializer_class = TokenRefreshSerializer
+
+
+class LogoutView(BaseLogoutView):
+    """
+    Log the user out and blacklist their refresh token, so that it can't
+    be used anymore even if it was copied from the cookie.
+    """
+
+    def logout(self, request):
+        response = super().logout(request)
+
+        refresh_token = request.COOKIES.get(rest_auth_settings.JWT_AUTH_REFRESH_COOKIE)
+
+        if refresh_token:
+            try:
+                RefreshToken(refresh_token).blacklist()
+            except TokenError:
+                # the token is invalid, expired or already blacklisted.
+                pass
+
+        return response
+
+
 class UserProfilePictureUpdateView(generics.UpdateAPIView):
     """
     Handle updating user's profile picture
+
+    The upload is processed in the background; the response's
+    `profile_picture_status` is `pending` until it is done.
     """
 
     def put(self, request: Request, *args, **kwargs) -> Response:
@@ -98,20 +147,17 @@ class UserProfilePictureUpdateView(generics.UpdateAPIView):
             return Response({"detail": "Invalid file type. Only .jpg, .jpeg or .png are allowed"},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        successful = upload_profile_pic(
-            uploaded_file, str(request.user.user_id))
-
-        if not successful:
-            return Response({'detail': 'An error occurred while uploading the image'},
-                            status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if not is_valid_image(uploaded_file):
+            return Response({"detail": "The uploaded file is not a valid image"},
+                            status=status.HTTP_400_BAD_REQUEST)
 
+        # decoding, resizing and uploading the image is done off the request.
         user: User = self.request.user
-        user.profile_picture = str(user.pk)
-        user.save()
+        queue_profile_picture(user, uploaded_file.read())
 
         updated_user = UserDetailsSerializer(user)
 
-        return Response(updated_user.data, status=status.HTTP_200_OK)
+        return Response(updated_user.data, status=status.HTTP_202_ACCEPTED)
 
 
 class UsernameUpdateView(generics.UpdateAPIView):
@@ -141,12 +187,11 @@ class UsernameUpdateView(generics.UpdateAPIView):
         except User.DoesNotExist:
             pass
 
-        slug = slugify_username(username)
-
         user: User = request.user
         user.username = username
-        user.username_slug = slug
-        user.save()
+
+        save_with_unique_slug(lambda: slugify_username(username, user),
+                              lambda slug: save_username_slug(user, slug))
 
         return Response(UserDetailsSerializer(user).data, status=status.HTTP_200_OK)
 
@@ -160,14 +205,9 @@ class UserAccountDeleteView(generics.DestroyAPIView):
     def delete(self, request: Request, *args, **kwargs) -> Response:
         user: User = request.user
 
-        # if the profile picture is the stringified user_id, then that means
-        # they had a custom profile picture
-        if user.profile_picture == str(user.pk):
-            deleted = delete_profile_pic(user.profile_picture)
-
-            if not deleted:
-                return Response({'detail': 'An error occurred while deleting your account. Please try again later'},
-                                status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if not delete_unused_profile_picture(user.profile_picture, excluded_user=user):
+            return Response({'detail': 'An error occurred while deleting your account. Please try again later'},
+                            status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
         user.delete()
 
@@ -0,0 +1,190 @@
+"""
+Compare the throughput of the phase board, project tasks and project members
+endpoints served by gunicorn's sync workers (WSGI, how the app used to be
+served) and by uvicorn workers (ASGI), under concurrent load.
+
+Both servers run the same number of worker processes against a SQLite
+database, with `--db-latency` seconds added to every query to simulate the
+round trip to a database server. Run from the directory of `manage.py`:
+
+    python -m benchmarks.async_reads --workers 2 --concurrency 32 --duration 10
+"""
+import os
+import sys
+import time
+import socket
+import argparse
+import datetime
+import tempfile
+import threading
+import subprocess
+import http.client
+
+SERVERS = {
+    'wsgi-sync': ['pms.wsgi:application'],
+    'asgi-uvicorn': ['pms.asgi:application', '--worker-class', 'uvicorn_worker.UvicornWorker'],
+}
+
+
+def create_data(tasks: int, members: int) -> tuple[str, list[str]]:
+    """
+    Create a project to read and return an access token and the URLs to request.
+    """
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command('migrate', verbosity=0, interactive=False)
+
+    from django.urls import reverse
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from apps.users.models import User
+    from apps.organizations.models import Organization, OrganizationMember
+    from apps.projects.models import Project, ProjectMember, ProjectPhase
+    from apps.tasks.models import Task
+
+    users = User.objects.bulk_create([
+        User(username=f'user{i}', email=f'user{i}@example.com') for i in range(members)])
+    user = users[0]
+
+    organization = Organization.objects.create(
+        organization_name='Benchmark org', organization_name_slug='benchmark-org',
+        organization_password='benchmark')
+    OrganizationMember.objects.bulk_create([
+        OrganizationMember(organization=organization, user=member) for member in users])
+
+    deadline = datetime.date.today() + datetime.timedelta(days=30)
+    project = Project.objects.create(
+        organization=organization, project_name='Benchmark project', deadline=deadline)
+    ProjectMember.objects.bulk_create([
+        ProjectMember(project=project, member=member,
+                      role=ProjectMember.MANAGER if member == user else ProjectMember.MEMBER)
+        for member in users[:members // 2]])
+
+    phase = ProjectPhase.objects.create(project=project, phase_name='Build')
+    Task.objects.bulk_create([
+        Task(project=project, project_phase=phase, task_name=f'task {i}', deadline=deadline,
+             status=(Task.IN_PROGRESS, Task.ON_HOLD, Task.DONE)[i % 3])
+        for i in range(tasks)])
+
+    urls = [
+        reverse('project_phase_detail', kwargs={'phase_id': phase.pk}),
+        reverse('project_tasks_retrieval', kwargs={'project_id': project.pk}),
+        reverse('project_members_list', kwargs={'project_id': project.pk}),
+        reverse('non_project_members_list', kwargs={'project_id': project.pk}),
+    ]
+
+    return str(AccessToken.for_user(user)), urls
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_for_server(port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+
+    raise RuntimeError(f'The server did not start on port {port}')
+
+
+def run_load(port: int, token: str, urls: list[str], concurrency: int, duration: float) -> dict:
+    """
+    Request the URLs in turn from `concurrency` threads for `duration` seconds.
+    """
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client(offset: int):
+        nonlocal errors
+        i = offset
+
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            try:
+                connection.request('GET', urls[i % len(urls)], headers={
+                    'Authorization': f'Bearer {token}', 'Connection': 'close'})
+                response = connection.getresponse()
+                response.read()
+                ok = response.status == 200
+            except OSError:
+                ok = False
+            finally:
+                connection.close()
+
+            with lock:
+                if ok:
+                    latencies.append(time.perf_counter() - start)
+                else:
+                    errors += 1
+            i += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    return {
+        'requests_per_second': len(latencies) / duration,
+        'median_ms': latencies[len(latencies) // 2] * 1000 if latencies else 0,
+        'p95_ms': latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0,
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--db-latency', type=float, default=0.005)
+    parser.add_argument('--tasks', type=int, default=60)
+    parser.add_argument('--members', type=int, default=20)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    os.environ['BENCHMARK_DATABASE'] = os.path.join(directory, 'db.sqlite3')
+    os.environ['DJANGO_SETTINGS_MODULE'] = 'benchmarks.settings'
+
+    token, urls = create_data(args.tasks, args.members)
+
+    print(f'{"server":<14} {"req/s":>8} {"median ms":>10} {"p95 ms":>8} {"errors":>7}')
+
+    for name, server_args in SERVERS.items():
+        port = free_port()
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', *server_args, '--workers', str(args.workers),
+             '--bind', f'127.0.0.1:{port}', '--log-level', 'warning'],
+            env={**os.environ, 'BENCHMARK_DB_LATENCY': str(args.db_latency)})
+
+        try:
+            wait_for_server(port)
+            # warm up the workers' caches and connections.
+            run_load(port, token, urls, args.workers, 1)
+
+            stats = run_load(port, token, urls, args.concurrency, args.duration)
+        finally:
+            server.terminate()
+            server.wait()
+
+        print(f'{name:<14} {stats["requests_per_second"]:>8.1f} {stats["median_ms"]:>10.1f} '
+              f'{stats["p95_ms"]:>8.1f} {stats["errors"]:>7}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Compare the peak memory and latency of rendering a profile picture with the
+previous implementation (full decode, one 300px PNG) and `render_avatars`
+(draft decode, 32/64/300px renditions).
+
+Each implementation runs in a fresh process so that its peak RSS is not
+hidden by the other one's. Run from the directory of `manage.py`:
+
+    python -m benchmarks.avatar_rendering --width 4000 --height 3000 --runs 5
+"""
+import sys
+import json
+import time
+import argparse
+import resource
+import subprocess
+import tempfile
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+from services.utils.image_processing import render_avatars
+
+IMPLEMENTATIONS = ('baseline', 'legacy', 'renditions')
+
+
+def legacy_process_profile_pic(uploaded_file) -> BytesIO:
+    """
+    The implementation `render_avatars` replaced.
+    """
+    image = Image.open(uploaded_file)
+    image = image.convert("RGBA")
+    image.thumbnail((300, 300))
+
+    mask = Image.new("L", (300, 300), 0)
+    mask_draw = Image.new("L", (300, 300), 255)
+    mask.paste(mask_draw, (0, 0), mask_draw)
+
+    rounded = ImageOps.fit(image, (300, 300), centering=(0.5, 0.5))
+    rounded.putalpha(mask)
+
+    buffer = BytesIO()
+    rounded.save(buffer, format="PNG", quality=85)
+    buffer.seek(0)
+
+    return buffer
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def run_worker(implementation: str, path: str, runs: int) -> dict:
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    latencies = []
+    output_bytes = 0
+
+    for _ in range(runs):
+        start = time.perf_counter()
+
+        if implementation == 'legacy':
+            output_bytes = len(legacy_process_profile_pic(
+                BytesIO(content)).getvalue())
+        elif implementation == 'renditions':
+            output_bytes = sum(len(buffer.getvalue())
+                               for buffer in render_avatars(BytesIO(content)).values())
+
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    return {
+        'implementation': implementation,
+        'median_ms': latencies[len(latencies) // 2] * 1000,
+        'peak_rss_mb': peak_rss_mb(),
+        'output_bytes': output_bytes,
+    }
+
+
+def make_photo(width: int, height: int) -> str:
+    """
+    Write a noisy JPEG (noise compresses like a photo) and return its path.
+    """
+    image = Image.effect_noise((width, height), 64).convert('RGB')
+
+    f = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
+    image.save(f, format='JPEG', quality=90)
+    f.close()
+
+    return f.name
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--width', type=int, default=4000)
+    parser.add_argument('--height', type=int, default=3000)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--image', help='Use this image instead of a generated one.')
+    parser.add_argument('--worker', choices=IMPLEMENTATIONS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.image, args.runs)))
+        return
+
+    path = args.image or make_photo(args.width, args.height)
+
+    print(f'{"implementation":<12} {"median ms":>10} {"peak RSS MB":>12} {"output KB":>10}')
+
+    for implementation in IMPLEMENTATIONS:
+        result = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.avatar_rendering', '--worker', implementation,
+             '--image', path, '--runs', str(args.runs)],
+            capture_output=True, text=True, check=True)
+        stats = json.loads(result.stdout)
+
+        print(f'{implementation:<12} {stats["median_ms"]:>10.1f} {stats["peak_rss_mb"]:>12.1f} '
+              f'{stats["output_bytes"] / 1024:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Compare the login throughput of the previous authentication backends
+(`ModelBackend`, then an email backend, then allauth's backend) with
+`UsernameOrEmailBackend`.
+
+Logins are authenticated in the process with the default password hasher,
+against a SQLite database with `--db-latency` seconds added to every query
+to simulate the round trip to a database server. Run from the directory of
+`manage.py`:
+
+    python -m benchmarks.login_backends --attempts 20 --db-latency 0.001
+"""
+import os
+import time
+import argparse
+import tempfile
+
+BACKENDS = {
+    'legacy': [
+        'django.contrib.auth.backends.ModelBackend',
+        'benchmarks.login_backends.LegacyEmailAuthBackend',
+        'allauth.account.auth_backends.AuthenticationBackend',
+    ],
+    'unified': [
+        'apps.users.auth.UsernameOrEmailBackend',
+    ],
+}
+
+# (login, password) of each kind of attempt.
+ATTEMPTS = {
+    'username': ('benchmarkuser', 'benchmarkpassword'),
+    'email': ('benchmark@example.com', 'benchmarkpassword'),
+    'wrong password': ('benchmark@example.com', 'wrongpassword'),
+    'unknown user': ('unknown@example.com', 'benchmarkpassword'),
+}
+
+
+class LegacyEmailAuthBackend:
+    """
+    The email backend `UsernameOrEmailBackend` replaced.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        from apps.users.models import User
+
+        try:
+            user = User.objects.get(email=username)
+            if user.check_password(password):
+                return user
+            return None
+        except User.DoesNotExist:
+            return None
+
+
+def measure(backends: list[str], login: str, password: str, attempts: int) -> dict:
+    from django.contrib.auth import authenticate
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext, override_settings
+
+    with override_settings(AUTHENTICATION_BACKENDS=backends):
+        with CaptureQueriesContext(connection) as queries:
+            authenticate(username=login, password=password)
+
+        start = time.perf_counter()
+        for _ in range(attempts):
+            authenticate(username=login, password=password)
+        elapsed = time.perf_counter() - start
+
+    return {
+        'logins_per_second': attempts / elapsed,
+        'ms_per_login': elapsed / attempts * 1000,
+        'queries': len(queries),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--attempts', type=int, default=20)
+    parser.add_argument('--db-latency', type=float, default=0.001)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    os.environ['BENCHMARK_DATABASE'] = os.path.join(directory, 'db.sqlite3')
+    os.environ['BENCHMARK_DB_LATENCY'] = str(args.db_latency)
+    os.environ['DJANGO_SETTINGS_MODULE'] = 'benchmarks.settings'
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command('migrate', verbosity=0, interactive=False)
+
+    from apps.users.models import User
+
+    User.objects.create_user(username='benchmarkuser', email='benchmark@example.com',
+                             password='benchmarkpassword')
+
+    print(f'{"attempt":<15} {"backends":<8} {"logins/s":>9} {"ms/login":>9} {"queries":>8}')
+
+    for attempt, (login, password) in ATTEMPTS.items():
+        for name, backends in BACKENDS.items():
+            stats = measure(backends, login, password, args.attempts)
+
+            print(f'{attempt:<15} {name:<8} {stats["logins_per_second"]:>9.1f} '
+                  f'{stats["ms_per_login"]:>9.1f} {stats["queries"]:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Settings of the servers started by the benchmarks.
+
+They use a SQLite database and a local memory cache so that the benchmarks
+run without Postgres, Redis or S3. `BENCHMARK_DB_LATENCY` (in seconds) is
+added to every query to simulate the round trip to a database server.
+"""
+import os
+import time
+from datetime import timedelta
+
+from django.db.backends.signals import connection_created
+
+from pms.settings import *  # noqa: F401,F403
+from pms.settings import AVATAR_STORAGES, SIMPLE_JWT, STORAGES
+
+SECRET_KEY = 'benchmark'
+
+DEBUG = False
+
+ALLOWED_HOSTS = ['127.0.0.1', 'localhost']
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.getenv('BENCHMARK_DATABASE'),
+    }
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+AWS_S3_REGION_NAME = 'us-east-1'
+
+STORAGES = {**STORAGES, 'avatars': AVATAR_STORAGES['local']}
+
+SIMPLE_JWT = {**SIMPLE_JWT, 'ACCESS_TOKEN_LIFETIME': timedelta(hours=1)}
+
+DATABASE_LATENCY = float(os.getenv('BENCHMARK_DB_LATENCY', 0))
+
+
+def _delay_query(execute, sql, params, many, context):
+    time.sleep(DATABASE_LATENCY)
+    return execute(sql, params, many, context)
+
+
+def _add_latency(sender, connection, **kwargs):
+    if DATABASE_LATENCY and _delay_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_delay_query)
+
+
+connection_created.connect(_add_latency)
@@ -0,0 +1,97 @@
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponseBase
+from django.views import View
+from rest_framework import exceptions
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import exception_handler
+
+
+class AsyncAPIView(View):
+    """
+    Base class of read-only API views with `async` handlers.
+
+    DRF views are synchronous: under an ASGI server each of their requests
+    runs in a thread. Views based on this class run on the event loop and
+    only leave it for blocking calls (e.g. the async ORM, which runs each
+    query in the request's thread), so a slow query or S3 call doesn't hold
+    a worker.
+
+    Handlers receive a DRF `Request` and return a DRF `Response`, which are
+    authenticated, negotiated and rendered like those of `APIView`. Only
+    authenticated users are allowed; permissions on objects must be checked
+    by the handlers.
+    """
+    renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES
+
+    async def dispatch(self, request: HttpRequest, *args, **kwargs) -> HttpResponseBase:
+        request = Request(request, authenticators=[
+            auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES])
+        self.request = request
+
+        try:
+            # authenticators query the database.
+            user = await sync_to_async(lambda: request.user)()
+
+            if not user.is_authenticated:
+                raise exceptions.NotAuthenticated()
+
+            renderer, media_type = self.perform_content_negotiation(request)
+            request.accepted_renderer, request.accepted_media_type = renderer, media_type
+
+            response = await super().dispatch(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        return self.finalize_response(request, response)
+
+    async def http_method_not_allowed(self, request: Request, *args, **kwargs):
+        raise exceptions.MethodNotAllowed(request.method)
+
+    def perform_content_negotiation(self, request: Request):
+        renderers = [renderer() for renderer in self.renderer_classes]
+
+        try:
+            return DefaultContentNegotiation().select_renderer(request, renderers)
+        except exceptions.NotAcceptable:
+            # like `APIView`, render the error with the first renderer.
+            request.accepted_renderer, request.accepted_media_type = renderers[0], renderers[0].media_type
+            raise
+
+    def handle_exception(self, exc: Exception) -> Response:
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            authenticate_header = self.get_authenticate_header()
+
+            if authenticate_header:
+                exc.auth_header = authenticate_header
+            else:
+                exc.status_code = 403
+
+        response = exception_handler(exc, {'view': self, 'request': self.request})
+
+        if response is None:
+            raise exc
+
+        return response
+
+    def get_authenticate_header(self) -> str | None:
+        authenticators = self.request.authenticators
+
+        if authenticators:
+            return authenticators[0].authenticate_header(self.request)
+        return None
+
+    def finalize_response(self, request: Request, response: HttpResponseBase) -> HttpResponseBase:
+        if isinstance(response, Response):
+            if not getattr(request, 'accepted_renderer', None):
+                renderer = self.renderer_classes[0]()
+                request.accepted_renderer, request.accepted_media_type = renderer, renderer.media_type
+
+            response.accepted_renderer = request.accepted_renderer
+            response.accepted_media_type = request.accepted_media_type
+            response.renderer_context = {'view': self, 'request': request,
+                                         'args': self.args, 'kwargs': self.kwargs}
+
+        return response
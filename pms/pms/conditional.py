@@ -0,0 +1,44 @@
+import hashlib
+from typing import Optional
+
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from rest_framework.request import Request
+
+
+def make_etag(*stamps) -> str:
+    """
+    Build an ETag from the stamps a response's content depends on (e.g. the
+    versions of the objects it shows and the requesting user's role).
+
+    The ETag is computed without building the response, so a request for an
+    unchanged resource can be answered before it is serialized.
+    """
+    digest = hashlib.md5(':'.join(str(stamp) for stamp in stamps).encode(),
+                         usedforsecurity=False).hexdigest()
+    return f'"{digest}"'
+
+
+def set_etag(response: HttpResponseBase, etag: str) -> HttpResponseBase:
+    """
+    Set the ETag of a response.
+
+    Browsers are asked to revalidate their copy on every use, which costs a
+    304 response when it is still up to date.
+    """
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def not_modified(request: Request | HttpRequest, etag: str) -> Optional[HttpResponseBase]:
+    """
+    Return a 304 response if the client's copy (`If-None-Match`) matches
+    `etag`, or None if the response must be built.
+    """
+    response = get_conditional_response(request, etag=etag)
+
+    if response is None:
+        return None
+
+    return set_etag(response, etag)
@@ -0,0 +1,123 @@
+import json
+import base64
+import binascii
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+
+class KeysetPagination:
+    """
+    Cursor (keyset) pagination over a fixed, unique ordering.
+
+    Instead of an OFFSET, each page continues from the ordering values of
+    the last row of the previous page, so fetching page N costs the same
+    as fetching the first page as long as an index covers the ordering.
+
+    The last field of `ordering` must be unique (e.g. the primary key) so that
+    the position of every row is unambiguous.
+    """
+    ordering: tuple[str, ...] = ()
+    page_size = 50
+    max_page_size = 200
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+
+    def __init__(self):
+        self.next_cursor: str | None = None
+
+    def is_requested(self, request: Request) -> bool:
+        """
+        Whether the request asks for a page, for views that only paginate
+        on demand.
+        """
+        return any(param in request.query_params
+                   for param in (self.cursor_query_param, self.page_size_query_param))
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request) -> list[Model]:
+        queryset, page_size = self.get_page_queryset(queryset, request)
+        return self.get_page(list(queryset), page_size)
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request) -> list[Model]:
+        queryset, page_size = self.get_page_queryset(queryset, request)
+        return self.get_page([row async for row in queryset], page_size)
+
+    def get_page_queryset(self, queryset: QuerySet, request: Request) -> tuple[QuerySet, int]:
+        """
+        Return the (unevaluated) rows of the requested page and the page's size.
+        """
+        page_size = self.get_page_size(request)
+        cursor = request.query_params.get(self.cursor_query_param)
+
+        queryset = queryset.order_by(*self.ordering)
+
+        if cursor:
+            position = self.decode_cursor(cursor, queryset.model)
+            queryset = queryset.filter(self.get_position_filter(position))
+
+        # fetch one extra row to know whether there is a next page.
+        return queryset[:page_size + 1], page_size
+
+    def get_page(self, rows: list[Model], page_size: int) -> list[Model]:
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            self.next_cursor = self.encode_cursor(rows[-1])
+        else:
+            self.next_cursor = None
+
+        return rows
+
+    def get_page_size(self, request: Request) -> int:
+        page_size = request.query_params.get(self.page_size_query_param)
+
+        if not page_size:
+            return self.page_size
+
+        try:
+            page_size = int(page_size)
+        except ValueError:
+            raise ValidationError(
+                {self.page_size_query_param: 'A valid integer is required.'})
+
+        if page_size < 1:
+            raise ValidationError(
+                {self.page_size_query_param: 'Must be a positive integer.'})
+
+        return min(page_size, self.max_page_size)
+
+    def get_position_filter(self, position: list) -> Q:
+        """
+        Build a filter matching the rows that come after `position`.
+
+        For an ordering (a, b) this is `a > x OR (a = x AND b > y)`.
+        """
+        position_filter = Q()
+        equal = Q()
+
+        for field_name, value in zip(self.ordering, position):
+            position_filter |= equal & Q(**{f'{field_name}__gt': value})
+            equal &= Q(**{field_name: value})
+
+        return position_filter
+
+    def encode_cursor(self, instance: Model) -> str:
+        meta = instance._meta
+        position = [meta.get_field(field_name).value_to_string(instance)
+                    for field_name in self.ordering]
+
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, cursor: str, model: type[Model]) -> list:
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError
+
+            return [model._meta.get_field(field_name).to_python(value)
+                    for field_name, value in zip(self.ordering, position)]
+        except (ValueError, TypeError, binascii.Error, DjangoValidationError):
+            raise ValidationError(
+                {self.cursor_query_param: 'Invalid cursor.'})
@@ -0,0 +1,32 @@
+import io
+import csv
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class CSVParser(BaseParser):
+    """
+    Parses CSV content with a header row into a list of dicts.
+
+    Each row maps the (stripped) header names to the row's values. Empty
+    values are left out so that they are treated as missing.
+    """
+    media_type = 'text/csv'
+
+    def parse(self, stream, media_type=None, parser_context=None) -> list[dict]:
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            text = io.StringIO(stream.read().decode(encoding), newline='')
+            reader = csv.DictReader(text)
+
+            return [
+                {key.strip(): value for key, value in row.items()
+                 if key is not None and value not in (None, '')}
+                for row in reader
+            ]
+        except (csv.Error, UnicodeDecodeError) as exc:
+            raise ParseError(f'CSV parse error - {exc}')
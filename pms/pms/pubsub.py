@@ -0,0 +1,197 @@
+import time
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.db import transaction
+
+# Prefix of the Redis channels messages are published on.
+CHANNEL_PREFIX = 'events:'
+
+# Number of messages kept for a subscriber that doesn't read them fast enough.
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# How long the listener waits before reconnecting to Redis.
+RECONNECT_DELAY = 1  # seconds
+
+
+def get_redis_client():
+    """
+    Return the Redis client of the shared cache, or None if it isn't Redis.
+    """
+    # `django.core.cache.cache` is a proxy, so check the backend itself.
+    shared_cache = caches['default']
+
+    if isinstance(shared_cache, RedisCache):
+        return shared_cache._cache.get_client(write=True)
+    return None
+
+
+class Subscription:
+    """
+    Messages published on a channel, queued for one async consumer.
+
+    If the consumer falls behind by more than `SUBSCRIBER_QUEUE_SIZE`
+    messages, or messages may have been lost (e.g. Redis disconnected),
+    the subscription is marked as `lost` and `get` returns None.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.lost = False
+
+    def deliver(self, message: str | None) -> None:
+        """
+        Queue a message, or mark the subscription as lost if it is None.
+        Safe to call from any thread.
+        """
+        self.loop.call_soon_threadsafe(self._put, message)
+
+    def _put(self, message: str | None) -> None:
+        if self.lost:
+            return
+
+        if message is not None:
+            try:
+                self.queue.put_nowait(message)
+                return
+            except asyncio.QueueFull:
+                pass
+
+        self.lost = True
+
+        # drop the queued messages and wake up the consumer.
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def get(self) -> str | None:
+        """
+        Wait for the next message. Returns None once the subscription is lost.
+        """
+        if self.lost:
+            return None
+        return await self.queue.get()
+
+
+_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(set)
+_subscriptions_lock = threading.Lock()
+_listener: threading.Thread | None = None
+_listener_lock = threading.Lock()
+
+
+@contextmanager
+def subscribe(channel: str) -> Iterator[Subscription]:
+    """
+    Subscribe the current coroutine to the messages published on `channel`.
+
+    Every process subscribes to Redis once and fans the messages out to its
+    own subscribers. Without Redis, only messages published by the current
+    process are received.
+    """
+    _start_listener()
+
+    subscription = Subscription()
+
+    with _subscriptions_lock:
+        _subscriptions[channel].add(subscription)
+
+    try:
+        yield subscription
+    finally:
+        with _subscriptions_lock:
+            _subscriptions[channel].discard(subscription)
+            if not _subscriptions[channel]:
+                del _subscriptions[channel]
+
+
+def publish(channel: str, message: str | Callable[[], str]) -> None:
+    """
+    Publish a message to the subscribers of `channel` in every process,
+    once the current transaction commits.
+
+    `message` may be a callable building the message, which is then only
+    called if the transaction commits.
+    """
+    def publish_on_commit():
+        _publish(channel, message() if callable(message) else message)
+
+    transaction.on_commit(publish_on_commit)
+
+
+def _publish(channel: str, message: str) -> None:
+    client = get_redis_client()
+
+    if client is None:
+        _deliver(channel, message)
+        return
+
+    try:
+        client.publish(CHANNEL_PREFIX + channel, message)
+    except Exception:
+        logging.exception('Could not publish a message on %s', channel)
+
+
+def _deliver(channel: str, message: str | None) -> None:
+    with _subscriptions_lock:
+        subscriptions = list(_subscriptions.get(channel, ()))
+
+    for subscription in subscriptions:
+        try:
+            subscription.deliver(message)
+        except RuntimeError:
+            # the subscriber's event loop is closed; it won't read anymore.
+            with _subscriptions_lock:
+                _subscriptions.get(channel, set()).discard(subscription)
+
+
+def _start_listener() -> None:
+    """
+    Start the thread receiving the messages published through Redis.
+
+    It is started on the first subscription so that it runs in each
+    (forked) server worker rather than in the parent process.
+    """
+    global _listener
+
+    with _listener_lock:
+        if _listener is not None and _listener.is_alive():
+            return
+
+        if get_redis_client() is None:
+            return
+
+        _listener = threading.Thread(target=_listen, name='pubsub-listener', daemon=True)
+        _listener.start()
+
+
+def _listen() -> None:
+    while True:
+        client = get_redis_client()
+        if client is None:
+            # the cache isn't Redis anymore (e.g. overridden in tests).
+            return
+
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.psubscribe(CHANNEL_PREFIX + '*')
+
+            for message in pubsub.listen():
+                channel = message['channel'].decode()[len(CHANNEL_PREFIX):]
+                _deliver(channel, message['data'].decode())
+        except Exception:
+            logging.exception('Pub/sub listener disconnected')
+
+        # messages may have been missed while disconnected.
+        with _subscriptions_lock:
+            channels = list(_subscriptions)
+        for channel in channels:
+            _deliver(channel, None)
+
+        time.sleep(RECONNECT_DELAY)
@@ -0,0 +1,56 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Renders data as newline delimited JSON.
+
+    Views that support this format usually stream their items themselves;
+    this renderer lets content negotiation accept `application/x-ndjson`
+    and renders any regular response (e.g. errors) as a single line.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b''
+
+        return render_json_line(data)
+
+
+def render_json_line(data) -> bytes:
+    """
+    Serialize `data` to a single compact line of JSON.
+    """
+    return json.dumps(data, cls=JSONEncoder, separators=(',', ':')).encode() + b'\n'
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Renders data as a server-sent event.
+
+    Views that support this format stream their events themselves; this
+    renderer lets content negotiation accept `text/event-stream` and renders
+    any regular response (e.g. errors) as a single `error` event.
+    """
+    media_type = 'text/event-stream'
+    format = 'sse'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b''
+
+        return render_event('error', data).encode()
+
+
+def render_event(event: str, data) -> str:
+    """
+    Format a server-sent event named `event` with `data` serialized as JSON.
+    """
+    return f'event: {event}\ndata: {json.dumps(data, cls=JSONEncoder, separators=(",", ":"))}\n\n'
@@ -0,0 +1,64 @@
+from typing import Callable, Iterable, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest
+from rest_framework.request import Request
+
+# How long a user's role in a project or organization is cached.
+ROLE_CACHE_TIMEOUT = 5 * 60  # 5 minutes
+
+# Cached in place of a role for users who are not members, so that
+# repeated unauthorized requests don't hit the database either.
+NO_ROLE = ''
+
+
+def get_cached_role(request: Request | HttpRequest, cache_key: str,
+                    load_role: Callable[[], Optional[str]]) -> Optional[str]:
+    """
+    Resolve a membership role, looking it up at most once per request.
+
+    The role is first looked up in the request's memo, then in the cache
+    and only then loaded from the database with `load_role`.
+
+    params:
+        - request: The current request.
+        - cache_key: Cache key identifying the (user, project/organization) pair.
+        - load_role: Callable returning the role from the database, or None
+          if the user is not a member.
+        - return: The role, or None if the user is not a member.
+    """
+    # Memoize on the underlying Django request so the memo is shared by the
+    # DRF request, the permission classes and the view.
+    http_request = getattr(request, '_request', request)
+    roles: dict = http_request.__dict__.setdefault('_membership_roles', {})
+
+    if cache_key in roles:
+        return roles[cache_key]
+
+    role = cache.get(cache_key)
+
+    if role is None:
+        role = load_role() or NO_ROLE
+        cache.set(cache_key, role, timeout=ROLE_CACHE_TIMEOUT)
+
+    roles[cache_key] = role or None
+
+    return roles[cache_key]
+
+
+def invalidate_cached_roles(cache_keys: Iterable[str]) -> None:
+    """
+    Remove cached roles.
+
+    The roles are removed right away and once more when the current
+    transaction commits, so that a role read by another request before
+    the commit is not kept.
+    """
+    cache_keys = list(cache_keys)
+
+    if not cache_keys:
+        return
+
+    cache.delete_many(cache_keys)
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
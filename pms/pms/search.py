@@ -0,0 +1,52 @@
+from django.db import connections
+from django.db.models import BooleanField, Case, F, Lookup, Q, QuerySet, Value, When
+from django.contrib.postgres.search import TrigramSimilarity
+
+# Maximum number of results returned by a search.
+SEARCH_LIMIT = 20
+
+
+class ILikeContains(Lookup):
+    """
+    `field ILIKE '%term%'` on the bare column.
+
+    Django's `icontains` compiles to `UPPER(field::text) LIKE UPPER(...)` on
+    PostgreSQL, which a `gin_trgm_ops` index on `field` can't serve.
+    """
+    lookup_name = 'ilike_contains'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} ILIKE {rhs}', [*lhs_params, *rhs_params]
+
+
+def ranked_search(queryset: QuerySet, field: str, term: str, limit: int = SEARCH_LIMIT) -> QuerySet:
+    """
+    Search `queryset` for rows whose `field` matches `term`, best matches first.
+
+    Rows whose `field` starts with `term` come first (typeahead). On PostgreSQL,
+    rows that are similar to `term` also match and are ranked by trigram
+    similarity; both the similarity (`%`) and the substring (`ILIKE`) filters are
+    served by a `gin_trgm_ops` index on `field`. Other databases (e.g. SQLite in
+    tests) fall back to a substring match.
+    """
+    matches = Q(**{f'{field}__icontains': term})
+    annotations = {
+        'is_prefix': Case(
+            When(**{f'{field}__istartswith': term}, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+    }
+    ordering = ['-is_prefix']
+
+    connection = connections[queryset.db]
+
+    if connection.vendor == 'postgresql':
+        pattern = f'%{connection.ops.prep_for_like_query(term)}%'
+        matches = Q(ILikeContains(F(field), pattern)) | Q(**{f'{field}__trigram_similar': term})
+        annotations['similarity'] = TrigramSimilarity(field, term)
+        ordering.append('-similarity')
+
+    return queryset.filter(matches).annotate(**annotations).order_by(*ordering, field)[:limit]
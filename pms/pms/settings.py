@@ -48,6 +48,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.sites',
+    'django.contrib.postgres',
 
     # local apps
     'apps.users.apps.UsersConfig',
@@ -164,19 +165,28 @@ AUTH_PASSWORD_VALIDATORS = [
 
 # Authentication
 AUTHENTICATION_BACKENDS = [
-    'django.contrib.auth.backends.ModelBackend',
-    'apps.users.auth.EmailAuthBackend',
-    'allauth.account.auth_backends.AuthenticationBackend',
+    'apps.users.auth.UsernameOrEmailBackend',
 ]
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'dj_rest_auth.jwt_auth.JWTCookieAuthentication',
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.CachedJWTCookieAuthentication',
+        'apps.users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # Token buckets of the endpoints checking passwords, see `pms.throttling`.
+    'DEFAULT_THROTTLE_RATES': {
+        'organization_auth_user': '10/min',
+        'organization_auth_ip': '30/min',
+        'organization_auth_organization': '30/min',
+        'login_user': '10/min',
+        'login_ip': '30/min',
+        'registration_ip': '30/hour',
+    },
+    # nginx appends the client's address to X-Forwarded-For.
+    'NUM_PROXIES': 1,
 }
 
 SIMPLE_JWT = {
@@ -241,6 +251,12 @@ AWS_STORAGE_BUCKET_NAME = os.getenv('AWS_STORAGE_BUCKET_NAME')
 
 # profile picture
 DEFAULT_PROFILE_PICTURE = 'DEFAULTPROFILEPICTURE'
+# Static file shown for users who have the default profile picture.
+DEFAULT_PROFILE_PICTURE_STATIC = 'default_profile_picture.png'
+
+# Number of threads in each server process that run work moved off the
+# request (e.g. processing uploaded profile pictures).
+BACKGROUND_WORKERS = int(os.getenv('BACKGROUND_WORKERS', 2))
 
 STATIC_ROOT = BASE_DIR / 'staticfiles/'
 
@@ -251,6 +267,43 @@ STATICFILES_DIRS = [
     BASE_DIR / "static" / "dist",
 ]
 
+MEDIA_ROOT = BASE_DIR / 'media/'
+
+MEDIA_URL = '/media/'
+
+# Profile pictures are stored either in the S3 bucket ('s3') or on the
+# local filesystem under MEDIA_ROOT ('local', served by nginx). Both
+# serve them from public, content-addressed URLs.
+AVATAR_STORAGE_BACKEND = os.getenv('AVATAR_STORAGE_BACKEND', 's3')
+
+AVATAR_STORAGES = {
+    's3': {
+        'BACKEND': 'services.s3.storage.S3Storage',
+        'OPTIONS': {
+            'location': 'avatars',
+            'base_url': os.getenv('AVATAR_BASE_URL'),
+        },
+    },
+    'local': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        'OPTIONS': {
+            'location': MEDIA_ROOT / 'avatars',
+            'base_url': f'{MEDIA_URL}avatars/',
+            'allow_overwrite': True,
+        },
+    },
+}
+
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+    'avatars': AVATAR_STORAGES[AVATAR_STORAGE_BACKEND],
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
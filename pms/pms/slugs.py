@@ -0,0 +1,64 @@
+import itertools
+from typing import Callable, TypeVar
+
+from django.db import IntegrityError, transaction
+from django.db.models import QuerySet
+from django.utils.text import slugify
+
+T = TypeVar('T')
+
+# How many times a save is retried when a concurrent request takes its slug.
+SLUG_ATTEMPTS = 3
+
+
+def allocate_slug(queryset: QuerySet, field: str, value: str) -> str:
+    """
+    Slugify `value` and ensure the slug is not taken in `queryset`.
+
+    All the slugs that could collide (`<slug>` and `<slug>-<n>`) are fetched
+    with a single query, and the first free one is picked in memory: `<slug>`
+    if it is free, otherwise `<slug>-1`, `<slug>-2`, ...
+
+    params:
+        - queryset: The rows whose `field` the slug must not collide with.
+        - field: The name of the slug field.
+        - value: The value to slugify.
+        - return: A slug that is free at the time of the query.
+    """
+    slug = slugify(value)
+
+    # slugs only contain letters, digits, underscores and hyphens, which
+    # need no escaping in a regular expression.
+    taken = set(queryset.filter(**{f'{field}__regex': rf'^{slug}(-[0-9]+)?$'})
+                .values_list(field, flat=True))
+
+    if slug not in taken:
+        return slug
+
+    return next(candidate for candidate in (f'{slug}-{n}' for n in itertools.count(1))
+                if candidate not in taken)
+
+
+def save_with_unique_slug(allocate: Callable[[], str], save: Callable[[str], T],
+                          attempts: int = SLUG_ATTEMPTS) -> T:
+    """
+    Save a row with a freshly allocated slug, retrying if the slug gets taken.
+
+    A slug that was free when it was allocated can be taken by a concurrent
+    request before the row is saved. The unique constraint on the slug field
+    then raises an IntegrityError and a new slug is allocated.
+
+    params:
+        - allocate: Callable returning a free slug.
+        - save: Callable saving the row with the given slug.
+        - attempts: How many slugs to try before giving up.
+        - return: The result of `save`.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            # a savepoint, so that a failed attempt doesn't break an outer transaction.
+            with transaction.atomic():
+                return save(allocate())
+        except IntegrityError:
+            if attempt == attempts:
+                raise
@@ -0,0 +1,240 @@
+import time
+import logging
+import threading
+from collections import Counter
+from typing import Optional
+
+from django.core.cache import cache
+from redis.commands.core import Script
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+from pms.pubsub import get_redis_client
+
+# Redis hash counting the allowed and rejected requests of each scope.
+COUNTERS_KEY = 'throttle:counters'
+
+# Takes a token from a bucket and counts the outcome, atomically.
+#   KEYS[1]: the bucket, KEYS[2]: the counters.
+#   ARGV[1]: capacity, ARGV[2]: refill rate (tokens/second), ARGV[3]: scope.
+# Returns whether the request is allowed and how long to wait otherwise.
+TAKE_TOKEN_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'timestamp')
+local tokens = tonumber(bucket[1]) or capacity
+local timestamp = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - timestamp) * rate)
+
+local allowed, wait = 0, 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    wait = (1 - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'timestamp', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate))
+redis.call('HINCRBY', KEYS[2], ARGV[3] .. (allowed == 1 and ':allowed' or ':rejected'), 1)
+
+return {allowed, tostring(wait)}
+"""
+
+# Built once; it is run with the client of each call. As bytes, the script
+# doesn't need a client to be hashed.
+_take_token_script = Script(None, TAKE_TOKEN_SCRIPT.encode())
+
+# Without Redis (e.g. in development), buckets are kept in the default
+# cache and counted in the process.
+_local_lock = threading.Lock()
+_local_counters: Counter[str] = Counter()
+
+
+def take_token(key: str, scope: str, capacity: int, rate: float) -> tuple[bool, float]:
+    """
+    Take a token from a bucket, counting the outcome under `scope`.
+
+    Buckets start full with `capacity` tokens and are refilled with `rate`
+    tokens per second. A request is allowed if a token is left.
+
+    params:
+        - key: The key of the bucket.
+        - scope: The throttle scope the bucket belongs to.
+        - capacity: Maximum number of tokens in the bucket.
+        - rate: Number of tokens added to the bucket per second.
+        - return: Whether the request is allowed, and if not, how many
+          seconds until a token is available.
+    """
+    client = get_redis_client()
+
+    if client is None:
+        return _take_local_token(key, scope, capacity, rate)
+
+    try:
+        allowed, wait = _take_token_script(
+            keys=[key, COUNTERS_KEY], args=[capacity, rate, scope], client=client)
+    except Exception:
+        # don't lock everybody out when Redis is down.
+        logging.exception('Could not take a token from %s', key)
+        return True, 0
+
+    return bool(allowed), float(wait)
+
+
+def _take_local_token(key: str, scope: str, capacity: int, rate: float) -> tuple[bool, float]:
+    with _local_lock:
+        now = time.time()
+        tokens, timestamp = cache.get(key, (capacity, now))
+        tokens = min(capacity, tokens + max(0, now - timestamp) * rate)
+
+        allowed, wait = tokens >= 1, 0
+        if allowed:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+
+        cache.set(key, (tokens, now), timeout=int(capacity / rate) + 1)
+        _local_counters[f'{scope}:{"allowed" if allowed else "rejected"}'] += 1
+
+    return allowed, wait
+
+
+def get_throttle_counters() -> dict[str, int]:
+    """
+    Return the number of allowed and rejected requests of each scope,
+    keyed by `<scope>:allowed` and `<scope>:rejected`.
+    """
+    client = get_redis_client()
+
+    if client is None:
+        with _local_lock:
+            return dict(_local_counters)
+
+    return {field.decode(): int(count)
+            for field, count in client.hgetall(COUNTERS_KEY).items()}
+
+
+def reset_throttle_counters() -> None:
+    client = get_redis_client()
+
+    if client is None:
+        with _local_lock:
+            _local_counters.clear()
+    else:
+        client.delete(COUNTERS_KEY)
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    """
+    Throttle requests with token buckets, checked before the view runs.
+
+    Unlike `SimpleRateThrottle`, which keeps a history of requests, a
+    bucket is a token count and a timestamp updated with a single Redis
+    script, so concurrent requests can't overdraw it.
+
+    Buckets are kept per client identity (see `get_bucket_ident`), with
+    the rate of the `<throttle_scope>_<kind>` scope of
+    `DEFAULT_THROTTLE_RATES`: a `10/min` rate allows bursts of 10 requests,
+    refilled at 10 per minute. Views or kinds without a rate are not
+    throttled.
+    """
+    # Kind of identity the buckets are kept for.
+    kind: str
+    cache_format = 'throttle:%(scope)s:%(ident)s'
+
+    def __init__(self):
+        # The rate depends on the view, see `allow_request`.
+        pass
+
+    def allow_request(self, request: Request, view) -> bool:
+        throttle_scope = getattr(view, 'throttle_scope', None)
+        if not throttle_scope:
+            return True
+
+        self.scope = f'{throttle_scope}_{self.kind}'
+
+        # read when throttling, so that overridden settings apply.
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+        if rate is None:
+            return True
+
+        ident = self.get_bucket_ident(request)
+        if not ident:
+            return True
+
+        capacity, period = self.parse_rate(rate)
+        key = self.cache_format % {'scope': self.scope, 'ident': ident}
+
+        allowed, self.wait_time = take_token(key, self.scope, capacity, capacity / period)
+
+        return allowed
+
+    def get_bucket_ident(self, request: Request) -> Optional[str]:
+        """
+        Return the identity whose bucket the request takes a token from,
+        or None to let it through.
+        """
+        raise NotImplementedError('.get_bucket_ident() must be overridden')
+
+    def wait(self) -> float:
+        return self.wait_time
+
+
+def _get_field(request: Request, name: str) -> Optional[str]:
+    """
+    Return a normalized field of the request's data, if any.
+    """
+    data = request.data
+    value = data.get(name) if hasattr(data, 'get') else None
+
+    if not isinstance(value, str):
+        return None
+    return value.strip().lower() or None
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Buckets per user: the authenticated user, or for logins, the account
+    whose credentials are tried from a given IP address.
+
+    Login buckets include the IP address so that nobody can lock an account
+    out by trying wrong passwords for it; attempts on one account from many
+    addresses are limited by their IP buckets.
+    """
+    kind = 'user'
+
+    def get_bucket_ident(self, request: Request) -> Optional[str]:
+        if request.user and request.user.is_authenticated:
+            return str(request.user.pk)
+
+        login = _get_field(request, 'username') or _get_field(request, 'email')
+
+        if login is None:
+            return None
+        return f'{login}:{self.get_ident(request)}'
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Buckets per client IP address.
+    """
+    kind = 'ip'
+
+    def get_bucket_ident(self, request: Request) -> Optional[str]:
+        return self.get_ident(request)
+
+
+class OrganizationTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Buckets per organization whose password is tried, named by the
+    `organizationName` of the request.
+    """
+    kind = 'organization'
+
+    def get_bucket_ident(self, request: Request) -> Optional[str]:
+        return _get_field(request, 'organizationName')
@@ -0,0 +1,223 @@
+import json
+import time
+import pickle
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+from pms.pubsub import get_redis_client
+
+# Redis channel on which invalidated keys are broadcast to every process.
+INVALIDATION_CHANNEL = 'tiered-cache:invalidate'
+
+# How long the invalidation listener waits before reconnecting to Redis.
+RECONNECT_DELAY = 1  # seconds
+
+_MISSING = object()
+
+
+class LocalCache:
+    """
+    A thread-safe, bounded LRU cache with a TTL, local to the process.
+    """
+
+    def __init__(self, max_entries: int, timeout: float):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """
+        Return the value of `key`, or `_MISSING` if it is absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return _MISSING
+
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return _MISSING
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.timeout)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class TieredCache:
+    """
+    A per-process LRU cache in front of the shared cache (`CACHES['default']`).
+
+    Values are looked up in the process first, then in the shared cache and
+    only then loaded (e.g. from the database). The local entries expire after
+    `local_timeout` seconds; with Redis, deleted keys are also broadcast to
+    every process over pub/sub so that they are evicted right away.
+
+    Values are kept pickled in the process, so every lookup returns a new
+    copy that callers may modify.
+
+    params:
+        - name: Name of the cache, used as the prefix of its keys.
+        - timeout: How long values are kept in the shared cache.
+        - local_timeout: How long values are kept in the process.
+        - max_entries: Maximum number of values kept in the process.
+    """
+
+    def __init__(self, name: str, timeout: int = 5 * 60, local_timeout: float = 30,
+                 max_entries: int = 1024):
+        self.name = name
+        self.timeout = timeout
+        self.local = LocalCache(max_entries, local_timeout)
+
+        _caches[name] = self
+
+    def make_key(self, key) -> str:
+        return f'{self.name}:{key}'
+
+    def get_or_set(self, key, load: Callable[[], Any]) -> Any:
+        """
+        Return the value of `key`, calling `load` to get it if it is not cached.
+
+        A None returned by `load` is not cached. Exceptions raised by `load`
+        (e.g. `DoesNotExist`) are propagated and not cached either.
+        """
+        key = self.make_key(key)
+
+        pickled = self.local.get(key)
+        if pickled is not _MISSING:
+            return pickle.loads(pickled)
+
+        _start_listener()
+
+        value = cache.get(key)
+
+        if value is None:
+            value = load()
+            if value is None:
+                return None
+            cache.set(key, value, timeout=self.timeout)
+
+        self.local.set(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+        return value
+
+    def delete_many(self, keys: Iterable) -> None:
+        """
+        Invalidate keys in every process.
+
+        The keys are invalidated right away and once more when the current
+        transaction commits, so that a value read by another request before
+        the commit is not kept.
+        """
+        keys = [self.make_key(key) for key in keys]
+
+        if not keys:
+            return
+
+        self._invalidate(keys)
+        transaction.on_commit(lambda: self._invalidate(keys))
+
+    def delete(self, key) -> None:
+        self.delete_many([key])
+
+    def _invalidate(self, keys: list[str]) -> None:
+        self.local.delete_many(keys)
+        cache.delete_many(keys)
+        _publish(self.name, keys)
+
+
+_caches: dict[str, TieredCache] = {}
+_listener: threading.Thread | None = None
+_listener_lock = threading.Lock()
+
+
+def _publish(name: str, keys: list[str]) -> None:
+    client = get_redis_client()
+
+    if client is None:
+        return
+
+    try:
+        client.publish(INVALIDATION_CHANNEL, json.dumps(
+            {'cache': name, 'keys': keys}))
+    except Exception:
+        # the local entries of other processes still expire.
+        logging.exception('Could not broadcast the invalidation of %s', keys)
+
+
+def _start_listener() -> None:
+    """
+    Start the thread evicting the keys invalidated by other processes.
+
+    It is started on the first cache miss so that it runs in each (forked)
+    server worker rather than in the parent process.
+    """
+    global _listener
+
+    with _listener_lock:
+        if _listener is not None and _listener.is_alive():
+            return
+
+        if get_redis_client() is None:
+            return
+
+        _listener = threading.Thread(target=_listen, name='tiered-cache-invalidation',
+                                     daemon=True)
+        _listener.start()
+
+
+def _listen() -> None:
+    while True:
+        client = get_redis_client()
+        if client is None:
+            # the cache isn't Redis anymore (e.g. overridden in tests).
+            return
+
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+
+            for message in pubsub.listen():
+                _evict(message['data'])
+        except Exception:
+            logging.exception('Cache invalidation listener disconnected')
+
+        # invalidations may have been missed while disconnected.
+        for tiered_cache in _caches.values():
+            tiered_cache.local.clear()
+
+        time.sleep(RECONNECT_DELAY)
+
+
+def _evict(data: bytes | str) -> None:
+    try:
+        message = json.loads(data)
+        tiered_cache = _caches.get(message['cache'])
+    except (ValueError, KeyError, TypeError):
+        return
+
+    if tiered_cache is not None:
+        tiered_cache.local.delete_many(message['keys'])
@@ -14,6 +14,8 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include, re_path
 
@@ -27,5 +29,7 @@ urlpatterns = [
     path('', include('apps.tasks.urls')),
     path('organizations/', include('apps.organizations.urls')),
     path('', include('apps.projects.urls')),
+    # locally stored profile pictures; served by nginx outside of development.
+    *static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT),
     re_path(r'^.*$', FrontendView.as_view(), name='react_frontend'),
 ]
@@ -2,6 +2,8 @@ import re
 import uuid
 import string
 
+from django.db.models import QuerySet
+
 
 pattern = re.compile(r'(?<!^)(?=[A-Z])')
 
@@ -45,3 +47,19 @@ def base_62_pk():
     """Convert a UUID object to a base62-encoded string."""
     uuid_obj = uuid.uuid4()
     return _to_base62(uuid_obj.int)
+
+
+def is_cascade_deletion(sender, origin) -> bool:
+    """
+    Whether rows of `sender` are deleted along with rows of another model,
+    e.g. the tasks of a deleted phase.
+
+    `origin` is the `origin` argument of the delete signals: the instance or
+    queryset whose `delete()` started the deletion.
+    """
+    if origin is None:
+        return False
+
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+
+    return origin_model is not sender
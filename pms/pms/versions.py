@@ -0,0 +1,46 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+# How long an unchanged version stamp is kept. An expired stamp restarts from
+# the current time, so it only makes the cached data derived from it outdated.
+VERSION_TIMEOUT = 24 * 60 * 60  # 1 day
+
+
+def _initial_version() -> int:
+    # Start from the current time rather than from 1, so that a version evicted
+    # from the cache is never restarted at a value that was already used.
+    return int(time.time() * 1000)
+
+
+def get_version(key: str) -> int:
+    """
+    Get the current value of a version stamp, creating it if needed.
+    """
+    version = cache.get(key)
+
+    if version is None:
+        cache.add(key, _initial_version(), timeout=VERSION_TIMEOUT)
+        version = cache.get(key)
+
+    return version
+
+
+def _bump(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), timeout=VERSION_TIMEOUT)
+
+
+def bump_version(key: str) -> None:
+    """
+    Change a version stamp, marking everything derived from it as outdated.
+
+    The version is bumped right away and once more when the current transaction
+    commits, so that data read by another request before the commit is not
+    served under the new version.
+    """
+    _bump(key)
+    transaction.on_commit(lambda: _bump(key))
@@ -0,0 +1,86 @@
+import os
+import hashlib
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, storages
+from django.templatetags.static import static
+
+from services.utils.image_processing import AVATAR_FORMAT, AVATAR_SIZES, render_avatars
+
+FULL_SIZE = max(AVATAR_SIZES)
+
+AVATAR_EXTENSIONS = {'WEBP': '.webp', 'PNG': '.png'}
+
+
+def get_avatar_storage() -> Storage:
+    """
+    Return the storage backend configured as `STORAGES['avatars']`.
+    """
+    return storages['avatars']
+
+
+def is_stored_picture(picture_name: str) -> bool:
+    """
+    Check whether a picture name refers to a picture in the avatar storage.
+
+    Stored pictures are named after the digest of their content and have an
+    extension. Anything else (the default picture, or a picture uploaded
+    before the avatar storage and not migrated yet) is shown as the default picture.
+    """
+    return picture_name != settings.DEFAULT_PROFILE_PICTURE and bool(os.path.splitext(picture_name)[1])
+
+
+def rendition_name(picture_name: str, size: int) -> str:
+    """
+    Return the file name of a rendition of a picture.
+    """
+    stem, extension = os.path.splitext(picture_name)
+    return f'{stem}-{size}{extension}'
+
+
+def save_profile_pic(picture: File) -> str:
+    """
+    Render and store the renditions of a profile picture.
+
+    The picture is named after the digest of its largest rendition, so its
+    URLs change whenever its content changes and can be cached forever.
+
+    params:
+        - picture: The uploaded image.
+        - return: The name of the stored picture.
+    """
+    renditions = render_avatars(picture)
+
+    digest = hashlib.sha256(renditions[FULL_SIZE].getvalue()).hexdigest()[:32]
+    picture_name = digest + AVATAR_EXTENSIONS[AVATAR_FORMAT]
+
+    storage = get_avatar_storage()
+    for size, buffer in renditions.items():
+        storage.save(rendition_name(picture_name, size),
+                     ContentFile(buffer.getvalue()))
+
+    return picture_name
+
+
+def get_profile_pic_url(picture_name: str, size: int = FULL_SIZE) -> str:
+    """
+    Return the public URL of a rendition of a profile picture.
+    """
+    if not is_stored_picture(picture_name):
+        return static(settings.DEFAULT_PROFILE_PICTURE_STATIC)
+
+    return get_avatar_storage().url(rendition_name(picture_name, size))
+
+
+def delete_profile_pic(picture_name: str) -> None:
+    """
+    Delete every rendition of a stored profile picture.
+    """
+    if not is_stored_picture(picture_name):
+        return
+
+    storage = get_avatar_storage()
+    for size in AVATAR_SIZES:
+        storage.delete(rendition_name(picture_name, size))
@@ -0,0 +1,81 @@
+import mimetypes
+from io import BytesIO
+from urllib.parse import quote, urljoin
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import Storage
+from django.utils.deconstruct import deconstructible
+
+from .client import s3_client
+
+
+@deconstructible
+class S3Storage(Storage):
+    """
+    Storage for publicly readable objects in the S3 bucket.
+
+    Files are served straight from their public URL, without presigning, so
+    the objects under `location` must be readable by everyone (e.g. through
+    a bucket policy). Files are expected to be content-addressed: a name is
+    never reused for different content, so saving over an existing file is
+    allowed and files can be cached forever.
+
+    params:
+        - location: The prefix of the objects in the bucket.
+        - base_url: The URL the objects are served from. Defaults to the
+          public URL of the bucket; set it to serve through a CDN.
+        - cache_control: The Cache-Control header stored with each object.
+    """
+
+    def __init__(self, location: str = '', base_url: str | None = None,
+                 cache_control: str = 'public, max-age=31536000, immutable'):
+        self.location = location.strip('/')
+        self.bucket_name = settings.AWS_STORAGE_BUCKET_NAME
+        self.base_url = base_url or \
+            f'https://{self.bucket_name}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/'
+        self.cache_control = cache_control
+
+        if not self.base_url.endswith('/'):
+            self.base_url += '/'
+
+    def _key(self, name: str) -> str:
+        return f'{self.location}/{name}' if self.location else name
+
+    def _save(self, name: str, content: File) -> str:
+        content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+
+        content.seek(0)
+        s3_client.upload_fileobj(content, self.bucket_name, self._key(name), ExtraArgs={
+            'ContentType': content_type,
+            'CacheControl': self.cache_control,
+        })
+
+        return name
+
+    def _open(self, name: str, mode: str = 'rb') -> File:
+        buffer = BytesIO()
+        s3_client.download_fileobj(self.bucket_name, self._key(name), buffer)
+        buffer.seek(0)
+
+        return File(buffer, name=name)
+
+    def get_available_name(self, name: str, max_length: int | None = None) -> str:
+        # content-addressed names are overwritten with the same content.
+        return name
+
+    def delete(self, name: str) -> None:
+        s3_client.delete_object(Bucket=self.bucket_name, Key=self._key(name))
+
+    def exists(self, name: str) -> bool:
+        try:
+            s3_client.head_object(Bucket=self.bucket_name, Key=self._key(name))
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey'):
+                return False
+            raise
+
+    def url(self, name: str) -> str:
+        return urljoin(self.base_url, quote(self._key(name)))
@@ -0,0 +1,47 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from django.conf import settings
+from django.db import connections
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Return the worker pool of the current process, creating it on first use.
+
+    The pool is created lazily so that it is started in each (forked)
+    server worker rather than in the parent process.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.BACKGROUND_WORKERS,
+                                           thread_name_prefix='background')
+        return _executor
+
+
+def run_in_background(func: Callable, *args, **kwargs) -> Future:
+    """
+    Queue `func(*args, **kwargs)` to run in the worker pool of the current process.
+
+    Jobs are kept in memory: queued jobs are lost if the process exits, so
+    they must leave the database in a state the user can recover from.
+    """
+    return get_executor().submit(_run_job, func, *args, **kwargs)
+
+
+def _run_job(func: Callable, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        logging.exception('Background job %s failed', func.__name__)
+        raise
+    finally:
+        # database connections are per thread; don't leave them open in idle workers.
+        connections.close_all()
@@ -1,28 +1,68 @@
 from io import BytesIO
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, UnidentifiedImageError, features
 
+# Sizes (in pixels) of the square renditions rendered for each profile picture.
+AVATAR_SIZES = (32, 64, 300)
 
-def process_profile_pic(uploaded_file) -> BytesIO:
+# WebP is much smaller than PNG for photos, but Pillow may be built without it.
+AVATAR_FORMAT = 'WEBP' if features.check('webp') else 'PNG'
 
-    image = Image.open(uploaded_file)
 
-    # Convert to RGBA to handle transparency
-    image = image.convert("RGBA")
+def is_valid_image(uploaded_file) -> bool:
+    """
+    Check that the file is an image Pillow can read, without decoding it.
+    """
+    try:
+        with Image.open(uploaded_file) as image:
+            image.verify()
+        return True
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError):
+        return False
+    finally:
+        uploaded_file.seek(0)
 
-    # Resize and compress
-    image.thumbnail((300, 300))
 
-    # Create circular mask
-    mask = Image.new("L", (300, 300), 0)
-    mask_draw = Image.new("L", (300, 300), 255)
-    mask.paste(mask_draw, (0, 0), mask_draw)
+def render_avatars(uploaded_file, sizes: tuple[int, ...] = AVATAR_SIZES,
+                   image_format: str = AVATAR_FORMAT) -> dict[int, BytesIO]:
+    """
+    Render the square renditions of a profile picture from a single decode.
 
-    # Apply mask
-    rounded = ImageOps.fit(image, (300, 300), centering=(0.5, 0.5))
-    rounded.putalpha(mask)
+    JPEGs are downscaled while they are decoded (`Image.draft`), so a large
+    photo is never held in memory at full resolution. The image is then
+    cropped to a square of the largest size and the smaller renditions are
+    resized from that square.
 
-    buffer = BytesIO()
-    rounded.save(buffer, format="PNG", quality=85)
-    buffer.seek(0)
+    params:
+        - uploaded_file: The uploaded image.
+        - sizes: The sizes of the renditions.
+        - image_format: The format the renditions are encoded in.
+        - return: A dict mapping each size to its encoded rendition.
+    """
+    largest = max(sizes)
 
-    return buffer
+    with Image.open(uploaded_file) as image:
+        # only JPEGs support draft mode; this is a no-op for other formats.
+        # The decoder picks the largest downscale that keeps both sides >= largest.
+        image.draft('RGB', (largest, largest))
+
+        square = ImageOps.fit(image, (largest, largest),
+                              method=Image.Resampling.LANCZOS, centering=(0.5, 0.5))
+
+    square = square.convert('RGBA')
+
+    renditions = {}
+
+    for size in sorted(sizes, reverse=True):
+        rendition = square if size == largest else square.resize(
+            (size, size), Image.Resampling.LANCZOS)
+
+        buffer = BytesIO()
+        if image_format == 'WEBP':
+            rendition.save(buffer, format='WEBP', quality=85, method=4)
+        else:
+            rendition.save(buffer, format='PNG', optimize=True)
+        buffer.seek(0)
+
+        renditions[size] = buffer
+
+    return renditions